@@ -0,0 +1 @@
+"""Performance benchmarks for the runtime hot paths (not part of the test suite)."""
@@ -0,0 +1,81 @@
+"""Auditing by rescanning the store vs by reading the change feed.
+
+Builds a history of finished jobs, then runs `--rounds` rounds of new work
+(`--delta` jobs each). After every round an auditor looks at what changed:
+either by rescanning every execution (today's only option) or by reading
+the new changes from a feed cursor into `ChangeAudit`. Also reports the
+cost of producing the feed on the worker path.
+
+    python -m benchmarks.bench_change_feed --history 200000 --delta 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections import Counter
+
+from harness.audit import ChangeAudit
+from runtime.change_feed import ChangeFeed
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _drain(store: Store, queue: Queue, jobs: int) -> None:
+    queue.submit_jobs(payloads=({} for _ in range(jobs)))
+    for lease in queue.lease_many(worker_id="W", max_jobs=jobs):
+        store.mark_started(lease.exec_id)
+        store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+        store.mark_finished(lease.exec_id)
+
+
+def measure(*, history: int, delta: int, rounds: int) -> dict[str, float]:
+    clock = Clock(start=0.0)
+    feed = ChangeFeed(capacity=4 * (history + delta * rounds) + 1)
+    store = Store.in_memory(clock=clock, change_feed=feed)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    _drain(store, queue, history)
+    cursor = feed.subscribe(offset=feed.next_offset)
+    audit = ChangeAudit()
+    rescan = deltas = 0.0
+    for _ in range(rounds):
+        _drain(store, queue, delta)
+
+        started = time.perf_counter()
+        Counter(record.status for record in store.executions.values())
+        rescan += time.perf_counter() - started
+
+        started = time.perf_counter()
+        for batch in iter(lambda: cursor.read(limit=4096), []):
+            audit.consume(batch)
+        deltas += time.perf_counter() - started
+    assert not audit.violations and audit.counts["DONE"] == delta * rounds
+    return {"rescan": rescan / rounds, "feed": deltas / rounds}
+
+
+def measure_worker_path(*, jobs: int, feed: bool) -> float:
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock, change_feed=ChangeFeed() if feed else None)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    started = time.perf_counter()
+    _drain(store, queue, jobs)
+    return jobs / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=int, default=200_000)
+    parser.add_argument("--delta", type=int, default=1_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    audit = measure(history=args.history, delta=args.delta, rounds=args.rounds)
+    print(f"audit per round: rescan {audit['rescan'] * 1e3:,.2f} ms, feed {audit['feed'] * 1e3:,.2f} ms")
+    bare = measure_worker_path(jobs=args.history, feed=False)
+    fed = measure_worker_path(jobs=args.history, feed=True)
+    print(f"worker path: {bare:,.0f} jobs/s without a feed, {fed:,.0f} jobs/s with one")
+
+
+if __name__ == "__main__":
+    main()
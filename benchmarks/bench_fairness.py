@@ -0,0 +1,91 @@
+"""Tail-latency isolation between tenants: FIFO versus fair leasing.
+
+One noisy tenant floods the queue, then several quiet tenants submit a
+trickle of jobs while one worker leases and finishes a job per tick. Queueing
+delay is measured in ticks from submit to lease. Under FIFO the quiet tenants
+wait behind the whole flood; under `tenant_weights` their p99 stays near their
+own arrival rate. Also reports the mean cost of a fair lease as tenants grow.
+
+    python -m benchmarks.bench_fairness --flood 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def measure_queueing_delay(*, fair: bool, flood: int, quiet_tenants: int, quiet_jobs: int) -> dict[str, list[float]]:
+    """Return submit-to-lease delays (ticks) for the noisy tenant and for all quiet tenants."""
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock, tenant_weights={} if fair else None)
+    queue = Queue(store=store, clock=clock, lease_seconds=3_600)
+    submitted_at: dict[str, float] = {}
+    for job_id in queue.submit_jobs(payloads=({"tenant": "noisy"} for _ in range(flood))):
+        submitted_at[job_id] = 0.0
+
+    delays: dict[str, list[float]] = {"noisy": [], "quiet": []}
+    ticks = flood + quiet_tenants * quiet_jobs
+    spacing = max(1, flood // quiet_jobs)
+    for tick in range(ticks):
+        if tick % spacing == 0 and tick // spacing < quiet_jobs:
+            for tenant in range(quiet_tenants):
+                submitted_at[queue.submit_job(payload={"tenant": f"quiet-{tenant}"})] = clock.now()
+        lease = queue.lease(worker_id="W")
+        if lease is not None:
+            store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+            store.mark_finished(lease.exec_id)
+            tenant = store.jobs[lease.job_id]["payload"]["tenant"]
+            delays["noisy" if tenant == "noisy" else "quiet"].append(clock.now() - submitted_at[lease.job_id])
+        clock.advance(1.0)
+    return delays
+
+
+def measure_fair_lease_cost(*, tenants: int, jobs_per_tenant: int = 20) -> float:
+    """Mean seconds per fair `Queue.lease` with `tenants` active tenants."""
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock, tenant_weights={})
+    queue = Queue(store=store, clock=clock, lease_seconds=3_600)
+    queue.submit_jobs(payloads=({"tenant": f"t{n % tenants}"} for n in range(tenants * jobs_per_tenant)))
+    probes = tenants * jobs_per_tenant // 2
+    started = time.perf_counter()
+    for _ in range(probes):
+        queue.lease(worker_id="W")
+    return (time.perf_counter() - started) / probes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flood", type=int, default=100_000)
+    parser.add_argument("--quiet-tenants", type=int, default=4)
+    parser.add_argument("--quiet-jobs", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'mode':>6} {'tenant':>7} {'p50':>10} {'p99':>10} {'max':>10}")
+    for fair in (False, True):
+        delays = measure_queueing_delay(
+            fair=fair, flood=args.flood, quiet_tenants=args.quiet_tenants, quiet_jobs=args.quiet_jobs
+        )
+        for tenant, values in delays.items():
+            mode = "fair" if fair else "fifo"
+            print(
+                f"{mode:>6} {tenant:>7} {_percentile(values, 50):>10.0f}"
+                f" {_percentile(values, 99):>10.0f} {max(values):>10.0f}"
+            )
+
+    print(f"\n{'tenants':>10} {'us/lease':>10}")
+    for tenants in (10, 1_000, 100_000):
+        print(f"{tenants:>10} {measure_fair_lease_cost(tenants=tenants) * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Durable-store transitions per second against group-commit batch size.
+
+Each job costs four transitions (lease, start, commit, finish). Batch size 0
+is the default one-transaction-per-transition mode.
+
+    python -m benchmarks.bench_group_commit --jobs 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from faults.injectors import Faults
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.sqlite_store import GroupCommit
+from runtime.store import Store
+from runtime.worker import Worker
+
+TRANSITIONS_PER_JOB = 4
+
+
+def measure_transitions_per_second(*, path: str, jobs: int, batch_size: int) -> float:
+    clock = Clock(start=0.0)
+    group_commit = GroupCommit(max_records=batch_size * TRANSITIONS_PER_JOB) if batch_size else None
+    store = Store.sqlite(path, clock=clock, group_commit=group_commit)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    worker = Worker(
+        worker_id="W",
+        store=store,
+        queue=queue,
+        clock=clock,
+        faults=Faults(enforce_idempotent_commit=True),
+    )
+    queue.submit_jobs(payloads=({"n": n} for n in range(jobs)))
+    store.flush()
+
+    started = time.perf_counter()
+    while leases := queue.lease_many(worker_id="W", max_jobs=max(batch_size, 1)):
+        for lease in leases:
+            worker.start(lease)
+        worker.finish_many(leases)
+    store.flush()
+    elapsed = time.perf_counter() - started
+    store.close()
+    return jobs * TRANSITIONS_PER_JOB / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[0, 1, 8, 64, 512])
+    args = parser.parse_args()
+
+    print(f"{'batch':>6} {'transitions/s':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for batch_size in args.batch_sizes:
+            path = os.path.join(tmp, f"batch-{batch_size}.db")
+            rate = measure_transitions_per_second(path=path, jobs=args.jobs, batch_size=batch_size)
+            print(f"{batch_size:>6} {rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Job ingest throughput: per-job `submit_job` versus bulk `submit_jobs`.
+
+    python -m benchmarks.bench_ingest --jobs 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _queue() -> Queue:
+    clock = Clock(start=0.0)
+    return Queue(store=Store.in_memory(clock=clock), clock=clock, lease_seconds=30)
+
+
+def measure_single_submit(*, jobs: int) -> float:
+    """Return jobs per second through repeated `Queue.submit_job`."""
+    queue = _queue()
+    started = time.perf_counter()
+    for n in range(jobs):
+        queue.submit_job(payload={"n": n})
+    return jobs / (time.perf_counter() - started)
+
+
+def measure_bulk_submit(*, jobs: int) -> float:
+    """Return jobs per second through one `Queue.submit_jobs` over a generator."""
+    queue = _queue()
+    started = time.perf_counter()
+    queue.submit_jobs(payloads=({"n": n} for n in range(jobs)))
+    return jobs / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=500_000)
+    args = parser.parse_args()
+
+    single = measure_single_submit(jobs=args.jobs)
+    bulk = measure_bulk_submit(jobs=args.jobs)
+    print(f"submit_job   {single:>12,.0f} jobs/s")
+    print(f"submit_jobs  {bulk:>12,.0f} jobs/s  ({bulk / single:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
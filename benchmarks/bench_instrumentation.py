@@ -0,0 +1,75 @@
+"""Cost of the opt-in metrics, disabled and enabled.
+
+Drives jobs through lease, start, commit and finish three ways:
+
+- `bare`: the uninstrumented internals (`Queue._lease_many`,
+  `Worker._commit_and_finish`), i.e. the code path as it was before the
+  hooks existed;
+- `disabled`: the public API with `metrics=None` (one `is None` check per call);
+- `enabled`: `Metrics` on the queue and worker plus an `InstrumentedStore`.
+
+    python -m benchmarks.bench_instrumentation --jobs 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+
+from faults.injectors import Faults
+from runtime.clock import Clock
+from runtime.instrumentation import InstrumentedStore, Metrics
+from runtime.queue import Queue
+from runtime.store import Store
+from runtime.worker import Worker
+
+
+def measure_jobs_per_second(*, mode: str, jobs: int) -> float:
+    clock = Clock(start=0.0)
+    metrics = Metrics() if mode == "enabled" else None
+    store = Store.in_memory(clock=clock)
+    if metrics is not None:
+        store = InstrumentedStore(store, metrics=metrics)
+    queue = Queue(store=store, clock=clock, lease_seconds=30, metrics=metrics)
+    worker = Worker(
+        worker_id="W",
+        store=store,
+        queue=queue,
+        clock=clock,
+        faults=Faults(enforce_idempotent_commit=True),
+        metrics=metrics,
+    )
+    queue.submit_jobs(payloads=({} for _ in range(jobs)))
+    if mode == "bare":
+        commit_and_finish = worker._commit_and_finish
+        lease_many, finish = queue._lease_many, lambda lease: commit_and_finish([lease])
+    else:
+        lease_many, finish = queue.lease_many, worker.finish
+
+    gc.collect()
+    started = time.perf_counter()
+    for _ in range(jobs):
+        (lease,) = lease_many(worker_id="W", max_jobs=1)
+        worker.start(lease)
+        finish(lease)
+    return jobs / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rates = {
+        mode: max(measure_jobs_per_second(mode=mode, jobs=args.jobs) for _ in range(args.repeat))
+        for mode in ("bare", "disabled", "enabled")
+    }
+    print(f"{'mode':<10} {'jobs/s':>12} {'overhead':>10}")
+    for mode, rate in rates.items():
+        print(f"{mode:<10} {rate:>12,.0f} {(rates['bare'] / rate - 1) * 100:>+9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Lease latency versus history size.
+
+Each run submits N jobs, drives all but the last `probe` jobs to DONE, then
+times `Queue.lease` over the remaining jobs. With the ready-set index the
+per-lease latency should stay flat as N grows from 10^3 to 10^6.
+
+    python -m benchmarks.bench_lease --max-exp 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def measure_lease_latency(*, jobs: int, probe: int = 1_000) -> float:
+    """Return mean seconds per `Queue.lease` with `jobs - probe` finished jobs ahead."""
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    for _ in range(jobs):
+        queue.submit_job(payload={})
+
+    for _ in range(jobs - probe):
+        lease = queue.lease(worker_id="warmup")
+        store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+        store.mark_finished(lease.exec_id)
+
+    started = time.perf_counter()
+    for _ in range(probe):
+        queue.lease(worker_id="probe")
+    return (time.perf_counter() - started) / probe
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-exp", type=int, default=3)
+    parser.add_argument("--max-exp", type=int, default=6)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>10} {'us/lease':>10}")
+    for exp in range(args.min_exp, args.max_exp + 1):
+        jobs = 10**exp
+        latency = measure_lease_latency(jobs=jobs, probe=min(1_000, jobs))
+        print(f"{jobs:>10} {latency * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Resident memory per million jobs: dict/dataclass `Store` versus `CompactStore`.
+
+Every job is leased, committed and finished once, so the figure includes one
+execution record per job (the shared effect log is excluded).
+
+    python -m benchmarks.bench_memory --jobs 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+from harness.fixtures import make_store
+from runtime.clock import Clock
+from runtime.effect_log import EffectLog
+from runtime.queue import Queue
+
+
+def measure_bytes_per_million_jobs(*, backend: str, jobs: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    clock = Clock(start=0.0)
+    store = make_store(backend=backend, clock=clock)
+    # Keep the effect log out of the comparison: both layouts share EffectLog.
+    store.effects = EffectLog(max_in_memory=0)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    empty_payload: dict = {}
+    queue.submit_jobs(payloads=(empty_payload for _ in range(jobs)))
+    while leases := queue.lease_many(worker_id="W", max_jobs=1_000):
+        for lease in leases:
+            store.mark_started(lease.exec_id)
+            store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+            store.mark_finished(lease.exec_id)
+    # Steady state: let the leases expire so lazily pruned index entries are dropped.
+    clock.advance(31.0)
+    queue.lease(worker_id="W")
+    store.list_expired_exec_ids(now=clock.now())
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current * 1_000_000 / jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for backend in ("memory", "compact"):
+        per_million = measure_bytes_per_million_jobs(backend=backend, jobs=args.jobs)
+        print(f"{backend:<8} {per_million / 2**20:>10,.1f} MiB per 1M jobs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Queued-job memory and throughput with payloads as dicts vs in a `PayloadArena`.
+
+Each payload is a multi-kilobyte dict of small records (an order with line
+items). Reports Python-heap bytes per queued job (tracemalloc; arena bytes
+are counted separately, they live outside the heap), submit rate, and the
+rate of leasing, reading the payload as a handler would, and finishing.
+
+    python -m benchmarks.bench_payload_arena --jobs 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+
+from runtime.clock import Clock
+from runtime.payload_arena import PayloadArena
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def make_payload(n: int, *, items: int) -> dict:
+    return {
+        "order_id": f"order-{n}",
+        "customer": {"id": n % 997, "tier": "gold"},
+        "items": [{"sku": f"sku-{n}-{i}", "qty": i % 5 + 1, "price_cents": 1_000 + i} for i in range(items)],
+    }
+
+
+def _store(mode: str, directory: str | None) -> Store:
+    clock = Clock(start=0.0)
+    arena = None
+    if mode == "arena":
+        arena = PayloadArena()
+    elif mode == "arena-file":
+        arena = PayloadArena(directory=directory)
+    return Store.in_memory(clock=clock, payload_arena=arena)
+
+
+def measure(*, mode: str, jobs: int, items: int, directory: str | None) -> dict[str, float]:
+    payloads = [make_payload(n, items=items) for n in range(jobs)]
+    store = _store(mode, directory)
+    queue = Queue(store=store, clock=store.clock, lease_seconds=30)
+
+    gc.collect()
+    started = time.perf_counter()
+    queue.submit_jobs(payloads=payloads)
+    submit_rate = jobs / (time.perf_counter() - started)
+    del payloads  # only the store keeps what it chose to keep
+
+    gc.collect()
+    started = time.perf_counter()
+    for lease in queue.lease_many(worker_id="W", max_jobs=jobs):
+        store.mark_started(lease.exec_id)
+        sum(item["qty"] for item in store.jobs[lease.job_id]["payload"]["items"])
+        store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+        store.mark_finished(lease.exec_id)
+    run_rate = jobs / (time.perf_counter() - started)
+    return {"submit": submit_rate, "run": run_rate}
+
+
+def measure_queued_heap(*, mode: str, jobs: int, items: int, directory: str | None) -> tuple[float, float]:
+    """(Python-heap bytes, arena bytes) per queued job."""
+    store = _store(mode, directory)
+    queue = Queue(store=store, clock=store.clock, lease_seconds=30)
+    gc.collect()
+    tracemalloc.start()
+    queue.submit_jobs(payloads=(make_payload(n, items=items) for n in range(jobs)))
+    gc.collect()
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    arena_bytes = store.payload_arena.nbytes if store.payload_arena is not None else 0
+    return heap / jobs, arena_bytes / jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--items", type=int, default=40, help="line items per payload (~100 bytes each)")
+    args = parser.parse_args()
+
+    print(f"{'mode':<11} {'heap B/job':>11} {'arena B/job':>12} {'submit/s':>10} {'run/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("dict", "arena", "arena-file"):
+            heap, arena = measure_queued_heap(
+                mode=mode, jobs=args.jobs, items=args.items, directory=f"{tmp}/{mode}-heap"
+            )
+            rates = measure(mode=mode, jobs=args.jobs, items=args.items, directory=f"{tmp}/{mode}-run")
+            print(f"{mode:<11} {heap:>11,.0f} {arena:>12,.0f} {rates['submit']:>10,.0f} {rates['run']:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""CPU-bound throughput of the process pool against one shared SQLite store.
+
+    python -m benchmarks.bench_process_pool --jobs 400 --processes 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from runtime.clock import Clock
+from runtime.process_pool import run_process_pool
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def cpu_handler(payload: dict) -> None:
+    sum(i * i for i in range(payload["work"]))
+
+
+def measure_jobs_per_second(*, path: str, jobs: int, processes: int, work: int) -> float:
+    store = Store.sqlite(path, clock=Clock(start=0.0))
+    Queue(store=store, clock=store.clock, lease_seconds=300).submit_jobs(
+        payloads=({"work": work} for _ in range(jobs))
+    )
+    store.close()
+
+    started = time.perf_counter()
+    stats = run_process_pool(path=path, handler=cpu_handler, processes=processes, lease_seconds=300)
+    elapsed = time.perf_counter() - started
+    assert sum(s.committed for s in stats) == jobs
+    return jobs / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=400)
+    parser.add_argument("--work", type=int, default=200_000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    print(f"{'processes':>9} {'jobs/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for processes in args.processes:
+            path = os.path.join(tmp, f"procs-{processes}.db")
+            rate = measure_jobs_per_second(path=path, jobs=args.jobs, processes=processes, work=args.work)
+            print(f"{processes:>9} {rate:>10,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Restart time of the WAL-backed in-memory store.
+
+Writes `--records` WAL records (each job is submitted, leased, started,
+committed and finished: five records), then measures how long
+`Store.wal(directory)` takes to come back, first replaying the whole log and
+then from a snapshot plus a short tail. Recovery includes the
+`reconcile_after_crash` pass that settles in-flight work.
+
+    python -m benchmarks.bench_recovery --records 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from policies.reconcile import reconcile_after_crash
+from runtime.clock import Clock
+from runtime.store import Store
+
+_RECORDS_PER_JOB = 5
+
+
+def write_log(*, directory: str, records: int, snapshot_every: int | None) -> float:
+    """Fill `directory` with `records` transitions; returns seconds spent writing."""
+    clock = Clock(start=0.0)
+    store = Store.wal(directory, clock=clock, snapshot_every=snapshot_every)
+    store.sync = False
+    started = time.perf_counter()
+    for _ in range(records // _RECORDS_PER_JOB):
+        job_id = store.create_job(payload={})
+        (exec_id,) = store.create_leases(job_ids=[job_id], worker_id="W", lease_seconds=30)
+        store.mark_started(exec_id)
+        store.apply_effect(exec_id=exec_id, enforce_idempotent_commit=True)
+        store.mark_finished(exec_id)
+        clock.advance(0.001)
+    store.close()
+    return time.perf_counter() - started
+
+
+def measure_recovery(*, directory: str) -> tuple[float, int]:
+    """Seconds to reopen and reconcile the store in `directory`, and the jobs recovered."""
+    started = time.perf_counter()
+    clock = Clock(start=1e9)
+    store = Store.wal(directory, clock=clock, snapshot_every=None)
+    reconcile_after_crash(store=store, clock=clock)
+    elapsed = time.perf_counter() - started
+    jobs = len(store.jobs)
+    store.close()
+    return elapsed, jobs
+
+
+def _size_mb(directory: str) -> float:
+    return sum(entry.stat().st_size for entry in os.scandir(directory)) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--tail", type=int, default=10_000, help="records after the last snapshot")
+    args = parser.parse_args()
+
+    print(f"{'mode':>16} {'records':>12} {'disk MB':>10} {'write s':>10} {'recover s':>10} {'us/record':>10}")
+    modes = (("wal replay", None), ("snapshot+tail", args.records - args.tail))
+    for mode, snapshot_every in modes:
+        with tempfile.TemporaryDirectory() as directory:
+            written = write_log(directory=directory, records=args.records, snapshot_every=snapshot_every)
+            recovered, jobs = measure_recovery(directory=directory)
+            assert jobs == args.records // _RECORDS_PER_JOB
+            print(
+                f"{mode:>16} {args.records:>12} {_size_mb(directory):>10.1f} {written:>10.2f}"
+                f" {recovered:>10.2f} {recovered / args.records * 1e6:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
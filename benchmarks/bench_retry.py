@@ -0,0 +1,59 @@
+"""Retry scheduling cost versus the number of pending retries.
+
+Each run leases N jobs, fails all of them (N delayed retries in the ready-set
+heap), then times `Queue.fail` and the `Queue.lease` that picks each retry up
+once its backoff is due. Both are heap operations, so per-call cost should grow
+at most logarithmically from 10^4 to 10^6 pending retries.
+
+    python -m benchmarks.bench_retry --max-exp 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from policies.budget import RetryBudget
+from policies.retry import RetryPolicy
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def measure_retry_costs(*, jobs: int) -> tuple[float, float]:
+    """Return mean seconds per `Queue.fail` and per retry `Queue.lease`."""
+    clock = Clock(start=0.0)
+    policy = RetryPolicy(budget=RetryBudget(max_attempts=5), base_delay_seconds=10.0)
+    store = Store.in_memory(clock=clock, retry=policy)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    queue.submit_jobs(payloads=({} for _ in range(jobs)))
+    leases = queue.lease_many(worker_id="W", max_jobs=jobs)
+
+    started = time.perf_counter()
+    for lease in leases:
+        queue.fail(lease)
+    fail_seconds = (time.perf_counter() - started) / jobs
+
+    clock.advance(policy.max_delay_seconds)
+    started = time.perf_counter()
+    for _ in range(jobs):
+        queue.lease(worker_id="W")
+    lease_seconds = (time.perf_counter() - started) / jobs
+    return fail_seconds, lease_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-exp", type=int, default=4)
+    parser.add_argument("--max-exp", type=int, default=6)
+    args = parser.parse_args()
+
+    print(f"{'retries':>10} {'us/fail':>10} {'us/lease':>10}")
+    for exp in range(args.min_exp, args.max_exp + 1):
+        jobs = 10**exp
+        fail_seconds, lease_seconds = measure_retry_costs(jobs=jobs)
+        print(f"{jobs:>10} {fail_seconds * 1e6:>10.2f} {lease_seconds * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Process-pool throughput: one shared SQLite file vs K shard files.
+
+For each K, drains the same jobs twice with K worker processes: once all
+leasing from one database (`run_process_pool`), once each homed on its own
+shard file (`run_sharded_process_pool`). Jobs are short so the store, not
+the handler, is the bottleneck. Scaling with K needs at least K free cores.
+
+    python -m benchmarks.bench_sharding --jobs 4000 --shards 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from runtime.clock import Clock
+from runtime.process_pool import run_process_pool, run_sharded_process_pool
+from runtime.queue import Queue
+from runtime.sharded_queue import ShardedQueue
+from runtime.store import Store
+
+
+def tiny_handler(payload: dict) -> None:
+    sum(range(payload["work"]))
+
+
+def measure_shared(*, directory: str, jobs: int, processes: int, work: int) -> float:
+    path = os.path.join(directory, f"shared-{processes}.db")
+    store = Store.sqlite(path, clock=Clock(start=0.0))
+    Queue(store=store, clock=store.clock, lease_seconds=300).submit_jobs(
+        payloads=({"work": work} for _ in range(jobs))
+    )
+    store.close()
+
+    started = time.perf_counter()
+    stats = run_process_pool(path=path, handler=tiny_handler, processes=processes, lease_seconds=300)
+    elapsed = time.perf_counter() - started
+    assert sum(s.committed for s in stats) == jobs
+    return jobs / elapsed
+
+
+def measure_sharded(*, directory: str, jobs: int, shards: int, work: int) -> float:
+    paths = [os.path.join(directory, f"sharded-{shards}-{n}.db") for n in range(shards)]
+    stores = [Store.sqlite(path, clock=Clock(start=0.0)) for path in paths]
+    ShardedQueue(stores=stores, clock=stores[0].clock, lease_seconds=300).submit_jobs(
+        payloads=({"work": work} for _ in range(jobs))
+    )
+    for store in stores:
+        store.close()
+
+    started = time.perf_counter()
+    stats = run_sharded_process_pool(paths=paths, handler=tiny_handler, processes=shards, lease_seconds=300)
+    elapsed = time.perf_counter() - started
+    assert sum(s.committed for s in stats) == jobs
+    return jobs / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=4_000)
+    parser.add_argument("--work", type=int, default=100)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    print(f"cores: {os.cpu_count()}")
+    print(f"{'K':>3} {'shared jobs/s':>14} {'sharded jobs/s':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for shards in args.shards:
+            shared = measure_shared(directory=tmp, jobs=args.jobs, processes=shards, work=args.work)
+            sharded = measure_sharded(directory=tmp, jobs=args.jobs, shards=shards, work=args.work)
+            print(f"{shards:>3} {shared:>14,.0f} {sharded:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
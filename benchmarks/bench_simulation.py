@@ -0,0 +1,53 @@
+"""Scale runs of the discrete-event simulator (`harness.simulator`).
+
+Runs one seeded, faulty deployment per worker count and prints throughput
+(virtual and wall), duplicate ratio, submit-to-lease latency and any
+invariant violations found.
+
+    python -m benchmarks.bench_simulation --jobs 1000000 --workers 100 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from harness.simulator import SimulationConfig, simulate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", default="memory")
+    parser.add_argument("--slow-rate", type=float, default=0.01)
+    parser.add_argument("--crash-rate", type=float, default=0.01, help="each of before/after commit")
+    parser.add_argument("--unguarded", action="store_true", help="disable the commit boundary")
+    args = parser.parse_args()
+
+    print(
+        f"{'workers':>8} {'jobs/vs':>10} {'jobs/s':>10} {'dup':>7} {'p50':>8} {'p99':>8}"
+        f" {'wall s':>8}  violations"
+    )
+    for workers in args.workers:
+        report = simulate(
+            SimulationConfig(
+                jobs=args.jobs,
+                workers=workers,
+                seed=args.seed,
+                backend=args.backend,
+                slow_rate=args.slow_rate,
+                crash_before_commit_rate=args.crash_rate,
+                crash_after_commit_rate=args.crash_rate,
+                enforce_idempotent_commit=not args.unguarded,
+            )
+        )
+        print(
+            f"{workers:>8} {report.throughput:>10.1f} {report.jobs / report.wall_seconds:>10.0f}"
+            f" {report.duplicate_ratio:>7.4f} {report.lease_latency_p50:>8.1f} {report.lease_latency_p99:>8.1f}"
+            f" {report.wall_seconds:>8.2f}  {dict(report.violations) or 'none'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Lease and commit throughput of `ConcurrentStore` as the thread count grows.
+
+Leasing: T threads drain one backlog with `Queue.lease`. Committing: T
+threads run `commit_effect_idempotent` over pre-leased executions, two
+attempts per job, so half the calls lose the compare-and-set. The `1*`
+row is the unlocked `Store` on one thread, i.e. what the locks cost.
+On CPython with the GIL, extra threads add no parallelism; the numbers
+show that locking and contention stay cheap, not a speedup.
+
+    python -m benchmarks.bench_threads --jobs 100000 --threads 1 4 16 64 256 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from policies.commit import commit_effect_idempotent
+from runtime.clock import Clock
+from runtime.queue import Lease, Queue
+from runtime.store import Store
+
+
+def _in_threads(threads: int, target) -> float:
+    workers = [threading.Thread(target=target, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def _store(*, concurrent: bool) -> Store:
+    clock = Clock(start=0.0)
+    return Store.concurrent(clock=clock) if concurrent else Store.in_memory(clock=clock)
+
+
+def measure_leases_per_second(*, jobs: int, threads: int, concurrent: bool = True) -> float:
+    store = _store(concurrent=concurrent)
+    queue = Queue(store=store, clock=store.clock, lease_seconds=300)
+    queue.submit_jobs(payloads=({} for _ in range(jobs)))
+
+    def drain(n: int) -> None:
+        worker_id = f"W{n}"
+        while queue.lease(worker_id=worker_id) is not None:
+            pass
+
+    elapsed = _in_threads(threads, drain)
+    assert store.count_exec_ids_by_status("LEASED") == jobs
+    return jobs / elapsed
+
+
+def measure_commits_per_second(*, jobs: int, threads: int, concurrent: bool = True) -> float:
+    store = _store(concurrent=concurrent)
+    queue = Queue(store=store, clock=store.clock, lease_seconds=1)
+    queue.submit_jobs(payloads=({} for _ in range(jobs)))
+    leases: list[Lease] = []
+    for _ in range(2):
+        leases.extend(queue.lease_many(worker_id="W", max_jobs=jobs))
+        store.clock.advance(1.0)
+
+    def commit(n: int) -> None:
+        for lease in leases[n::threads]:
+            commit_effect_idempotent(store=store, exec_id=lease.exec_id)
+
+    elapsed = _in_threads(threads, commit)
+    assert store.count_exec_ids_by_status("COMMITTED") == jobs
+    return len(leases) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16, 64, 256, 1024])
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'leases/s':>12} {'commits/s':>12}")
+    rows = [("1*", 1, False)] + [(str(threads), threads, True) for threads in args.threads]
+    for label, threads, concurrent in rows:
+        leases = measure_leases_per_second(jobs=args.jobs, threads=threads, concurrent=concurrent)
+        commits = measure_commits_per_second(jobs=args.jobs, threads=threads, concurrent=concurrent)
+        print(f"{label:>8} {leases:>12,.0f} {commits:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Jobs per second for an I/O-bound handler as WorkerPool concurrency grows.
+
+The handler awaits `--io-ms` of simulated downstream latency per job.
+
+    python -m benchmarks.bench_worker_pool --jobs 2000 --io-ms 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from runtime.async_worker import WorkerPool
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def measure_jobs_per_second(*, jobs: int, concurrency: int, io_seconds: float) -> float:
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    queue.submit_jobs(payloads=({"n": n} for n in range(jobs)))
+
+    async def handler(payload: dict) -> None:
+        await asyncio.sleep(io_seconds)
+
+    pool = WorkerPool(
+        worker_id="bench",
+        store=store,
+        queue=queue,
+        clock=clock,
+        handler=handler,
+        concurrency=concurrency,
+        idle_sleep_seconds=0.001,
+    )
+    started = time.perf_counter()
+    stats = asyncio.run(pool.run(until_idle=True))
+    assert stats.committed == jobs
+    return jobs / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2_000)
+    parser.add_argument("--io-ms", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'concurrency':>11} {'jobs/s':>10}")
+    for concurrency in args.concurrency:
+        jobs = min(args.jobs, concurrency * 50)
+        rate = measure_jobs_per_second(jobs=jobs, concurrency=concurrency, io_seconds=args.io_ms / 1000)
+        print(f"{concurrency:>11} {rate:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Hot-path benchmark suite with a stored baseline and a regression gate.
+
+Runs every benchmark below (each reports operations per second, so higher
+is better), keeps the best of `--repeat` runs, writes the results as JSON
+and compares them with `--baseline`. Any benchmark slower than the baseline
+by more than `--threshold` percent fails the run (exit status 1). Baselines
+are machine-specific: refresh with `--update-baseline` on the machine that
+runs the comparison.
+
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --output bench-results.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from benchmarks.bench_ingest import measure_bulk_submit, measure_single_submit
+from benchmarks.bench_lease import measure_lease_latency
+from benchmarks.bench_store_backends import measure_jobs_per_second
+from policies.commit import commit_effect_idempotent
+from policies.reconcile import reconcile_after_crash
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def measure_apply_effect_contention(*, jobs: int, attempts_per_job: int = 8) -> float:
+    """Commits per second when `attempts_per_job` live attempts race to commit each job.
+
+    Only the first attempt per job commits; the rest hit the commit boundary
+    and no-op, which is the hot path under a duplicate-retry storm (FM_001).
+    """
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+    queue.submit_jobs(payloads=({} for _ in range(jobs)))
+    rounds = []
+    for _ in range(attempts_per_job):
+        rounds.append(queue.lease_many(worker_id="W", max_jobs=jobs))
+        clock.advance(1.0)
+
+    started = time.perf_counter()
+    for leases in rounds:
+        for lease in leases:
+            commit_effect_idempotent(store=store, exec_id=lease.exec_id)
+    return jobs * attempts_per_job / (time.perf_counter() - started)
+
+
+def measure_count_effects(*, jobs: int) -> float:
+    """`Store.count_effects` lookups per second over `jobs` committed jobs."""
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    job_ids = list(queue.submit_jobs(payloads=({} for _ in range(jobs))))
+    for lease in queue.lease_many(worker_id="W", max_jobs=jobs):
+        store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+
+    started = time.perf_counter()
+    for job_id in job_ids:
+        store.count_effects(job_id)
+    return jobs / (time.perf_counter() - started)
+
+
+def measure_reconcile(*, jobs: int, in_flight: int = 1_000) -> float:
+    """History records per second covered by `reconcile_after_crash`.
+
+    `jobs` finished jobs form the history; `in_flight` more were leased by a
+    worker that died, half of them after committing. Reconcile should pay for
+    the in-flight records, not the history.
+    """
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    queue.submit_jobs(payloads=({} for _ in range(jobs + in_flight)))
+    for lease in queue.lease_many(worker_id="W", max_jobs=jobs):
+        store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+        store.mark_finished(lease.exec_id)
+    for lease in queue.lease_many(worker_id="dead", max_jobs=in_flight)[::2]:
+        store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+    clock.advance(30.0)
+
+    started = time.perf_counter()
+    reconcile_after_crash(store=store, clock=clock)
+    return (jobs + in_flight) / (time.perf_counter() - started)
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    unit: str
+    run: Callable[[int], float]
+
+
+# Sizes scale with `--scale`; the defaults keep the whole suite under a minute.
+BENCHMARKS = (
+    Benchmark("queue_lease_backlog_100k", "leases/s", lambda s: 1 / measure_lease_latency(jobs=100_000 * s)),
+    Benchmark("store_create_job", "jobs/s", lambda s: measure_single_submit(jobs=200_000 * s)),
+    Benchmark("store_create_jobs_bulk", "jobs/s", lambda s: measure_bulk_submit(jobs=200_000 * s)),
+    Benchmark("apply_effect_contention", "commits/s", lambda s: measure_apply_effect_contention(jobs=20_000 * s)),
+    Benchmark("count_effects", "lookups/s", lambda s: measure_count_effects(jobs=200_000 * s)),
+    Benchmark("reconcile_after_crash_200k", "records/s", lambda s: measure_reconcile(jobs=200_000 * s)),
+    Benchmark("end_to_end_memory", "jobs/s", lambda s: measure_jobs_per_second(backend="memory", jobs=50_000 * s)),
+)
+
+
+def run_suite(*, names: list[str] | None = None, repeat: int = 3, scale: int = 1) -> dict[str, dict]:
+    """Best-of-`repeat` rate for each selected benchmark, keyed by name."""
+    results: dict[str, dict] = {}
+    for benchmark in BENCHMARKS:
+        if names and benchmark.name not in names:
+            continue
+        runs = []
+        for _ in range(repeat):
+            gc.collect()  # don't bill one run for the previous run's garbage
+            runs.append(benchmark.run(scale))
+        results[benchmark.name] = {"value": max(runs), "unit": benchmark.unit}
+    return results
+
+
+def compare(*, baseline: dict[str, dict], current: dict[str, dict], threshold_pct: float) -> list[str]:
+    """Names of benchmarks more than `threshold_pct` percent slower than `baseline`.
+
+    Benchmarks missing from either side are not compared.
+    """
+    regressed = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        change_pct = (result["value"] / baseline[name]["value"] - 1.0) * 100
+        if change_pct < -threshold_pct:
+            regressed.append(name)
+    return regressed
+
+
+def _environment() -> dict[str, str]:
+    return {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", help="baseline JSON to compare against (or to write)")
+    parser.add_argument("--output", help="write this run's results as JSON")
+    parser.add_argument("--threshold", type=float, default=25.0, help="allowed slowdown in percent")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scale", type=int, default=1, help="multiply every problem size")
+    parser.add_argument("--only", nargs="+", help="run only these benchmarks")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    args = parser.parse_args()
+
+    current = run_suite(names=args.only, repeat=args.repeat, scale=args.scale)
+    document = {"environment": _environment(), "scale": args.scale, "benchmarks": current}
+    targets = [args.output] + ([args.baseline] if args.update_baseline else [])
+    for path in filter(None, targets):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as out:
+            json.dump(document, out, indent=2, sort_keys=True)
+            out.write("\n")
+
+    baseline: dict[str, dict] = {}
+    if args.baseline and not args.update_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as stored:
+            saved = json.load(stored)
+        if saved.get("scale") == args.scale:
+            baseline = saved["benchmarks"]
+        else:
+            print(f"baseline was recorded at scale {saved.get('scale')}; not comparing", file=sys.stderr)
+
+    print(f"{'benchmark':<28} {'value':>14} {'unit':<10} {'baseline':>14} {'change':>8}")
+    for name, result in current.items():
+        line = f"{name:<28} {result['value']:>14,.0f} {result['unit']:<10}"
+        if name in baseline:
+            change_pct = (result["value"] / baseline[name]["value"] - 1.0) * 100
+            line += f" {baseline[name]['value']:>14,.0f} {change_pct:>+7.1f}%"
+        print(line)
+
+    regressed = compare(baseline=baseline, current=current, threshold_pct=args.threshold)
+    if regressed:
+        print(f"\nregressed by more than {args.threshold:g}%: {', '.join(regressed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
+import signal
 from dataclasses import dataclass
 
 from faults.injectors import Faults
+from harness.fixtures import make_store
+from policies.reconcile import reconcile_after_crash
 from runtime.clock import Clock
 from runtime.queue import Queue
 from runtime.store import Store
@@ -14,12 +19,21 @@ class ScenarioResult:
     job_id: str
     effects_count: int
     committed_exec_id: str | None
-
-
-def _run_internal(*, lease_seconds: int, work_duration_seconds: int, faults: Faults) -> ScenarioResult:
+    attempts: int = 0
+
+
+def _run_internal(
+    *,
+    lease_seconds: int,
+    work_duration_seconds: int,
+    faults: Faults,
+    backend: str = "memory",
+    path: str | None = None,
+    heartbeat_every_seconds: float | None = None,
+) -> ScenarioResult:
     """Core deterministic FM_001 executor used by explicit baseline/guarded entrypoints."""
     clock = Clock(start=0.0)
-    store = Store.in_memory(clock=clock)
+    store = make_store(backend=backend, clock=clock, path=path)
     queue = Queue(store=store, clock=clock, lease_seconds=lease_seconds)
 
     worker_a = Worker(worker_id="A", store=store, queue=queue, clock=clock, faults=faults)
@@ -32,40 +46,86 @@ def _run_internal(*, lease_seconds: int, work_duration_seconds: int, faults: Fau
     assert exec_a is not None
     worker_a.start(exec_a)
 
-    # Step 2: advance deterministic clock to expire lease.
-    clock.advance(float(work_duration_seconds))
+    # Step 2: advance deterministic clock to expire lease (unless A heartbeats in time).
+    if heartbeat_every_seconds is None:
+        clock.advance(float(work_duration_seconds))
+    else:
+        elapsed = 0.0
+        while elapsed < work_duration_seconds:
+            step = min(heartbeat_every_seconds, work_duration_seconds - elapsed)
+            clock.advance(step)
+            elapsed += step
+            worker_a.heartbeat(exec_a)
+            queue.flush_heartbeats()
 
     # Step 3: B retries after timeout.
     exec_b = queue.lease(worker_id="B")
-    assert exec_b is not None
+    assert exec_b is not None or heartbeat_every_seconds is not None
 
     # Step 4: both workers finish and attempt logical effect.
     worker_a.finish(exec_a)
-    worker_b.start(exec_b)
-    worker_b.finish(exec_b)
+    if exec_b is not None:
+        worker_b.start(exec_b)
+        worker_b.finish(exec_b)
 
     return ScenarioResult(
         job_id=job_id,
         effects_count=store.count_effects(job_id),
         committed_exec_id=store.get_committed_exec_id(job_id),
+        attempts=len(store.execs_by_job[job_id]),
     )
 
 
-def run_known_broken_baseline(*, lease_seconds: int, work_duration_seconds: int) -> ScenarioResult:
+def run_known_broken_baseline(
+    *,
+    lease_seconds: int,
+    work_duration_seconds: int,
+    backend: str = "memory",
+    path: str | None = None,
+) -> ScenarioResult:
     """Explicit baseline path: no commit-boundary guardrail (expected INV_001 violation)."""
     return _run_internal(
         lease_seconds=lease_seconds,
         work_duration_seconds=work_duration_seconds,
         faults=Faults.none(),
+        backend=backend,
+        path=path,
     )
 
 
-def run_guarded_with_commit_boundary(*, lease_seconds: int, work_duration_seconds: int) -> ScenarioResult:
+def run_guarded_with_commit_boundary(
+    *,
+    lease_seconds: int,
+    work_duration_seconds: int,
+    backend: str = "memory",
+    path: str | None = None,
+) -> ScenarioResult:
     """Explicit prevention path: commit boundary enabled (expected INV_001 preservation)."""
     return _run_internal(
         lease_seconds=lease_seconds,
         work_duration_seconds=work_duration_seconds,
         faults=Faults(enforce_idempotent_commit=True),
+        backend=backend,
+        path=path,
+    )
+
+
+def run_with_heartbeats(
+    *,
+    lease_seconds: int,
+    work_duration_seconds: int,
+    heartbeat_every_seconds: float,
+    backend: str = "memory",
+    path: str | None = None,
+) -> ScenarioResult:
+    """Trigger-removal path: A renews its lease while working, so no retry is leased at all."""
+    return _run_internal(
+        lease_seconds=lease_seconds,
+        work_duration_seconds=work_duration_seconds,
+        faults=Faults(enforce_idempotent_commit=True),
+        backend=backend,
+        path=path,
+        heartbeat_every_seconds=heartbeat_every_seconds,
     )
 
 
@@ -77,3 +137,56 @@ def run(*, lease_seconds: int, work_duration_seconds: int, faults: Faults) -> Sc
         faults=faults,
     )
 
+
+
+def _work_until_killed(directory: str, faults: Faults) -> None:
+    """Child process: A leases and finishes under `faults`, then the process is SIGKILLed."""
+    clock = Clock(start=0.0)
+    store = Store.wal(directory, clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+    worker_a = Worker(worker_id="A", store=store, queue=queue, clock=clock, faults=faults)
+
+    queue.submit_job(payload={"fm": "FM_001", "case": "kill"})
+    exec_a = queue.lease(worker_id="A")
+    assert exec_a is not None
+    worker_a.start(exec_a)
+    worker_a.finish(exec_a)  # returns early at the fault's crash point
+    store.flush()
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def run_killed_and_restarted(*, directory: str, faults: Faults) -> ScenarioResult:
+    """Real crash path: kill the process holding a WAL store, restart, reconcile, retry.
+
+    `faults` picks the crash point (`crash_before_commit` or
+    `crash_after_commit_before_done`). After restart the store is recovered
+    from `directory`, reconciled, and B takes whatever is still leasable.
+    """
+    child = multiprocessing.get_context("spawn").Process(target=_work_until_killed, args=(directory, faults))
+    child.start()
+    child.join()
+    if child.exitcode != -signal.SIGKILL:
+        raise RuntimeError(f"worker process exited with {child.exitcode}, expected SIGKILL")
+
+    # Restart well after A's lease expired.
+    clock = Clock(start=10.0)
+    store = Store.wal(directory, clock=clock)
+    reconcile_after_crash(store=store, clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+    worker_b = Worker(
+        worker_id="B", store=store, queue=queue, clock=clock, faults=Faults(enforce_idempotent_commit=True)
+    )
+    job_id = store.job_order[0]
+    exec_b = queue.lease(worker_id="B")
+    if exec_b is not None:
+        worker_b.start(exec_b)
+        worker_b.finish(exec_b)
+
+    result = ScenarioResult(
+        job_id=job_id,
+        effects_count=store.count_effects(job_id),
+        committed_exec_id=store.get_committed_exec_id(job_id),
+        attempts=len(store.execs_by_job[job_id]),
+    )
+    store.close()
+    return result
@@ -0,0 +1,34 @@
+import pytest
+
+from failure_modes.FM_001_duplicate_retry.scenario import run_with_heartbeats
+from harness.fixtures import STORE_BACKENDS
+
+
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_heartbeats_keep_slow_worker_lease_so_no_duplicate_attempt_is_leased(backend, tmp_path):
+    """FM_001 trigger removal: live work renews its lease, so B never re-leases the job."""
+    result = run_with_heartbeats(
+        lease_seconds=1,
+        work_duration_seconds=5,
+        heartbeat_every_seconds=0.5,
+        backend=backend,
+        path=str(tmp_path / "store.db"),
+    )
+
+    assert result.attempts == 1
+    assert result.effects_count == 1
+
+
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_heartbeat_after_expiry_cannot_resurrect_lease(backend, tmp_path):
+    """A renewal that arrives after expiry is refused; the retry still happens (and is no-op'd)."""
+    result = run_with_heartbeats(
+        lease_seconds=1,
+        work_duration_seconds=2,
+        heartbeat_every_seconds=2,
+        backend=backend,
+        path=str(tmp_path / "store.db"),
+    )
+
+    assert result.attempts == 2
+    assert result.effects_count == 1
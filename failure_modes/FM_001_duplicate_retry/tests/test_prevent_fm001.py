@@ -1,13 +1,18 @@
+import pytest
+
 from failure_modes.FM_001_duplicate_retry.scenario import run_guarded_with_commit_boundary
+from harness.fixtures import STORE_BACKENDS
 
 
-def test_prevent_fm001_idempotent_commit_preserves_inv001():
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_prevent_fm001_idempotent_commit_preserves_inv001(backend, tmp_path):
     """FM_001 prevention: COMMITTED boundary no-ops duplicate retry attempts."""
     result = run_guarded_with_commit_boundary(
         lease_seconds=1,
         work_duration_seconds=2,
+        backend=backend,
+        path=str(tmp_path / "store.db"),
     )
 
     assert result.effects_count == 1
     assert result.committed_exec_id is not None
-
@@ -1,12 +1,16 @@
+import pytest
+
+from failure_modes.FM_001_duplicate_retry.scenario import run_killed_and_restarted
 from faults.injectors import Faults
+from harness.fixtures import STORE_BACKENDS, make_store
 from policies.reconcile import reconcile_after_crash
 from runtime.clock import Clock
 from runtime.queue import Queue
-from runtime.store import Store
 from runtime.worker import Worker
 
 
-def test_recover_fm001_crash_after_commit_reconcile_restores_correctness():
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_recover_fm001_crash_after_commit_reconcile_restores_correctness(backend, tmp_path):
     """FM_001 recovery: crash after COMMITTED must reconcile to DONE without duplicate effects.
 
     Protects:
@@ -14,7 +18,7 @@ def test_recover_fm001_crash_after_commit_reconcile_restores_correctness():
     - INV_004 (recovery restores correctness)
     """
     clock = Clock(start=0.0)
-    store = Store.in_memory(clock=clock)
+    store = make_store(backend=backend, clock=clock, path=str(tmp_path / "store.db"))
     queue = Queue(store=store, clock=clock, lease_seconds=1)
 
     worker = Worker(
@@ -45,3 +49,25 @@ def test_recover_fm001_crash_after_commit_reconcile_restores_correctness():
     assert store.executions[lease.exec_id].status == "DONE"
     assert store.jobs[job_id]["state"] == "SUCCEEDED"
     assert store.count_effects(job_id) == 1
+
+
+@pytest.mark.parametrize(
+    "faults, attempts",
+    [
+        (Faults(enforce_idempotent_commit=True, crash_after_commit_before_done=True), 1),
+        (Faults(enforce_idempotent_commit=True, crash_before_commit=True), 2),
+    ],
+    ids=["kill_after_commit", "kill_before_commit"],
+)
+def test_recover_fm001_after_real_kill_and_restart(faults, attempts, tmp_path):
+    """FM_001 recovery across a SIGKILLed process: the WAL store restarts into one effect.
+
+    Protects:
+    - INV_001 (exactly one committed effect)
+    - INV_004 (recovery restores correctness)
+    """
+    result = run_killed_and_restarted(directory=str(tmp_path / "wal"), faults=faults)
+
+    assert result.effects_count == 1
+    assert result.committed_exec_id is not None
+    assert result.attempts == attempts
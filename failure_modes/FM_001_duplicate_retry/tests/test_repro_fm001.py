@@ -1,13 +1,18 @@
+import pytest
+
 from failure_modes.FM_001_duplicate_retry.scenario import run_known_broken_baseline
+from harness.fixtures import STORE_BACKENDS
 
 
-def test_repro_fm001_duplicate_effect_occurs_without_commit_boundary():
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_repro_fm001_duplicate_effect_occurs_without_commit_boundary(backend, tmp_path):
     """FM_001 repro: retry after timeout causes duplicate logical effect (violates INV_001)."""
     result = run_known_broken_baseline(
         lease_seconds=1,
         work_duration_seconds=2,
+        backend=backend,
+        path=str(tmp_path / "store.db"),
     )
 
     assert result.effects_count == 2
     assert result.committed_exec_id is not None
-
@@ -0,0 +1,53 @@
+"""Incremental invariant audit over a store's change feed."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from runtime.change_feed import Change
+
+# Execution status order; a transition may never go down, nor leave a terminal status.
+STATUS_RANK = {"LEASED": 0, "IN_PROGRESS": 1, "COMMITTED": 2, "DONE": 3, "ABORTED": 3}
+TERMINAL_STATUSES = frozenset({"DONE", "ABORTED"})
+
+
+class ChangeAudit:
+    """Checks INV_001 and INV_003 from `Change`s alone, in O(changes).
+
+    Feed it batches from a `Cursor` (`audit.consume(cursor.read())`) as often
+    as you like; it keeps the last status of each execution and the set of
+    committed jobs, never rescanning the store.
+
+    - `INV_001`: a second COMMITTED execution for a job;
+    - `INV_003`: an execution that moved backwards, left DONE/ABORTED, or
+      changed status before it was ever LEASED.
+    """
+
+    def __init__(self) -> None:
+        self.violations: Counter = Counter()
+        self.counts: Counter = Counter()  # changes seen, by kind
+        self._status: dict[str, str] = {}
+        self._committed_jobs: set[str] = set()
+
+    def consume(self, changes: Iterable[Change]) -> None:
+        status = self._status
+        for change in changes:
+            kind = change.kind
+            self.counts[kind] += 1
+            exec_id = change.exec_id
+            if exec_id is None:  # CREATED / FAILED are job-level
+                continue
+            before = status.get(exec_id)
+            if kind == "LEASED":
+                if before is not None:
+                    self.violations["INV_003"] += 1
+            elif before is None:
+                self.violations["INV_003"] += 1
+            elif STATUS_RANK[kind] < STATUS_RANK[before] or (before in TERMINAL_STATUSES and kind != before):
+                self.violations["INV_003"] += 1
+            status[exec_id] = kind
+            if kind == "COMMITTED":
+                if change.job_id in self._committed_jobs:
+                    self.violations["INV_001"] += 1
+                self._committed_jobs.add(change.job_id)
@@ -3,28 +3,71 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from faults.injectors import Faults
+from policies.retry import RetryPolicy
 from runtime.clock import Clock
+from runtime.compact_store import CompactStore
 from runtime.queue import Queue
+from runtime.sqlite_store import SqliteStore
 from runtime.store import Store
 
 
+# Every backend shares the store interface; CompactStore and SqliteStore do so
+# without subclassing Store (ConcurrentStore and WalStore are subclasses).
+AnyStore = Store | CompactStore | SqliteStore
+
+STORE_BACKENDS = ("memory", "compact", "concurrent", "sqlite", "wal")
+
+
+def make_store(
+    *,
+    backend: str,
+    clock: Clock,
+    path: str | None = None,
+    retry: RetryPolicy | None = None,
+) -> AnyStore:
+    """Build a store for `backend` so scenarios can run unchanged against each one.
+
+    `path` is the database file for sqlite (None: a private in-memory database)
+    and the WAL directory for wal (required); the in-memory backends ignore it.
+    """
+    if backend == "memory":
+        return Store.in_memory(clock=clock, retry=retry)
+    if backend == "compact":
+        return Store.compact(clock=clock, retry=retry)
+    if backend == "concurrent":
+        return Store.concurrent(clock=clock, retry=retry)
+    if backend == "sqlite":
+        return Store.sqlite(path or ":memory:", clock=clock, retry=retry)
+    if backend == "wal":
+        if path is None:
+            raise ValueError("the wal backend needs a directory path")
+        return Store.wal(path, clock=clock, retry=retry)
+    raise ValueError(f"unknown store backend: {backend!r}")
+
+
 @dataclass(frozen=True)
 class RuntimeFixture:
     """Deterministic in-memory runtime bundle for tests/scenarios."""
 
     clock: Clock
-    store: Store
+    store: AnyStore
     queue: Queue
     faults: Faults
 
 
-def make_runtime_fixture(*, lease_seconds: int, faults: Faults | None = None) -> RuntimeFixture:
+def make_runtime_fixture(
+    *,
+    lease_seconds: int,
+    faults: Faults | None = None,
+    backend: str = "memory",
+    path: str | None = None,
+) -> RuntimeFixture:
     """Construct a minimal deterministic runtime.
 
     Centralizing this keeps setup consistent while preserving test readability.
     """
     clock = Clock(start=0.0)
-    store = Store.in_memory(clock=clock)
+    store = make_store(backend=backend, clock=clock, path=path)
     queue = Queue(store=store, clock=clock, lease_seconds=lease_seconds)
     return RuntimeFixture(clock=clock, store=store, queue=queue, faults=faults or Faults.none())
 
@@ -0,0 +1,15 @@
+"""Derived measurements over a Store, used by scenarios, tests and benchmarks."""
+
+from __future__ import annotations
+
+from runtime.store import Store
+
+
+def duplicate_attempt_ratio(*, store: Store) -> float:
+    """Extra executions per leased job, counted from `execs_by_job` (0.0 means no retries)."""
+    leased_jobs = attempts = 0
+    for exec_ids in store.execs_by_job.values():
+        if exec_ids:
+            leased_jobs += 1
+            attempts += len(exec_ids)
+    return (attempts - leased_jobs) / leased_jobs if leased_jobs else 0.0
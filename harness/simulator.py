@@ -0,0 +1,261 @@
+"""Discrete-event simulation of many workers against one store, under `Clock`.
+
+`simulate` replaces the hand-written two-worker FM scripts with a seeded
+event heap: jobs arrive, virtual workers poll, lease, work and finish, and
+a `ContinuousReconciler` sweeps on its own interval. Each attempt draws its
+fault pattern (`faults.injectors.Faults`) from the config's rates, so one
+seed is one exact, replayable schedule. INV_001..INV_005 are checked while
+the run progresses and once more when it drains; violations are counted,
+not raised, so a run reports every breach it finds.
+"""
+
+from __future__ import annotations
+
+import gc
+import heapq
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from faults.injectors import Faults
+from harness.audit import STATUS_RANK, TERMINAL_STATUSES
+from harness.fixtures import make_store
+from harness.metrics import duplicate_attempt_ratio
+from policies.reconcile import ContinuousReconciler
+from runtime.clock import Clock
+from runtime.queue import Lease, Queue
+from runtime.worker import Worker
+
+# Event kinds, in tie-break order at equal times: settle work before new leases.
+_FINISH, _RECONCILE, _ARRIVAL, _POLL = range(4)
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """One simulated deployment. Rates are per attempt; times are virtual seconds."""
+
+    jobs: int
+    workers: int
+    seed: int = 0
+    lease_seconds: int = 10
+    work_seconds: float = 1.0
+    # None: every job is submitted at t=0; otherwise jobs per virtual second.
+    arrival_rate: float | None = None
+    # Attempts that stall past their lease, so a retry overlaps them (FM_001).
+    slow_rate: float = 0.0
+    crash_before_commit_rate: float = 0.0
+    crash_after_commit_rate: float = 0.0
+    restart_seconds: float = 5.0
+    enforce_idempotent_commit: bool = True
+    poll_seconds: float = 0.5
+    reconcile_every_seconds: float = 1.0
+    reconcile_batch: int = 10_000
+    backend: str = "memory"
+    path: str | None = None
+    # Stop even if work is left (reported as an INV_004 violation).
+    max_virtual_seconds: float = 1e9
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    jobs: int
+    completed: int
+    executions: int
+    events: int
+    virtual_seconds: float
+    wall_seconds: float
+    duplicate_ratio: float
+    # Submit to first lease, in virtual seconds.
+    lease_latency_p50: float
+    lease_latency_p99: float
+    lease_latency_max: float
+    violations: Counter = field(default_factory=Counter)
+
+    @property
+    def throughput(self) -> float:
+        """Completed jobs per virtual second."""
+        return self.completed / self.virtual_seconds if self.virtual_seconds else 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not +self.violations
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def simulate(config: SimulationConfig) -> SimulationReport:
+    """Run `config` to completion (or `max_virtual_seconds`) and report.
+
+    The cyclic GC is paused for the run: the simulation allocates millions of
+    acyclic records, and repeated full collections over them would dominate.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _simulate(config)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _simulate(config: SimulationConfig) -> SimulationReport:
+    started = time.perf_counter()
+    rng = random.Random(config.seed)
+    clock = Clock(start=0.0)
+    store = make_store(backend=config.backend, clock=clock, path=config.path)
+    queue = Queue(store=store, clock=clock, lease_seconds=config.lease_seconds)
+    reconciler = ContinuousReconciler(store=store, clock=clock, max_batch=config.reconcile_batch)
+    enforce = config.enforce_idempotent_commit
+    fault_patterns = {
+        name: Faults(enforce_idempotent_commit=enforce, **flags)
+        for name, flags in (
+            ("ok", {}),
+            ("before", {"crash_before_commit": True}),
+            ("after", {"crash_after_commit_before_done": True}),
+        )
+    }
+    # `Worker.finish` only depends on its faults, so one Worker per pattern serves every virtual worker.
+    runners = {
+        name: Worker(worker_id=name, store=store, queue=queue, clock=clock, faults=faults)
+        for name, faults in fault_patterns.items()
+    }
+    executions = store.executions
+    lease_seconds = config.lease_seconds
+    work_seconds = config.work_seconds
+    slow_rate = config.slow_rate
+    before_rate = config.crash_before_commit_rate
+    after_rate = before_rate + config.crash_after_commit_rate
+    violations: Counter = Counter()
+    submitted_at: dict[str, float] = {}
+    latencies: list[float] = []
+    completed = 0
+    events = 0
+
+    heap: list[tuple[float, int, int, int, object]] = []
+    seq = 0
+
+    def push(at: float, kind: int, worker: int = 0, data: object = None) -> None:
+        nonlocal seq
+        seq += 1
+        heapq.heappush(heap, (at, kind, seq, worker, data))
+
+    def transition(exec_id: str, before: str) -> None:
+        after = executions[exec_id].status
+        if STATUS_RANK[after] < STATUS_RANK[before] or (before in TERMINAL_STATUSES and after != before):
+            violations["INV_003"] += 1
+
+    def begin(worker: int, lease: Lease, now: float) -> None:
+        """Start `lease` now and schedule its finish with this attempt's duration and faults."""
+        store.mark_started(lease.exec_id)
+        if rng.random() < slow_rate:
+            duration = lease_seconds * (1.0 + rng.random())
+        else:
+            duration = work_seconds * (0.5 + rng.random())
+        draw = rng.random()
+        pattern = "before" if draw < before_rate else "after" if draw < after_rate else "ok"
+        push(now + duration, _FINISH, worker, (lease, pattern))
+
+    def submit(count: int) -> None:
+        now = clock.now()
+        for job_id in queue.submit_jobs(payloads=({} for _ in range(count))):
+            submitted_at[job_id] = now
+
+    if config.arrival_rate is None:
+        submit(config.jobs)
+        remaining = 0
+    else:
+        remaining = config.jobs
+        push(0.0, _ARRIVAL)
+    for worker in range(config.workers):
+        push(0.0, _POLL, worker)
+    push(config.reconcile_every_seconds, _RECONCILE)
+
+    while heap:
+        at, kind, _, worker, data = heapq.heappop(heap)
+        if at > config.max_virtual_seconds:
+            break
+        if at > clock.now():
+            clock.advance(at - clock.now())
+        events += 1
+        now = at
+        done = completed >= config.jobs
+
+        if kind == _POLL:
+            if done:
+                continue
+            lease = queue.lease(worker_id=f"w{worker}")
+            if lease is None:
+                push(now + config.poll_seconds, _POLL, worker)
+                continue
+            first_lease = submitted_at.pop(lease.job_id, None)
+            if first_lease is not None:
+                latencies.append(now - first_lease)
+            begin(worker, lease, now)
+
+        elif kind == _FINISH:
+            lease, pattern = data
+            before = executions[lease.exec_id].status
+            effects_before = store.count_effects(lease.job_id)
+            runners[pattern].finish(lease)
+            transition(lease.exec_id, before)
+            effects = store.count_effects(lease.job_id)
+            if effects > 1 and effects > effects_before:
+                violations["INV_001"] += 1
+            if pattern == "ok":
+                if store.get_committed_exec_id(lease.job_id) == lease.exec_id:
+                    completed += 1
+                push(now, _POLL, worker)
+            else:
+                # The worker died mid-attempt; it polls again once restarted.
+                push(now + config.restart_seconds, _POLL, worker)
+
+        elif kind == _RECONCILE:
+            result = reconciler.step()
+            for exec_id in result.finalized_exec_ids:
+                transition(exec_id, "COMMITTED")
+                if store.get_committed_exec_id(executions[exec_id].job_id) == exec_id:
+                    completed += 1
+            for exec_id in result.aborted_exec_ids:
+                transition(exec_id, "LEASED")  # only live executions are aborted
+                # A crash must be noticed within one sweep of its lease expiring.
+                if now - executions[exec_id].lease_expires_at > config.reconcile_every_seconds:
+                    violations["INV_005"] += 1
+            if not done or store.count_exec_ids_by_status("COMMITTED"):
+                push(now + config.reconcile_every_seconds, _RECONCILE)
+
+        elif kind == _ARRIVAL:
+            batch = min(remaining, max(1, int(config.arrival_rate)))
+            submit(batch)
+            remaining -= batch
+            if remaining:
+                push(now + 1.0, _ARRIVAL)
+
+    # Drained: nothing may be left half-done (INV_002) and every job ran exactly once (INV_004).
+    while reconciler.step().aborted_exec_ids:
+        pass
+    for status in ("LEASED", "IN_PROGRESS", "COMMITTED"):
+        violations["INV_002"] += store.count_exec_ids_by_status(status)
+    for job_id in store.job_order:
+        if store.count_effects(job_id) != 1 or store.get_committed_exec_id(job_id) is None:
+            violations["INV_004"] += 1
+    violations["INV_004"] += config.jobs - len(store.job_order)
+
+    latencies.sort()
+    return SimulationReport(
+        jobs=config.jobs,
+        completed=completed,
+        executions=len(executions),
+        events=events,
+        virtual_seconds=clock.now(),
+        wall_seconds=time.perf_counter() - started,
+        duplicate_ratio=duplicate_attempt_ratio(store=store),
+        lease_latency_p50=_percentile(latencies, 50),
+        lease_latency_p99=_percentile(latencies, 99),
+        lease_latency_max=latencies[-1] if latencies else 0.0,
+        violations=+violations,
+    )
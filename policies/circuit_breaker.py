@@ -1,22 +1,116 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+
+from runtime.clock import Clock
+
+CLOSED, OPEN, HALF_OPEN = "CLOSED", "OPEN", "HALF_OPEN"
 
 
 @dataclass
 class CircuitBreaker:
-    """Minimal failure counter to expose containment decisions explicitly."""
+    """Failure counter that opens to contain a failing dependency (INV_005).
+
+    Without a `clock` it counts failures until `reset()` and is open once
+    `failure_threshold` is reached.
+
+    With a `clock`, outcomes are kept for `window_seconds` and the breaker opens
+    when the window holds at least `failure_threshold` failures making up at
+    least `failure_ratio` of its calls. After `cooldown_seconds` it turns
+    half-open and admits `half_open_trials` calls: if they all succeed it
+    closes, any failure re-opens it for another cooldown.
+    """
 
     failure_threshold: int
     failures: int = 0
+    clock: Clock | None = None
+    window_seconds: float = 60.0
+    failure_ratio: float = 0.5
+    cooldown_seconds: float = 30.0
+    half_open_trials: int = 1
+    _outcomes: deque[tuple[float, bool]] = field(default_factory=deque, init=False, repr=False)
+    _opened_at: float | None = field(default=None, init=False, repr=False)
+    # None until the half-open trials are handed out.
+    _trials_left: int | None = field(default=None, init=False, repr=False)
+    _trial_successes: int = field(default=0, init=False, repr=False)
+
+    @property
+    def state(self) -> str:
+        if self.clock is None:
+            return OPEN if self.failures >= self.failure_threshold else CLOSED
+        if self._opened_at is None:
+            return CLOSED
+        if self.clock.now() - self._opened_at < self.cooldown_seconds:
+            return OPEN
+        return HALF_OPEN
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    def allow(self, calls: int = 1) -> int:
+        """How many of `calls` may start now; half-open trials are handed out once."""
+        state = self.state
+        if state == CLOSED:
+            return calls
+        if state == OPEN:
+            return 0
+        if self._trials_left is None:
+            self._trials_left = self.half_open_trials
+        granted = min(calls, self._trials_left)
+        self._trials_left -= granted
+        return granted
+
+    def refund(self, calls: int) -> None:
+        """Give back half-open trials that were allowed but never started."""
+        if self._trials_left is not None and self.state == HALF_OPEN:
+            self._trials_left += calls
+
+    def record_success(self) -> None:
+        if self.clock is None:
+            return
+        state = self.state
+        if state == HALF_OPEN:
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_trials:
+                self.reset()
+            return
+        if state == CLOSED:
+            self._outcomes.append((self.clock.now(), False))
+            self._evict()
 
     def record_failure(self) -> None:
+        if self.clock is None:
+            self.failures += 1
+            return
+        state = self.state
+        if state == HALF_OPEN:
+            self._open()
+            return
+        if state == OPEN:
+            return
+        self._outcomes.append((self.clock.now(), True))
         self.failures += 1
+        self._evict()
+        if self.failures >= self.failure_threshold and self.failures >= self.failure_ratio * len(self._outcomes):
+            self._open()
 
     def reset(self) -> None:
         self.failures = 0
+        self._outcomes.clear()
+        self._opened_at = None
+        self._trials_left = None
+        self._trial_successes = 0
 
-    @property
-    def is_open(self) -> bool:
-        return self.failures >= self.failure_threshold
+    def _open(self) -> None:
+        self.reset()
+        self._opened_at = self.clock.now()
 
+    def _evict(self) -> None:
+        horizon = self.clock.now() - self.window_seconds
+        outcomes = self._outcomes
+        while outcomes and outcomes[0][0] <= horizon:
+            _, failed = outcomes.popleft()
+            if failed:
+                self.failures -= 1
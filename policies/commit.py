@@ -16,6 +16,10 @@ class CommitResult:
 def commit_effect_idempotent(*, store: Store, exec_id: str) -> CommitResult:
     """Enforce INV_001 by allowing at most one logical commit per job."""
     committed = store.apply_effect(exec_id=exec_id, enforce_idempotent_commit=True)
-    job_id = store.executions[exec_id].job_id
-    return CommitResult(committed=committed, committed_exec_id=store.get_committed_exec_id(job_id))
+    # Acknowledge only after the commit record is durable (group-commit stores buffer writes).
+    store.flush()
+    record = store.executions.get(exec_id)
+    # A late duplicate of an archived job has no record left; it committed nothing.
+    committed_exec_id = store.get_committed_exec_id(record.job_id) if record is not None else None
+    return CommitResult(committed=committed, committed_exec_id=committed_exec_id)
 
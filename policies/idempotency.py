@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from runtime.clock import Clock
+
+
+class IdempotencyIndex:
+    """Bounded map from client idempotency keys to the job they created (INV_001).
+
+    A key is remembered for `ttl_seconds` after its first submit; a repeat within
+    that window resolves to the original job id, so a retried request never
+    creates a second job. At most `max_keys` keys are kept: the least recently
+    used one is evicted first, and expired keys are dropped as they are met.
+    Every operation is O(1) amortized.
+    """
+
+    def __init__(self, *, clock: Clock, ttl_seconds: float, max_keys: int) -> None:
+        if ttl_seconds <= 0 or max_keys <= 0:
+            raise ValueError("ttl_seconds and max_keys must be positive")
+        self.clock = clock
+        self.ttl_seconds = ttl_seconds
+        self.max_keys = max_keys
+        # key -> (job_id, expires_at), least recently used first.
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Job id first submitted under `key`, or None if unknown or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= self.clock.now():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, job_id: str) -> None:
+        """Remember `job_id` for `key` until the TTL runs out or it is evicted."""
+        now = self.clock.now()
+        self._entries[key] = (job_id, now + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        # Expired keys at the cold end go first; then the capacity bound.
+        while self._entries:
+            oldest_key, (_, expires_at) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_keys:
+                break
+            del self._entries[oldest_key]
+            if expires_at > now:
+                self.evictions += 1
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from runtime.clock import Clock
 from runtime.store import Store
 
+if TYPE_CHECKING:
+    from runtime.instrumentation import Metrics
+
 
 @dataclass(frozen=True)
 class ReconcileResult:
@@ -14,13 +21,26 @@ class ReconcileResult:
     aborted_exec_ids: list[str]
 
 
-def reconcile_after_crash(*, store: Store, clock: Clock) -> ReconcileResult:
+def _record_reconcile(metrics: "Metrics", *, started: float, result: ReconcileResult, lags: list[float]) -> None:
+    """Reconcile duration, records changed, and how long aborted leases sat expired (INV_005)."""
+    metrics.observe("reconcile_seconds", time.perf_counter() - started)
+    metrics.inc("reconcile_finalized_total", len(result.finalized_exec_ids))
+    metrics.inc("reconcile_aborted_total", len(result.aborted_exec_ids))
+    for lag in lags:
+        metrics.observe("reconcile_lag_seconds", lag)
+
+
+def reconcile_after_crash(*, store: Store, clock: Clock, metrics: "Metrics | None" = None) -> ReconcileResult:
     """Restore correctness after crash/timeouts.
 
     Rules (minimum for FM_001):
     - COMMITTED but not DONE executions are finalized to DONE (INV_004).
     - Expired LEASED/IN_PROGRESS executions are marked ABORTED (INV_002).
+
+    With `metrics`, also records duration, counts and reconcile lag.
     """
+    started = time.perf_counter()
+    lags: list[float] = []
     finalized: list[str] = []
     aborted: list[str] = []
 
@@ -30,14 +50,129 @@ def reconcile_after_crash(*, store: Store, clock: Clock) -> ReconcileResult:
         finalized.append(exec_id)
 
     # 2) Abort stale non-terminal executions with expired leases.
+    #    Both lookups are indexed, so cost tracks the records changed, not history.
     now = clock.now()
-    for exec_id, record in store.executions.items():
-        if record.status in {"LEASED", "IN_PROGRESS"} and record.lease_expires_at <= now:
-            record.status = "ABORTED"
-            # Re-open job only if there is no committed execution.
-            if store.get_committed_exec_id(record.job_id) is None:
-                store.jobs[record.job_id]["state"] = "PENDING"
-            aborted.append(exec_id)
+    for exec_id in store.list_expired_exec_ids(now=now):
+        if metrics is not None:
+            lags.append(now - store.executions[exec_id].lease_expires_at)
+        # Re-opens the job only if there is no committed execution.
+        store.mark_aborted(exec_id)
+        aborted.append(exec_id)
+
+    result = ReconcileResult(finalized_exec_ids=finalized, aborted_exec_ids=aborted)
+    if metrics is not None:
+        _record_reconcile(metrics, started=started, result=result, lags=lags)
+    return result
+
+
+
+@dataclass(frozen=True)
+class ReconcilerMetrics:
+    """Point-in-time view of how far the continuous reconciler is behind (INV_005)."""
+
+    steps: int
+    finalized_total: int
+    aborted_total: int
+    pending_committed: int
+    pending_expired: int
+    # Longest time an expired lease waited before the reconciler aborted it.
+    max_detection_lag_seconds: float
+    last_step_at: float | None
+
+
+class ContinuousReconciler:
+    """Incremental reconcile that runs alongside workers instead of stopping the world.
+
+    Each `step()` handles at most `max_batch` records, pulled from the store's
+    status index (COMMITTED) and lease-expiry index, so leasing is never paused
+    for long. Same rules as `reconcile_after_crash`.
+
+    `step()` is the deterministic mode: tests drive it with `Clock`. `run()` is
+    an asyncio task for the worker pool's event loop; `start()`/`stop()` run it
+    on a background thread, serialized with workers through `lock`.
+    """
+
+    def __init__(
+        self, *, store: Store, clock: Clock, max_batch: int = 100, metrics: "Metrics | None" = None
+    ) -> None:
+        self.store = store
+        self.clock = clock
+        self.max_batch = max_batch
+        # `metrics()` is the reconciler's own point-in-time view; this is the opt-in registry.
+        self._instrumentation = metrics
+        self._steps = 0
+        self._finalized_total = 0
+        self._aborted_total = 0
+        self._max_detection_lag = 0.0
+        self._last_step_at: float | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def step(self) -> ReconcileResult:
+        """Process one bounded batch: committed finalizations first, then expiries."""
+        started = time.perf_counter()
+        store = self.store
+        now = self.clock.now()
+
+        finalized = store.list_exec_ids_by_status("COMMITTED", limit=self.max_batch)
+        for exec_id in finalized:
+            store.mark_finished(exec_id)
+
+        lags: list[float] = []
+        aborted = store.list_expired_exec_ids(now=now, limit=self.max_batch - len(finalized))
+        for exec_id in aborted:
+            lag = now - store.executions[exec_id].lease_expires_at
+            lags.append(lag)
+            self._max_detection_lag = max(self._max_detection_lag, lag)
+            store.mark_aborted(exec_id)
+
+        self._steps += 1
+        self._finalized_total += len(finalized)
+        self._aborted_total += len(aborted)
+        self._last_step_at = now
+        result = ReconcileResult(finalized_exec_ids=finalized, aborted_exec_ids=aborted)
+        if self._instrumentation is not None:
+            _record_reconcile(self._instrumentation, started=started, result=result, lags=lags)
+        return result
+
+    def metrics(self) -> ReconcilerMetrics:
+        now = self.clock.now()
+        return ReconcilerMetrics(
+            steps=self._steps,
+            finalized_total=self._finalized_total,
+            aborted_total=self._aborted_total,
+            pending_committed=self.store.count_exec_ids_by_status("COMMITTED"),
+            pending_expired=len(self.store.list_expired_exec_ids(now=now)),
+            max_detection_lag_seconds=self._max_detection_lag,
+            last_step_at=self._last_step_at,
+        )
+
+    async def run(self, *, interval_seconds: float, stop: asyncio.Event) -> None:
+        """Step every `interval_seconds` on the running event loop until `stop` is set."""
+        while not stop.is_set():
+            self.step()
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self, *, interval_seconds: float, lock: threading.Lock) -> None:
+        """Step on a daemon thread; `lock` must be the one guarding the store for workers."""
+        if self._thread is not None:
+            raise RuntimeError("reconciler already started")
+
+        def loop() -> None:
+            while not self._stopping.wait(interval_seconds):
+                with lock:
+                    self.step()
 
-    return ReconcileResult(finalized_exec_ids=finalized, aborted_exec_ids=aborted)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=loop, name="continuous-reconciler", daemon=True)
+        self._thread.start()
 
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+
+from policies.budget import RetryBudget
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Delayed retries with capped exponential backoff, bounded by a `RetryBudget`.
+
+    After attempt `n` fails (lease expiry or an explicit `Queue.fail`), the job
+    is not leasable again until `delay_seconds(job_id, n)` has passed. Jitter is
+    derived from a hash of `(seed, job_id, attempt)`, so the schedule is a pure
+    function of its inputs and replays exactly under `Clock`. Once the budget
+    refuses attempt `n + 1`, the job is dead-lettered (`FAILED`) instead (FM_003).
+    """
+
+    budget: RetryBudget
+    base_delay_seconds: float = 1.0
+    multiplier: float = 2.0
+    max_delay_seconds: float = 300.0
+    # Fraction of the backoff that is randomized: delay is in [(1 - jitter) * d, d].
+    jitter: float = 0.5
+    seed: int = 0
+
+    def allows_retry(self, attempt: int) -> bool:
+        """Whether the job may run again after attempt `attempt`."""
+        return self.budget.allows(attempt + 1)
+
+    def delay_seconds(self, *, job_id: str, attempt: int) -> float:
+        """Seconds between attempt `attempt` ending and the retry becoming leasable."""
+        if not self.allows_retry(attempt):
+            return 0.0
+        exponent = min(max(attempt - 1, 0), 64)
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * self.multiplier**exponent)
+        unit = zlib.crc32(f"{self.seed}:{job_id}:{attempt}".encode()) / 2**32
+        return ceiling * (1.0 - self.jitter * unit)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from policies.circuit_breaker import CircuitBreaker
+from policies.commit import commit_effect_idempotent
+from runtime.clock import Clock
+from runtime.queue import Lease, Queue
+from runtime.store import Store
+
+Handler = Callable[[dict], Awaitable[None]]
+
+
+@dataclass
+class PoolStats:
+    """Outcome counters for one `WorkerPool.run`."""
+
+    committed: int = 0
+    # Executions that finished the handler but lost the COMMITTED race (FM_001 duplicates).
+    duplicates: int = 0
+    # Handler raised: the execution is left to lease expiry and reconcile (INV_002).
+    failed: int = 0
+    max_in_flight: int = 0
+    # Lease renewals applied by the heartbeat task (one store write per tick).
+    renewed: int = 0
+
+
+class AsyncWorker:
+    """Runs one leased job: start, await the user handler, commit idempotently, finish."""
+
+    def __init__(self, *, worker_id: str, store: Store, queue: Queue, clock: Clock, handler: Handler) -> None:
+        self.worker_id = worker_id
+        self.store = store
+        self.queue = queue
+        self.clock = clock
+        self.handler = handler
+
+    async def run_lease(self, lease: Lease) -> bool | None:
+        """Return True if committed, False if a duplicate no-op'd, None if the handler failed."""
+        self.store.mark_started(lease.exec_id)
+        try:
+            await self.handler(self.store.jobs[lease.job_id]["payload"])
+        except Exception:
+            # Crash before commit: no effect was applied, the lease will expire.
+            return None
+
+        result = commit_effect_idempotent(store=self.store, exec_id=lease.exec_id)
+        if result.committed:
+            self.store.mark_finished(lease.exec_id)
+        return result.committed
+
+
+class WorkerPool:
+    """Runs `concurrency` handler coroutines against one shared `Queue`.
+
+    A single leaser task pulls batches with `Queue.lease_many` into a bounded
+    buffer; when every slot is taken it stops leasing (backpressure), so the pool
+    never holds leases it cannot start soon. Commits go through
+    `commit_effect_idempotent`, so duplicates from expired leases stay no-ops.
+
+    With `heartbeat_interval_seconds`, a heartbeat task renews every held
+    lease (buffered or running) in one `Queue.renew_many` call per tick, so slow handlers keep their
+    lease instead of triggering FM_001 retries.
+
+    With a `breaker`, every handler outcome is recorded on it and the leaser
+    asks it before each batch: while it is open the pool leases nothing, so a
+    dead dependency does not burn attempts; half-open it leases only the trial
+    jobs. Use one pool (and breaker) per handler or payload type.
+    """
+
+    def __init__(
+        self,
+        *,
+        worker_id: str,
+        store: Store,
+        queue: Queue,
+        clock: Clock,
+        handler: Handler,
+        concurrency: int = 100,
+        max_buffered: int | None = None,
+        idle_sleep_seconds: float = 0.01,
+        heartbeat_interval_seconds: float | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.worker_id = worker_id
+        self.store = store
+        self.queue = queue
+        self.clock = clock
+        self.concurrency = concurrency
+        self.max_buffered = max_buffered if max_buffered is not None else concurrency
+        self.idle_sleep_seconds = idle_sleep_seconds
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds
+        self.breaker = breaker
+        self.worker = AsyncWorker(worker_id=worker_id, store=store, queue=queue, clock=clock, handler=handler)
+        self.stats = PoolStats()
+        self._in_flight = 0
+        # Leases the pool holds (buffered or running); all of them are heartbeated.
+        self._held: dict[str, Lease] = {}
+
+    async def run(self, *, stop: asyncio.Event | None = None, until_idle: bool = False) -> PoolStats:
+        """Lease and execute until `stop` is set, or if `until_idle` until no work is left.
+
+        With `until_idle`, an open breaker also ends the run once nothing is in flight.
+        """
+        if stop is None and not until_idle:
+            raise ValueError("pass stop or until_idle=True so the pool can terminate")
+        self.stats = PoolStats()
+        buffer: asyncio.Queue[Lease | None] = asyncio.Queue(maxsize=self.max_buffered)
+        consumers = [asyncio.create_task(self._consume(buffer)) for _ in range(self.concurrency)]
+        heartbeats = (
+            asyncio.create_task(self._heartbeat(self.heartbeat_interval_seconds))
+            if self.heartbeat_interval_seconds is not None
+            else None
+        )
+        try:
+            await self._lease_into(buffer, stop=stop, until_idle=until_idle)
+        finally:
+            for _ in consumers:
+                await buffer.put(None)
+            await asyncio.gather(*consumers)
+            if heartbeats is not None:
+                heartbeats.cancel()
+        return self.stats
+
+    async def _heartbeat(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.stats.renewed += len(self.queue.renew_many(list(self._held.values())))
+
+    async def _lease_into(
+        self,
+        buffer: asyncio.Queue[Lease | None],
+        *,
+        stop: asyncio.Event | None,
+        until_idle: bool,
+    ) -> None:
+        while stop is None or not stop.is_set():
+            free = self.max_buffered - buffer.qsize()
+            if free > 0 and self.breaker is not None:
+                free = self.breaker.allow(free)
+                if free == 0 and until_idle and buffer.empty() and self._in_flight == 0:
+                    return
+            if free <= 0:
+                await asyncio.sleep(self.idle_sleep_seconds)
+                continue
+            leases = self.queue.lease_many(worker_id=self.worker_id, max_jobs=free)
+            if self.breaker is not None:
+                self.breaker.refund(free - len(leases))
+            for lease in leases:
+                self._held[lease.exec_id] = lease
+                buffer.put_nowait(lease)
+            if leases:
+                # Let consumers pick up the batch before leasing more.
+                await asyncio.sleep(0)
+            elif until_idle and buffer.empty() and self._in_flight == 0:
+                return
+            else:
+                await asyncio.sleep(self.idle_sleep_seconds)
+
+    async def _consume(self, buffer: asyncio.Queue[Lease | None]) -> None:
+        while (lease := await buffer.get()) is not None:
+            self._in_flight += 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+            try:
+                outcome = await self.worker.run_lease(lease)
+            finally:
+                self._in_flight -= 1
+                del self._held[lease.exec_id]
+            if outcome is None:
+                self.stats.failed += 1
+            elif outcome:
+                self.stats.committed += 1
+            else:
+                self.stats.duplicates += 1
+            if self.breaker is not None:
+                if outcome is None:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
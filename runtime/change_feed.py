@@ -0,0 +1,183 @@
+"""Append-only change feed of job and execution transitions (INV_003 auditability).
+
+A store given `change_feed=ChangeFeed()` appends one `Change` per transition;
+consumers read it through `Cursor`s by offset, so an auditor, a metrics
+exporter or a reconciler handles only what changed since its last read
+instead of rescanning `Store.executions`.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+_ON_FULL = ("drop", "block")
+
+
+@dataclass(slots=True)
+class Change:
+    """One transition. `kind` is `CREATED`, an execution status, or `FAILED` (job dead-lettered)."""
+
+    offset: int
+    kind: str
+    job_id: str
+    exec_id: str | None
+    at: float
+
+
+class FeedOverrun(LookupError):
+    """The requested offset was already dropped; the consumer must resync from the store."""
+
+
+class ChangeFeed:
+    """Bounded, offset-addressed buffer of `Change`s with any number of cursors.
+
+    Offsets start at 0 and never repeat. The latest `capacity` changes are
+    retained, so a consumer that saved its offset can resubscribe from it
+    while it is still buffered. When the buffer is full and an open cursor
+    has not read the oldest change yet, `on_full` decides:
+
+    - `"drop"` (default): the oldest change goes anyway and the lagging
+      cursor gets `FeedOverrun` on its next read;
+    - `"block"`: the producing store call waits until that cursor advances
+      (backpressure). Only for producers on other threads than the
+      consumers, and consumers must not call the blocked store while behind.
+    """
+
+    def __init__(self, *, capacity: int = 100_000, on_full: str = "drop") -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if on_full not in _ON_FULL:
+            raise ValueError(f"on_full must be one of {_ON_FULL}, not {on_full!r}")
+        self.capacity = capacity
+        self.on_full = on_full
+        # Plain tuples, built into `Change`s only when read: appends are on the store's hot path.
+        self._buffer: list[tuple[int, str, str, str | None, float]] = []
+        self._start = 0  # index in `_buffer` of the oldest retained change
+        self._first = 0  # offset of that change
+        self._cursors: set[Cursor] = set()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._waiters = 0  # threads waiting on `_changed`; nobody to notify when 0
+
+    @property
+    def first_offset(self) -> int:
+        """Oldest offset still readable."""
+        return self._first
+
+    @property
+    def next_offset(self) -> int:
+        """Offset the next change will get."""
+        return self._first + len(self._buffer) - self._start
+
+    def __len__(self) -> int:
+        return len(self._buffer) - self._start
+
+    def append(self, kind: str, job_id: str, exec_id: str | None, at: float) -> None:
+        with self._lock:
+            buffer = self._buffer
+            retained = len(buffer) - self._start
+            if retained >= self.capacity:
+                if self.on_full == "block":
+                    self._wait_for_unread_oldest()
+                # Drop the oldest change; compact once half of the list is dropped entries.
+                self._start += 1
+                self._first += 1
+                if self._start * 2 >= len(buffer):
+                    del buffer[: self._start]
+                    self._start = 0
+                retained = len(buffer) - self._start  # other producers may have appended while we waited
+            buffer.append((self._first + retained, kind, job_id, exec_id, at))
+            if self._waiters:
+                self._changed.notify_all()
+
+    def _wait_for_unread_oldest(self) -> None:
+        """Backpressure: wait while an open cursor still has to read the oldest change."""
+        while self._cursors and min(cursor.offset for cursor in self._cursors) <= self._first:
+            self._waiters += 1
+            try:
+                self._changed.wait()
+            finally:
+                self._waiters -= 1
+
+    def read(self, offset: int, *, limit: int) -> list[Change]:
+        """Up to `limit` changes from `offset` on, without registering a cursor."""
+        with self._lock:
+            if offset < self._first:
+                raise FeedOverrun(f"offset {offset} was dropped; oldest retained is {self._first}")
+            index = self._start + offset - self._first
+            entries = self._buffer[index : index + limit]
+        return [Change(*entry) for entry in entries]
+
+    def subscribe(self, *, offset: int | None = None) -> Cursor:
+        """Open a cursor at `offset` (default: the oldest retained change)."""
+        with self._lock:
+            start = self._first if offset is None else offset
+            if start < self._first or start > self.next_offset:
+                raise FeedOverrun(f"offset {start} is outside [{self._first}, {self.next_offset}]")
+            cursor = Cursor(self, start)
+            self._cursors.add(cursor)
+            return cursor
+
+    def _advance(self, cursor: Cursor, offset: int) -> None:
+        with self._lock:
+            cursor.offset = offset
+            if self._waiters:
+                self._changed.notify_all()
+
+    def _close(self, cursor: Cursor) -> None:
+        with self._lock:
+            self._cursors.discard(cursor)
+            if self._waiters:
+                self._changed.notify_all()
+
+    def _wait(self, offset: int, timeout: float | None) -> bool:
+        """Block until a change at `offset` exists; False on timeout."""
+        with self._lock:
+            self._waiters += 1
+            try:
+                return self._changed.wait_for(lambda: self.next_offset > offset, timeout=timeout)
+            finally:
+                self._waiters -= 1
+
+
+class Cursor:
+    """A consumer's position in a `ChangeFeed`; resume later from `offset`."""
+
+    def __init__(self, feed: ChangeFeed, offset: int) -> None:
+        self.feed = feed
+        self.offset = offset
+
+    def read(self, *, limit: int = 1024) -> list[Change]:
+        """Next batch of up to `limit` changes; advances the cursor past them.
+
+        Raises `FeedOverrun` if the feed dropped changes this cursor had not read.
+        """
+        batch = self.feed.read(self.offset, limit=limit)
+        if batch:
+            self.feed._advance(self, batch[-1].offset + 1)
+        return batch
+
+    def tail(self, *, batch_size: int = 1024, follow: bool = False, timeout: float | None = None) -> Iterator[Change]:
+        """Yield changes as they are read, batch by batch.
+
+        Stops once caught up, or with `follow` waits for new changes (from
+        producer threads) and stops only after `timeout` seconds without one.
+        """
+        while True:
+            batch = self.read(limit=batch_size)
+            if batch:
+                yield from batch
+            elif not follow or not self.feed._wait(self.offset, timeout):
+                return
+
+    def close(self) -> None:
+        """Unregister the cursor; a `"block"` feed no longer waits for it."""
+        self.feed._close(self)
+
+    def __enter__(self) -> Cursor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
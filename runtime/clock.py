@@ -1,3 +1,6 @@
+import time
+
+
 class Clock:
     """Deterministic, test-controlled clock."""
 
@@ -10,3 +13,15 @@ class Clock:
     def advance(self, seconds: float) -> None:
         self._now += float(seconds)
 
+
+class SystemClock(Clock):
+    """Wall-clock time for real multi-process runs, where lease expiry must agree across processes."""
+
+    def __init__(self) -> None:
+        super().__init__(start=time.time())
+
+    def now(self) -> float:
+        return time.time()
+
+    def advance(self, seconds: float) -> None:
+        raise TypeError("SystemClock follows wall time and cannot be advanced")
@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import islice
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from runtime.clock import Clock
+from runtime.effect_log import EffectLog
+from runtime.store import ALLOWED_TRANSITIONS, ExecutionRecord, JobIdRange, _job_seq
+
+if TYPE_CHECKING:
+    from policies.retry import RetryPolicy
+
+_JOB_STATES = ("PENDING", "RUNNING", "SUCCEEDED", "FAILED")
+_PENDING, _RUNNING, _SUCCEEDED, _FAILED = range(len(_JOB_STATES))
+
+_STATUSES = ("LEASED", "IN_PROGRESS", "COMMITTED", "DONE", "ABORTED")
+_STATUS_CODE = {status: code for code, status in enumerate(_STATUSES)}
+_LEASED, _IN_PROGRESS, _COMMITTED, _DONE, _ABORTED = range(len(_STATUSES))
+# Non-terminal statuses keep an ordered index; terminal ones are found by scanning `_status`.
+_INDEXED = (_LEASED, _IN_PROGRESS, _COMMITTED)
+# `ALLOWED_TRANSITIONS` by code: the statuses each status may move to (INV_003).
+_ALLOWED_FROM = {
+    _STATUS_CODE[new]: frozenset(_STATUS_CODE[old] for old, news in ALLOWED_TRANSITIONS.items() if new in news)
+    for new in _STATUSES
+}
+
+V = TypeVar("V")
+
+
+def _exec_index(exec_id: str) -> int:
+    return int(exec_id.removeprefix("exec-")) - 1
+
+
+class _ColumnView(Mapping[str, V], Generic[V]):
+    """Read-only view that renders `job-N`/`exec-N` records from columns on access."""
+
+    def __init__(self, *, get: Callable[[str], V], keys: Callable[[], Iterator[str]], size: Callable[[], int]):
+        self._get = get
+        self._keys = keys
+        self._size = size
+
+    def __getitem__(self, key: str) -> V:
+        try:
+            return self._get(key)
+        except (IndexError, ValueError):
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return self._keys()
+
+    def __len__(self) -> int:
+        return self._size()
+
+
+class CompactStore:
+    """Struct-of-arrays variant of the in-memory Store for very large histories.
+
+    Jobs and executions are integer rows (`job-N` is row N-1); statuses and
+    job states are one-byte codes; lease owners are interned. Hot fields
+    (`attempt`, `lease_expires_at`, `status`) live in typed arrays, and each
+    execution links to the job's previous execution instead of a per-job list.
+    String ids and `ExecutionRecord` objects are only built at the API edge, so
+    `jobs`, `executions` and `execs_by_job` are read-only views.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Clock,
+        effect_log: EffectLog | None = None,
+        retry: "RetryPolicy | None" = None,
+    ) -> None:
+        self.clock = clock
+        self.retry = retry
+        # Job columns.
+        self._payloads: list[dict] = []
+        self._job_state = bytearray()
+        self._latest_exec = array("q")
+        self._committed_exec = array("q")
+        self._effect_counts = array("l")
+        # Execution columns.
+        self._exec_job = array("q")
+        self._prev_exec = array("q")
+        self._attempt = array("l")
+        self._expires = array("d")
+        self._status = bytearray()
+        self._owner = array("l")
+        self._owner_names: list[str] = []
+        self._owner_codes: dict[str, int] = {}
+
+        self.effects = effect_log if effect_log is not None else EffectLog()
+        self._indexed: dict[int, dict[int, None]] = {code: {} for code in _INDEXED}
+        self._lease_expiry: list[tuple[float, int]] = []
+        # Ready set: never-leased jobs are every row past the cursor without an
+        # execution, so they need no queue of their own.
+        self._pending_cursor = 0
+        self._leased: list[tuple[float, int, int]] = []
+        self._expired: list[tuple[int, int]] = []
+
+        self.jobs: Mapping[str, dict] = _ColumnView(get=self._job_view, keys=self._job_ids, size=self._job_count)
+        self.executions: Mapping[str, ExecutionRecord] = _ColumnView(
+            get=self._execution_view,
+            keys=lambda: (f"exec-{e + 1}" for e in range(len(self._status))),
+            size=lambda: len(self._status),
+        )
+        self.execs_by_job: Mapping[str, list[str]] = _ColumnView(
+            get=self._exec_ids_view, keys=self._job_ids, size=self._job_count
+        )
+
+    def flush(self) -> None:
+        """Durability barrier; every in-memory transition is already visible."""
+
+    # -- jobs -----------------------------------------------------------------
+
+    def _job_count(self) -> int:
+        return len(self._job_state)
+
+    def _job_ids(self) -> Iterator[str]:
+        return iter(self.job_order)
+
+    @property
+    def job_order(self) -> JobIdRange:
+        return JobIdRange(1, self._job_count() + 1)
+
+    def create_job(self, *, payload: dict) -> str:
+        return self.create_jobs(payloads=[payload])[0]
+
+    def create_jobs(self, *, payloads: Iterable[dict]) -> JobIdRange:
+        first_seq = self._job_count() + 1
+        for payload in payloads:
+            self._payloads.append(payload)
+            self._latest_exec.append(-1)
+            self._committed_exec.append(-1)
+            self._effect_counts.append(0)
+            self._job_state.append(_PENDING)
+        return JobIdRange(first_seq, self._job_count() + 1)
+
+    def _job_view(self, job_id: str) -> dict:
+        j = _job_seq(job_id) - 1
+        if j < 0:
+            raise IndexError(job_id)
+        return {"job_id": job_id, "payload": self._payloads[j], "state": _JOB_STATES[self._job_state[j]]}
+
+    # -- leasing --------------------------------------------------------------
+
+    def _can_lease(self, j: int, now: float) -> bool:
+        latest = self._latest_exec[j]
+        if latest < 0:
+            return True
+        if self._status[latest] == _DONE or self._job_state[j] == _FAILED:
+            return False
+        if self.retry is not None and not self.retry.allows_retry(self._attempt[latest]):
+            return False
+        return self._ready_at(latest) <= now
+
+    def _ready_at(self, e: int) -> float:
+        """When the job may be leased again if execution `e` ends without commit."""
+        if self.retry is None:
+            return self._expires[e]
+        job_id = f"job-{self._exec_job[e] + 1}"
+        return self._expires[e] + self.retry.delay_seconds(job_id=job_id, attempt=self._attempt[e])
+
+    def _out_of_retries(self, e: int, now: float) -> bool:
+        return (
+            self.retry is not None
+            and self._expires[e] <= now
+            and self._status[e] != _DONE
+            and not self.retry.allows_retry(self._attempt[e])
+        )
+
+    def _dead_letter(self, j: int) -> None:
+        if self._committed_exec[j] < 0:
+            self._job_state[j] = _FAILED
+
+    def can_lease(self, *, job_id: str, now: float) -> bool:
+        return self._can_lease(_job_seq(job_id) - 1, now)
+
+    def next_leasable_job(self, *, now: float) -> str | None:
+        job_ids = self.next_leasable_jobs(now=now, limit=1)
+        return job_ids[0] if job_ids else None
+
+    def next_leasable_jobs(self, *, now: float, limit: int) -> list[str]:
+        """Pop up to `limit` leasable jobs in submit order (same contract as `Store`).
+
+        Jobs that reach the front with their retry budget spent are dead-lettered.
+        """
+        leased = self._leased
+        expired = self._expired
+        while leased and leased[0][0] <= now:
+            _, j, e = heapq.heappop(leased)
+            heapq.heappush(expired, (j, e))
+
+        latest_exec = self._latest_exec
+        job_count = self._job_count()
+        popped: list[str] = []
+        # Renewals leave several entries per job; they pop consecutively (same row).
+        last_popped_row = -1
+        while len(popped) < limit:
+            cursor = self._pending_cursor
+            while cursor < job_count and latest_exec[cursor] >= 0:
+                cursor += 1
+            self._pending_cursor = cursor
+            has_pending = cursor < job_count
+            if expired and (not has_pending or expired[0][0] < cursor):
+                j, e = heapq.heappop(expired)
+                if j != last_popped_row and latest_exec[j] == e:
+                    if self._out_of_retries(e, now):
+                        self._dead_letter(j)
+                    elif self._can_lease(j, now):
+                        popped.append(f"job-{j + 1}")
+                        last_popped_row = j
+            elif has_pending:
+                self._pending_cursor = cursor + 1
+                popped.append(f"job-{cursor + 1}")
+            else:
+                break
+        return popped
+
+    def acquire_leases(
+        self,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        now: float,
+        limit: int,
+    ) -> list[tuple[str, str]]:
+        """Select and lease up to `limit` jobs as one step; returns `(job_id, exec_id)` pairs."""
+        job_ids = self.next_leasable_jobs(now=now, limit=limit)
+        if not job_ids:
+            return []
+        exec_ids = self.create_leases(job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+        return list(zip(job_ids, exec_ids))
+
+    def create_lease(self, *, job_id: str, worker_id: str, lease_seconds: int) -> str:
+        return self.create_leases(job_ids=[job_id], worker_id=worker_id, lease_seconds=lease_seconds)[0]
+
+    def create_leases(self, *, job_ids: list[str], worker_id: str, lease_seconds: int) -> list[str]:
+        owner = self._owner_codes.get(worker_id)
+        if owner is None:
+            owner = self._owner_codes[worker_id] = len(self._owner_names)
+            self._owner_names.append(worker_id)
+        lease_expires_at = self.clock.now() + float(lease_seconds)
+        leased_index = self._indexed[_LEASED]
+        exec_ids: list[str] = []
+        for job_id in job_ids:
+            j = _job_seq(job_id) - 1
+            e = len(self._status)
+            latest = self._latest_exec[j]
+            self._exec_job.append(j)
+            self._prev_exec.append(latest)
+            self._attempt.append(self._attempt[latest] + 1 if latest >= 0 else 1)
+            self._expires.append(lease_expires_at)
+            self._status.append(_LEASED)
+            self._owner.append(owner)
+            self._latest_exec[j] = e
+            self._job_state[j] = _RUNNING
+            leased_index[e] = None
+            heapq.heappush(self._lease_expiry, (lease_expires_at, e))
+            heapq.heappush(self._leased, (self._ready_at(e), j, e))
+            exec_ids.append(f"exec-{e + 1}")
+        return exec_ids
+
+    # -- execution transitions -------------------------------------------------
+
+    def _set_status(self, e: int, code: int) -> None:
+        old = self._status[e]
+        if old in self._indexed:
+            del self._indexed[old][e]
+        if code in self._indexed:
+            self._indexed[code][e] = None
+        self._status[e] = code
+
+    def renew_leases(self, *, exec_ids: list[str], lease_seconds: int, now: float) -> list[str]:
+        """Extend live leases (same rules as `Store.renew_leases`)."""
+        lease_expires_at = now + float(lease_seconds)
+        renewed: list[str] = []
+        for exec_id in exec_ids:
+            e = _exec_index(exec_id)
+            j = self._exec_job[e]
+            if (
+                self._status[e] not in (_LEASED, _IN_PROGRESS)
+                or self._expires[e] <= now
+                or self._latest_exec[j] != e
+            ):
+                continue
+            self._expires[e] = lease_expires_at
+            heapq.heappush(self._leased, (self._ready_at(e), j, e))
+            heapq.heappush(self._lease_expiry, (lease_expires_at, e))
+            renewed.append(exec_id)
+        return renewed
+
+    def _movable(self, exec_id: str, code: int) -> int:
+        """Row of `exec_id` if it may move to status `code` now, else -1 (see `Store._movable`)."""
+        e = _exec_index(exec_id)
+        return e if self._status[e] in _ALLOWED_FROM[code] else -1
+
+    def mark_started(self, exec_id: str) -> None:
+        e = self._movable(exec_id, _IN_PROGRESS)
+        if e >= 0:
+            self._set_status(e, _IN_PROGRESS)
+
+    def apply_effect(self, *, exec_id: str, enforce_idempotent_commit: bool) -> bool:
+        e = self._movable(exec_id, _COMMITTED)
+        if e < 0:
+            return False
+        j = self._exec_job[e]
+        if self._committed_exec[j] >= 0:
+            if enforce_idempotent_commit:
+                return False
+        else:
+            self._committed_exec[j] = e
+
+        self._set_status(e, _COMMITTED)
+        self.effects.append((f"job-{j + 1}", exec_id, self.clock.now()))
+        self._effect_counts[j] += 1
+        return True
+
+    def mark_finished(self, exec_id: str) -> None:
+        e = self._movable(exec_id, _DONE)
+        if e < 0:
+            return
+        self._set_status(e, _DONE)
+        self._job_state[self._exec_job[e]] = _SUCCEEDED
+
+    def mark_aborted(self, exec_id: str) -> None:
+        e = self._movable(exec_id, _ABORTED)
+        if e < 0:
+            return
+        self._set_status(e, _ABORTED)
+        j = self._exec_job[e]
+        if self._committed_exec[j] < 0 and self._job_state[j] != _FAILED:
+            self._job_state[j] = _PENDING
+
+    def mark_failed(self, exec_id: str) -> None:
+        """End the lease now and schedule the retry (same rules as `Store.mark_failed`)."""
+        e = self._movable(exec_id, _ABORTED)
+        if e < 0:
+            return
+        self._expires[e] = min(self._expires[e], self.clock.now())
+        self.mark_aborted(exec_id)
+        j = self._exec_job[e]
+        if self._latest_exec[j] != e or self._committed_exec[j] >= 0:
+            return
+        if self.retry is not None and not self.retry.allows_retry(self._attempt[e]):
+            self._dead_letter(j)
+            return
+        heapq.heappush(self._leased, (self._ready_at(e), j, e))
+
+    # -- reads ----------------------------------------------------------------
+
+    def count_effects(self, job_id: str) -> int:
+        return self._effect_counts[_job_seq(job_id) - 1]
+
+    def get_committed_exec_id(self, job_id: str) -> str | None:
+        e = self._committed_exec[_job_seq(job_id) - 1]
+        return None if e < 0 else f"exec-{e + 1}"
+
+    def _exec_indexes_by_status(self, code: int) -> Iterator[int]:
+        if code in self._indexed:
+            yield from self._indexed[code]
+            return
+        status = self._status
+        e = status.find(code)
+        while e >= 0:
+            yield e
+            e = status.find(code, e + 1)
+
+    def list_exec_ids_by_status(self, status: str, *, limit: int | None = None) -> list[str]:
+        code = _STATUS_CODE[status]
+        return [f"exec-{e + 1}" for e in islice(self._exec_indexes_by_status(code), limit)]
+
+    def count_exec_ids_by_status(self, status: str) -> int:
+        code = _STATUS_CODE[status]
+        if code in self._indexed:
+            return len(self._indexed[code])
+        return self._status.count(code)
+
+    def list_expired_exec_ids(self, *, now: float, limit: int | None = None) -> list[str]:
+        heap = self._lease_expiry
+        expired: list[tuple[float, int]] = []
+        while heap and heap[0][0] <= now:
+            expires_at, e = heapq.heappop(heap)
+            if self._status[e] in (_LEASED, _IN_PROGRESS) and self._expires[e] == expires_at:
+                expired.append((expires_at, e))
+        for entry in expired:
+            heapq.heappush(heap, entry)
+        expired.sort(key=lambda entry: entry[1])
+        return [f"exec-{e + 1}" for _, e in expired[:limit]]
+
+    def _execution_view(self, exec_id: str) -> ExecutionRecord:
+        e = _exec_index(exec_id)
+        if e < 0:
+            raise IndexError(exec_id)
+        return ExecutionRecord(
+            exec_id=exec_id,
+            job_id=f"job-{self._exec_job[e] + 1}",
+            attempt=self._attempt[e],
+            lease_owner=self._owner_names[self._owner[e]],
+            lease_expires_at=self._expires[e],
+            status=_STATUSES[self._status[e]],
+        )
+
+    def _exec_ids_view(self, job_id: str) -> list[str]:
+        j = _job_seq(job_id) - 1
+        if j < 0:
+            raise IndexError(job_id)
+        exec_ids: list[str] = []
+        e = self._latest_exec[j]
+        while e >= 0:
+            exec_ids.append(f"exec-{e + 1}")
+            e = self._prev_exec[e]
+        exec_ids.reverse()
+        return exec_ids
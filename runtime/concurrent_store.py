@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
+from typing import TYPE_CHECKING
+
+from runtime.clock import Clock
+from runtime.effect_log import EffectLog
+from runtime.job_archive import JobArchive
+from runtime.store import JobIdRange, Store, _job_seq
+
+if TYPE_CHECKING:
+    from policies.retry import RetryPolicy
+    from runtime.change_feed import ChangeFeed
+    from runtime.payload_arena import PayloadArena
+
+_UNLOCKED = nullcontext()
+
+
+class ConcurrentStore(Store):
+    """In-memory `Store` that any number of threads may share.
+
+    Three kinds of lock, always taken in this order:
+
+    - the ready lock: the ready set, id sequences, the lease-expiry heap and
+      everything that feeds them (`acquire_leases`, `create_leases`,
+      `renew_leases`, `mark_failed`, job creation);
+    - per-job stripes (`stripes` re-entrant locks, job `N` uses stripe
+      `N % stripes`): a job's executions, status and commit record;
+    - the index lock: a leaf lock around the shared status index and effect log.
+
+    `acquire_leases` is one compare-and-set per job: the job's stripe is held
+    from the `can_lease` check until its new execution exists, so no other
+    thread can finish or renew the old attempt in between and no job gets two
+    unexpired leases. `apply_effect` is one compare-and-set on the job's
+    stripe, so first-committer-wins (INV_001) holds between threads. The
+    execution hot path (`mark_started`, `apply_effect`, `mark_finished`,
+    `mark_aborted`) never takes the ready lock: workers on different jobs
+    contend only on the index lock's short critical sections.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Clock,
+        effect_log: EffectLog | None = None,
+        retry: "RetryPolicy | None" = None,
+        tenant_weights: Mapping[str, float] | None = None,
+        change_feed: "ChangeFeed | None" = None,
+        payload_arena: "PayloadArena | None" = None,
+        stripes: int = 64,
+    ) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+        super().__init__(
+            clock=clock,
+            effect_log=effect_log,
+            retry=retry,
+            tenant_weights=tenant_weights,
+            change_feed=change_feed,
+            payload_arena=payload_arena,
+        )
+        self._ready_lock = threading.RLock()
+        self._stripes = [threading.RLock() for _ in range(stripes)]
+        self._index_lock = threading.Lock()
+        # Stripes `acquire_leases` holds from the leasability check until the lease exists.
+        self._held: list[threading.RLock] | None = None
+
+    def _stripe(self, job_id: str) -> threading.RLock:
+        return self._stripes[_job_seq(job_id) % len(self._stripes)]
+
+    def _job_lock(self, exec_id: str) -> AbstractContextManager:
+        """Stripe of `exec_id`'s job (no lock for ids the base store rejects or ignores)."""
+        record = self.executions.get(exec_id)
+        return _UNLOCKED if record is None else self._stripe(record.job_id)
+
+    @contextmanager
+    def _jobs_locked(self, job_ids: Iterable[str]) -> Iterator[None]:
+        # Callers hold the ready lock, so only one thread at a time takes several stripes.
+        with ExitStack() as stack:
+            for stripe in {id(lock): lock for lock in map(self._stripe, job_ids)}.values():
+                stack.enter_context(stripe)
+            yield
+
+    # -- ready lock ---------------------------------------------------------------
+
+    def create_job(self, *, payload: dict) -> str:
+        with self._ready_lock:
+            return super().create_job(payload=payload)
+
+    def create_jobs(self, *, payloads: Iterable[dict]) -> JobIdRange:
+        with self._ready_lock:
+            return super().create_jobs(payloads=payloads)
+
+    def next_leasable_jobs(self, *, now: float, limit: int) -> list[str]:
+        with self._ready_lock:
+            return super().next_leasable_jobs(now=now, limit=limit)
+
+    def _is_leasable(self, job_id: str, exec_id: str | None, now: float) -> bool:
+        stripe = self._stripe(job_id)
+        stripe.acquire()
+        leasable = super()._is_leasable(job_id, exec_id, now)
+        if leasable and self._held is not None:
+            self._held.append(stripe)
+        else:
+            stripe.release()
+        return leasable
+
+    def acquire_leases(
+        self,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        now: float,
+        limit: int,
+    ) -> list[tuple[str, str]]:
+        with self._ready_lock:
+            held = self._held = []
+            try:
+                job_ids = super().next_leasable_jobs(now=now, limit=limit)
+                if not job_ids:
+                    return []
+                # The held stripes already cover every job: skip `create_leases`' own locking.
+                exec_ids = super().create_leases(job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+                return list(zip(job_ids, exec_ids))
+            finally:
+                self._held = None
+                for stripe in held:
+                    stripe.release()
+
+    def create_leases(self, *, job_ids: list[str], worker_id: str, lease_seconds: int) -> list[str]:
+        with self._ready_lock, self._jobs_locked(job_ids):
+            return super().create_leases(job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+
+    def renew_leases(self, *, exec_ids: list[str], lease_seconds: int, now: float) -> list[str]:
+        with self._ready_lock:
+            job_ids = [record.job_id for record in map(self.executions.get, exec_ids) if record is not None]
+            with self._jobs_locked(job_ids):
+                return super().renew_leases(exec_ids=exec_ids, lease_seconds=lease_seconds, now=now)
+
+    def mark_failed(self, exec_id: str) -> None:
+        with self._ready_lock, self._job_lock(exec_id):
+            super().mark_failed(exec_id)
+
+    def list_expired_exec_ids(self, *, now: float, limit: int | None = None) -> list[str]:
+        with self._ready_lock:
+            return super().list_expired_exec_ids(now=now, limit=limit)
+
+    def archive_terminal_jobs(
+        self,
+        *,
+        archive: JobArchive,
+        tombstone_seconds: float,
+        limit: int | None = None,
+    ) -> int:
+        with self._ready_lock, ExitStack() as stack:
+            for stripe in self._stripes:
+                stack.enter_context(stripe)
+            stack.enter_context(self._index_lock)
+            return super().archive_terminal_jobs(archive=archive, tombstone_seconds=tombstone_seconds, limit=limit)
+
+    # -- per-job stripes ------------------------------------------------------------
+
+    def mark_started(self, exec_id: str) -> None:
+        with self._job_lock(exec_id):
+            super().mark_started(exec_id)
+
+    def apply_effect(self, *, exec_id: str, enforce_idempotent_commit: bool) -> bool:
+        with self._job_lock(exec_id):
+            return super().apply_effect(exec_id=exec_id, enforce_idempotent_commit=enforce_idempotent_commit)
+
+    def mark_finished(self, exec_id: str) -> None:
+        with self._job_lock(exec_id):
+            super().mark_finished(exec_id)
+
+    def mark_aborted(self, exec_id: str) -> None:
+        with self._job_lock(exec_id):
+            super().mark_aborted(exec_id)
+
+    # -- index lock -----------------------------------------------------------------
+
+    def _index_status(self, exec_id: str, *, old: str | None, new: str) -> None:
+        with self._index_lock:
+            super()._index_status(exec_id, old=old, new=new)
+
+    def _append_effect(self, job_id: str, exec_id: str) -> None:
+        with self._index_lock:
+            super()._append_effect(job_id, exec_id)
+
+    def list_exec_ids_by_status(self, status: str, *, limit: int | None = None) -> list[str]:
+        with self._index_lock:
+            return super().list_exec_ids_by_status(status, limit=limit)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from typing import TextIO
+
+Effect = tuple[str, str, float]
+
+
+class EffectLog:
+    """Append-only log of applied effects `(job_id, exec_id, applied_at)`.
+
+    Keeps at most `max_in_memory` recent entries (unbounded when None). With
+    `spill_path`, every entry is also appended to that file so the full history
+    stays auditable (`iter_all`) without living in memory.
+    """
+
+    def __init__(self, *, max_in_memory: int | None = None, spill_path: str | None = None) -> None:
+        self._recent: deque[Effect] = deque(maxlen=max_in_memory)
+        self.spill_path = spill_path
+        self._spill: TextIO | None = open(spill_path, "a", encoding="utf-8") if spill_path else None
+        self.total_appended = 0
+
+    def append(self, effect: Effect) -> None:
+        self._recent.append(effect)
+        self.total_appended += 1
+        if self._spill is not None:
+            job_id, exec_id, applied_at = effect
+            self._spill.write(f"{job_id}\t{exec_id}\t{applied_at!r}\n")
+
+    def __iter__(self) -> Iterator[Effect]:
+        """Iterate the in-memory window (the whole log when unbounded)."""
+        return iter(self._recent)
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def iter_all(self) -> Iterator[Effect]:
+        """Stream the full history: from the spill file if any, else the in-memory window."""
+        if self._spill is None:
+            yield from self._recent
+            return
+        self._spill.flush()
+        with open(self.spill_path, encoding="utf-8") as spilled:
+            for line in spilled:
+                job_id, exec_id, applied_at = line.rstrip("\n").split("\t")
+                yield job_id, exec_id, float(applied_at)
+
+    def __getstate__(self) -> dict:
+        # Snapshots keep the window and counters; the spill file is reopened on load.
+        state = self.__dict__.copy()
+        if self._spill is not None:
+            self._spill.flush()
+        state["_spill"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if self.spill_path:
+            self._spill = open(self.spill_path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
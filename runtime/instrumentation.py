@@ -0,0 +1,283 @@
+"""Opt-in hot-path metrics: counters, log-linear latency histograms, Prometheus text.
+
+Nothing here runs unless asked for. `Queue`, `Worker` and the reconcile
+functions take `metrics=None` and only time themselves when given a
+`Metrics`. Store-level measurements come from wrapping the store in
+`InstrumentedStore`, so an uninstrumented store pays nothing at all.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Iterable
+from typing import Any
+
+# Sub-buckets per power of two: bucket bounds are within 1/16 (6.25%) of any value.
+_SUB_BUCKETS = 16
+_PERCENTILES = (50, 90, 99, 99.9)
+# Values <= 0 (e.g. a lease taken the instant a job became ready).
+_ZERO_BUCKET = -(1 << 30)
+
+
+class Histogram:
+    """HDR-style histogram: log-linear buckets with bounded relative error.
+
+    Each power of two is split into `_SUB_BUCKETS` equal buckets, so a
+    reported percentile is at most 6.25% above the true value whatever its
+    magnitude, and recording is one `frexp` plus a dict update.
+    """
+
+    __slots__ = ("count", "sum", "min", "max", "_buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: dict[int, int] = {}
+
+    def record(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value > 0.0:
+            mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, mantissa in [0.5, 1)
+            key = exponent * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+        else:
+            key = _ZERO_BUCKET
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """`(upper_bound, cumulative_count)` for every non-empty bucket, ascending."""
+        cumulative = 0
+        bounds = []
+        for key in sorted(self._buckets):
+            cumulative += self._buckets[key]
+            bounds.append((_upper_bound(key), cumulative))
+        return bounds
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the `pct`th percentile (capped at `max`)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        for bound, cumulative in self.buckets():
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        summary = {"count": self.count, "sum": self.sum, "min": self.min if self.count else 0.0, "max": self.max}
+        for pct in _PERCENTILES:
+            summary[f"p{pct:g}"] = self.percentile(pct)
+        return summary
+
+
+def _upper_bound(key: int) -> float:
+    if key == _ZERO_BUCKET:
+        return 0.0
+    exponent, sub = divmod(key, _SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub + 1) / (2 * _SUB_BUCKETS), exponent)
+
+
+def _series(name: str, labels: tuple[tuple[str, str], ...], extra: str = "") -> str:
+    pairs = [f'{key}="{value}"' for key, value in labels]
+    if extra:
+        pairs.append(extra)
+    return f"{name}{{{','.join(pairs)}}}" if pairs else name
+
+
+class Metrics:
+    """Registry of counters and histograms, keyed by name and optional labels.
+
+    `snapshot()` returns plain dicts for tests and logs; `to_prometheus()`
+    renders the text exposition format (counters as `_total`, histograms with
+    cumulative `le` buckets) for any scraper, with no server involved.
+    """
+
+    def __init__(self, *, namespace: str = "jobqueue") -> None:
+        self.namespace = namespace
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        self.histogram(name, **labels).record(value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """The histogram for `name` and `labels`, created empty on first use.
+
+        Hot paths look it up once and call `record` on it directly.
+        """
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram()
+        return histogram
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {
+            "counters": {_series(name, labels): value for (name, labels), value in sorted(self._counters.items())},
+            "histograms": {
+                _series(name, labels): histogram.summary()
+                for (name, labels), histogram in sorted(self._histograms.items())
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+        typed: set[str] = set()
+        for (name, labels), value in sorted(self._counters.items()):
+            metric = f"{self.namespace}_{name}"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{_series(metric, labels)} {value:g}")
+        for (name, labels), histogram in sorted(self._histograms.items()):
+            metric = f"{self.namespace}_{name}"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            for bound, cumulative in histogram.buckets():
+                le = f'le="{bound:.6g}"'
+                lines.append(f"{_series(metric + '_bucket', labels, le)} {cumulative}")
+            le = 'le="+Inf"'
+            lines.append(f"{_series(metric + '_bucket', labels, le)} {histogram.count}")
+            lines.append(f"{_series(metric + '_sum', labels)} {histogram.sum:.9g}")
+            lines.append(f"{_series(metric + '_count', labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedStore:
+    """Store wrapper that measures the hot transitions and delegates everything else.
+
+    Records, per call, wall-clock latency of `acquire_leases`/`create_lease(s)`,
+    `apply_effect` and `mark_finished` (`store_call_seconds{op=...}`), and in
+    store-clock time:
+
+    - `lease_wait_seconds`: from submit, or from the previous attempt's lease
+      ending, until the job is leased again;
+    - `execution_status_seconds{status=...}`: time spent in each execution status;
+    - `commit_conflicts_total`: `apply_effect` calls rejected by the commit boundary.
+
+    Only transitions made through the wrapper are seen, so hand it (not the
+    inner store) to the queue, workers and reconciler.
+    """
+
+    def __init__(self, store: Any, *, metrics: Metrics) -> None:
+        self._store = store
+        self.metrics = metrics
+        self._lease_wait = metrics.histogram("lease_wait_seconds")
+        self._call_seconds = {
+            op: metrics.histogram("store_call_seconds", op=op)
+            for op in ("acquire_leases", "create_leases", "apply_effect", "mark_finished")
+        }
+        self._status_seconds = {
+            status: metrics.histogram("execution_status_seconds", status=status)
+            for status in ("LEASED", "IN_PROGRESS", "COMMITTED")
+        }
+        # exec_id -> (status, entered_at, job_id) for executions not yet DONE/ABORTED.
+        self._status_since: dict[str, tuple[str, float, str]] = {}
+        # job_id -> when it became (or will become) leasable without a live attempt.
+        self._ready_since: dict[str, float] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._store, name)
+
+    def _leased(self, pairs: Iterable[tuple[str, str]], lease_seconds: int) -> None:
+        now = self._store.clock.now()
+        leased = 0
+        for job_id, exec_id in pairs:
+            self._lease_wait.record(max(0.0, now - self._ready_since.get(job_id, now)))
+            self._ready_since[job_id] = now + lease_seconds
+            self._status_since[exec_id] = ("LEASED", now, job_id)
+            leased += 1
+        self.metrics.inc("leases_total", leased)
+
+    def _moved(self, exec_id: str, status: str) -> None:
+        entry = self._status_since.pop(exec_id, None)
+        if entry is None:
+            return
+        previous, entered_at, job_id = entry
+        now = self._store.clock.now()
+        self._status_seconds[previous].record(now - entered_at)
+        if status == "DONE":
+            self._ready_since.pop(job_id, None)
+        elif status == "ABORTED":
+            self._ready_since[job_id] = min(self._ready_since.get(job_id, now), now)
+        else:
+            self._status_since[exec_id] = (status, now, job_id)
+
+    def create_job(self, *, payload: dict) -> str:
+        return self.create_jobs(payloads=[payload])[0]
+
+    def create_jobs(self, *, payloads: Iterable[dict]) -> Any:
+        job_ids = self._store.create_jobs(payloads=payloads)
+        now = self._store.clock.now()
+        self._ready_since.update(dict.fromkeys(job_ids, now))
+        self.metrics.inc("jobs_created_total", len(job_ids))
+        return job_ids
+
+    def acquire_leases(self, *, worker_id: str, lease_seconds: int, now: float, limit: int) -> list[tuple[str, str]]:
+        started = time.perf_counter()
+        acquired = self._store.acquire_leases(worker_id=worker_id, lease_seconds=lease_seconds, now=now, limit=limit)
+        self._call_seconds["acquire_leases"].record(time.perf_counter() - started)
+        self._leased(acquired, lease_seconds)
+        return acquired
+
+    def create_lease(self, *, job_id: str, worker_id: str, lease_seconds: int) -> str:
+        return self.create_leases(job_ids=[job_id], worker_id=worker_id, lease_seconds=lease_seconds)[0]
+
+    def create_leases(self, *, job_ids: list[str], worker_id: str, lease_seconds: int) -> list[str]:
+        started = time.perf_counter()
+        exec_ids = self._store.create_leases(job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+        self._call_seconds["create_leases"].record(time.perf_counter() - started)
+        self._leased(zip(job_ids, exec_ids), lease_seconds)
+        return exec_ids
+
+    def renew_leases(self, *, exec_ids: list[str], lease_seconds: int, now: float) -> list[str]:
+        renewed = self._store.renew_leases(exec_ids=exec_ids, lease_seconds=lease_seconds, now=now)
+        for exec_id in renewed:
+            entry = self._status_since.get(exec_id)
+            if entry is not None:
+                self._ready_since[entry[2]] = now + lease_seconds
+        return renewed
+
+    def mark_started(self, exec_id: str) -> None:
+        self._store.mark_started(exec_id)
+        self._moved(exec_id, "IN_PROGRESS")
+
+    def apply_effect(self, *, exec_id: str, enforce_idempotent_commit: bool) -> bool:
+        started = time.perf_counter()
+        committed = self._store.apply_effect(exec_id=exec_id, enforce_idempotent_commit=enforce_idempotent_commit)
+        self._call_seconds["apply_effect"].record(time.perf_counter() - started)
+        if committed:
+            self.metrics.inc("effects_committed_total")
+            self._moved(exec_id, "COMMITTED")
+        else:
+            self.metrics.inc("commit_conflicts_total")
+        return committed
+
+    def mark_finished(self, exec_id: str) -> None:
+        started = time.perf_counter()
+        self._store.mark_finished(exec_id)
+        self._call_seconds["mark_finished"].record(time.perf_counter() - started)
+        self._moved(exec_id, "DONE")
+
+    def mark_aborted(self, exec_id: str) -> None:
+        self._store.mark_aborted(exec_id)
+        self._moved(exec_id, "ABORTED")
+
+    def mark_failed(self, exec_id: str) -> None:
+        self._store.mark_failed(exec_id)
+        self._moved(exec_id, "ABORTED")
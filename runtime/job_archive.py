@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+
+class JobArchive:
+    """Append-only archive of compacted jobs, one JSON object per line.
+
+    Each line holds a terminal job with its payload, state, committed exec id,
+    effect count and full execution history. `append` flushes every batch, so
+    the file is always a sequence of complete lines that readers can stream
+    (`__iter__` memory-maps it) without loading the archive into memory.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: BinaryIO | None = open(path, "ab")
+
+    def append(self, records: Iterable[dict]) -> int:
+        """Append one line per record; returns how many were written."""
+        if self._file is None:
+            raise ValueError("archive is closed")
+        lines = [json.dumps(record, separators=(",", ":")).encode() + b"\n" for record in records]
+        self._file.writelines(lines)
+        self._file.flush()
+        return len(lines)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Stream archived jobs in archive order through a read-only memory map."""
+        if self._file is not None:
+            self._file.flush()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+        with open(self.path, "rb") as archived, mmap.mmap(archived.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for line in iter(view.readline, b""):
+                yield json.loads(line)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
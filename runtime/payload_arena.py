@@ -0,0 +1,132 @@
+"""Job payloads kept as serialized bytes in fixed-size segments, decoded on use.
+
+`Store(payload_arena=PayloadArena())` stores each submitted payload once, as
+pickled bytes appended to the arena, and keeps only a small `LazyPayload`
+(segment, offset, length) in the job record. Nothing is decoded until a
+handler reads the payload, so a deep queue holds bytes, not one Python object
+graph per job. With a `directory` the segments are memory-mapped files and
+the kernel may page out payloads of jobs nobody is running yet.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+_SEGMENT_FILE = "payloads-%06d.seg"
+
+
+class PayloadArena:
+    """Append-only arena of serialized payloads in `segment_bytes` segments.
+
+    Segments never move or grow, so `memoryview`s handed out stay valid
+    while later payloads are appended. A payload larger than a segment gets a
+    segment of its own. Not thread-safe on its own: `ConcurrentStore` only
+    appends under its ready lock. Release outstanding views before `close()`.
+    """
+
+    def __init__(self, *, directory: str | None = None, segment_bytes: int = 16 << 20) -> None:
+        if segment_bytes < 1:
+            raise ValueError("segment_bytes must be >= 1")
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.nbytes = 0  # serialized bytes stored
+        self._segments: list[mmap.mmap] = []
+        self._used = 0  # bytes used in the last segment
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _new_segment(self, size: int) -> mmap.mmap:
+        if self.directory is None:
+            segment = mmap.mmap(-1, size)
+        else:
+            path = os.path.join(self.directory, _SEGMENT_FILE % len(self._segments))
+            with open(path, "w+b") as backing:
+                backing.truncate(size)
+                segment = mmap.mmap(backing.fileno(), size)
+        self._segments.append(segment)
+        self._used = 0
+        return segment
+
+    def put(self, payload: dict) -> LazyPayload:
+        """Serialize `payload` into the arena; returns its lazy handle."""
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        length = len(data)
+        if not self._segments or self._used + length > len(self._segments[-1]):
+            self._new_segment(max(self.segment_bytes, length))
+        index = len(self._segments) - 1
+        offset = self._used
+        self._segments[index][offset : offset + length] = data
+        self._used = offset + length
+        self.nbytes += length
+        return LazyPayload(self, index, offset, length)
+
+    def view(self, segment: int, offset: int, length: int) -> memoryview:
+        """Read-only, zero-copy view of one payload's bytes."""
+        return memoryview(self._segments[segment])[offset : offset + length].toreadonly()
+
+    def load(self, segment: int, offset: int, length: int) -> dict:
+        with self.view(segment, offset, length) as data:
+            return pickle.loads(data)
+
+    def close(self) -> None:
+        for segment in self._segments:
+            segment.close()
+        self._segments.clear()
+
+
+class LazyPayload(Mapping[str, Any]):
+    """A job payload as it sits in a `PayloadArena`: where its bytes are.
+
+    Reads like the original dict; the first key access decodes it (once).
+    `view()` gives the raw serialized bytes without decoding, for handlers
+    that forward them. Pickles as the plain dict, e.g. into a `WalStore` log
+    or to a worker process.
+    """
+
+    __slots__ = ("_arena", "_segment", "_offset", "_length", "_decoded")
+
+    def __init__(self, arena: PayloadArena, segment: int, offset: int, length: int) -> None:
+        self._arena = arena
+        self._segment = segment
+        self._offset = offset
+        self._length = length
+        self._decoded: dict | None = None
+
+    @property
+    def decoded(self) -> bool:
+        return self._decoded is not None
+
+    @property
+    def nbytes(self) -> int:
+        return self._length
+
+    def view(self) -> memoryview:
+        return self._arena.view(self._segment, self._offset, self._length)
+
+    def load(self) -> dict:
+        """A freshly decoded copy of the payload (not cached)."""
+        return self._arena.load(self._segment, self._offset, self._length)
+
+    def _payload(self) -> dict:
+        if self._decoded is None:
+            self._decoded = self.load()
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        return self._payload()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._payload())
+
+    def __len__(self) -> int:
+        return len(self._payload())
+
+    def __reduce__(self) -> tuple:
+        return dict, (self.load() if self._decoded is None else self._decoded,)
+
+    def __repr__(self) -> str:
+        return f"LazyPayload(segment={self._segment}, offset={self._offset}, length={self._length})"
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from policies.commit import commit_effect_idempotent
+from runtime.clock import SystemClock
+from runtime.queue import Queue
+from runtime.sharded_queue import ShardedQueue
+from runtime.store import Store
+
+SyncHandler = Callable[[dict], None]
+
+
+@dataclass(frozen=True)
+class ProcessStats:
+    """Outcome counters reported by one worker process."""
+
+    worker_id: str
+    committed: int
+    duplicates: int
+    failed: int
+
+
+def _drain(*, path: str, worker_id: str, handler: SyncHandler, lease_seconds: int, batch_size: int) -> ProcessStats:
+    """Worker-process body: lease, run, commit until nothing is leasable."""
+    store = Store.sqlite(path, clock=SystemClock())
+    queue = Queue(store=store, clock=store.clock, lease_seconds=lease_seconds)
+    committed = duplicates = failed = 0
+    try:
+        while leases := queue.lease_many(worker_id=worker_id, max_jobs=batch_size):
+            for lease in leases:
+                store.mark_started(lease.exec_id)
+                try:
+                    handler(store.jobs[lease.job_id]["payload"])
+                except Exception:
+                    # Crash before commit: no effect applied, the lease will expire.
+                    failed += 1
+                    continue
+                if commit_effect_idempotent(store=store, exec_id=lease.exec_id).committed:
+                    store.mark_finished(lease.exec_id)
+                    committed += 1
+                else:
+                    duplicates += 1
+    finally:
+        store.close()
+    return ProcessStats(worker_id=worker_id, committed=committed, duplicates=duplicates, failed=failed)
+
+
+def run_process_pool(
+    *,
+    path: str,
+    handler: SyncHandler,
+    processes: int,
+    lease_seconds: int,
+    batch_size: int = 16,
+) -> list[ProcessStats]:
+    """Drain the SQLite store at `path` with `processes` worker processes.
+
+    Each process opens its own connection to the shared database. Leasing
+    (`acquire_leases`) and commits (`commits` primary key) are single IMMEDIATE
+    transactions, so no unexpired job is leased twice and INV_001 holds across
+    processes. Leases use `SystemClock` so expiry agrees between processes.
+    `handler` must be picklable (a module-level function).
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+        futures = [
+            executor.submit(
+                _drain,
+                path=path,
+                worker_id=f"proc-{n}",
+                handler=handler,
+                lease_seconds=lease_seconds,
+                batch_size=batch_size,
+            )
+            for n in range(processes)
+        ]
+        return [future.result() for future in futures]
+
+
+def _drain_sharded(
+    *, paths: list[str], home: int, worker_id: str, handler: SyncHandler, lease_seconds: int, batch_size: int
+) -> ProcessStats:
+    """Sharded worker-process body: drain the home shard, then steal from the rest."""
+    stores = [Store.sqlite(path, clock=SystemClock()) for path in paths]
+    queue = ShardedQueue(stores=stores, clock=stores[0].clock, lease_seconds=lease_seconds)
+    queue.pin_worker(worker_id, home)
+    router = queue.store
+    committed = duplicates = failed = 0
+    try:
+        while leases := queue.lease_many(worker_id=worker_id, max_jobs=batch_size):
+            for lease in leases:
+                router.mark_started(lease.exec_id)
+                try:
+                    handler(router.jobs[lease.job_id]["payload"])
+                except Exception:
+                    failed += 1
+                    continue
+                if commit_effect_idempotent(store=router, exec_id=lease.exec_id).committed:
+                    router.mark_finished(lease.exec_id)
+                    committed += 1
+                else:
+                    duplicates += 1
+    finally:
+        for store in stores:
+            store.close()
+    return ProcessStats(worker_id=worker_id, committed=committed, duplicates=duplicates, failed=failed)
+
+
+def run_sharded_process_pool(
+    *,
+    paths: list[str],
+    handler: SyncHandler,
+    processes: int,
+    lease_seconds: int,
+    batch_size: int = 16,
+) -> list[ProcessStats]:
+    """Drain K SQLite shard files (`paths`) with `processes` worker processes.
+
+    Process `n` is homed on shard `n % K`, so with `processes == K` each
+    database file has one writer and leasing never waits on another
+    process's write lock; a process whose shard runs dry steals from the
+    others (`ShardedQueue.lease_many`), where the per-file transactions of
+    `run_process_pool` keep INV_001. Fill the shards through a
+    `ShardedQueue` over the same paths.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+        futures = [
+            executor.submit(
+                _drain_sharded,
+                paths=list(paths),
+                home=n % len(paths),
+                worker_id=f"proc-{n}",
+                handler=handler,
+                lease_seconds=lease_seconds,
+                batch_size=batch_size,
+            )
+            for n in range(processes)
+        ]
+        return [future.result() for future in futures]
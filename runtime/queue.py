@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from runtime.clock import Clock
 from runtime.store import Store
 
+if TYPE_CHECKING:
+    from policies.idempotency import IdempotencyIndex
+    from runtime.instrumentation import Metrics
+
 
 @dataclass(frozen=True)
 class Lease:
@@ -16,23 +23,102 @@ class Lease:
 class Queue:
     """Minimal queue with at-least-once lease semantics for FM_001."""
 
-    def __init__(self, *, store: Store, clock: Clock, lease_seconds: int) -> None:
+    def __init__(
+        self,
+        *,
+        store: Store,
+        clock: Clock,
+        lease_seconds: int,
+        idempotency: "IdempotencyIndex | None" = None,
+        metrics: "Metrics | None" = None,
+    ) -> None:
         self.store = store
         self.clock = clock
         self.lease_seconds = lease_seconds
+        self.idempotency = idempotency
+        self.metrics = metrics
+        self._heartbeats: dict[str, None] = {}
+
+    def submit_job(self, *, payload: dict, idempotency_key: str | None = None) -> str:
+        """Create a job; a repeated `idempotency_key` returns the original job id instead.
+
+        Keys are only honoured while the queue's `IdempotencyIndex` remembers them.
+        """
+        if idempotency_key is None:
+            return self.store.create_job(payload=payload)
+        if self.idempotency is None:
+            raise ValueError("idempotency_key requires a Queue with an IdempotencyIndex")
+        job_id = self.idempotency.get(idempotency_key)
+        if job_id is None:
+            job_id = self.store.create_job(payload=payload)
+            self.idempotency.put(idempotency_key, job_id)
+        return job_id
 
-    def submit_job(self, *, payload: dict) -> str:
-        return self.store.create_job(payload=payload)
+    def submit_jobs(self, *, payloads: Iterable[dict]) -> Sequence[str]:
+        """Bulk submit; ids come back as a lazily rendered contiguous range."""
+        return self.store.create_jobs(payloads=payloads)
 
     def lease(self, *, worker_id: str) -> Lease | None:
-        now = self.clock.now()
-        for job_id in self.store.job_order:
-            if self.store.can_lease(job_id=job_id, now=now):
-                exec_id = self.store.create_lease(
-                    job_id=job_id,
-                    worker_id=worker_id,
-                    lease_seconds=self.lease_seconds,
-                )
-                return Lease(exec_id=exec_id, job_id=job_id, worker_id=worker_id)
-        return None
+        leases = self.lease_many(worker_id=worker_id, max_jobs=1)
+        return leases[0] if leases else None
+
+    def lease_many(self, *, worker_id: str, max_jobs: int) -> list[Lease]:
+        """Lease up to `max_jobs` jobs in one pass, in submit order.
+
+        Equivalent to `max_jobs` sequential `lease()` calls at the same instant:
+        a job leased here holds an unexpired lease, so it is never handed out twice.
+        Selection and lease creation are one store step (`acquire_leases`).
+        """
+        if self.metrics is None:
+            return self._lease_many(worker_id=worker_id, max_jobs=max_jobs)
+        started = time.perf_counter()
+        leases = self._lease_many(worker_id=worker_id, max_jobs=max_jobs)
+        self.metrics.observe("queue_lease_seconds", time.perf_counter() - started)
+        if not leases:
+            self.metrics.inc("queue_empty_polls_total")
+        return leases
+
+    def _lease_many(self, *, worker_id: str, max_jobs: int) -> list[Lease]:
+        acquired = self.store.acquire_leases(
+            worker_id=worker_id,
+            lease_seconds=self.lease_seconds,
+            now=self.clock.now(),
+            limit=max_jobs,
+        )
+        return [Lease(exec_id=exec_id, job_id=job_id, worker_id=worker_id) for job_id, exec_id in acquired]
+
+    def fail(self, lease: Lease) -> None:
+        """Report that the attempt failed before commit; the store schedules the retry.
+
+        Without a retry policy the job is leasable again immediately; with one it
+        waits out the backoff, or is dead-lettered once the budget is spent.
+        """
+        self.store.mark_failed(lease.exec_id)
+
+    def renew(self, lease: Lease) -> bool:
+        """Extend one live lease now; False if it expired, finished or was superseded."""
+        return lease.exec_id in self.renew_many([lease])
+
+    def renew_many(self, leases: list[Lease]) -> set[str]:
+        """Extend many leases in a single store update; returns the renewed exec ids."""
+        if not leases:
+            return set()
+        renewed = self.store.renew_leases(
+            exec_ids=[lease.exec_id for lease in leases],
+            lease_seconds=self.lease_seconds,
+            now=self.clock.now(),
+        )
+        return set(renewed)
+
+    def heartbeat(self, lease: Lease) -> None:
+        """Record that `lease` is still being worked on; applied by `flush_heartbeats`."""
+        self._heartbeats[lease.exec_id] = None
 
+    def flush_heartbeats(self) -> set[str]:
+        """Coalesce every heartbeat since the last flush into one `renew_leases` write."""
+        if not self._heartbeats:
+            return set()
+        exec_ids = list(self._heartbeats)
+        self._heartbeats.clear()
+        renewed = self.store.renew_leases(exec_ids=exec_ids, lease_seconds=self.lease_seconds, now=self.clock.now())
+        return set(renewed)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import heapq
+from bisect import insort
+from collections import deque
+from collections.abc import Mapping
+from typing import Callable
+
+
+class ReadySet:
+    """Index of leasable jobs so `Queue.lease` never rescans finished history.
+
+    Two sources feed leasing:
+    - a FIFO of never-leased (PENDING) jobs, in submit order;
+    - a min-heap of leased jobs keyed by `ready_at`: when the job may be leased
+      again (lease expiry, plus the retry backoff if a `RetryPolicy` is set).
+
+    Expired heap entries are moved into a submit-ordered heap, so the job handed
+    out is always the earliest submitted leasable job (same order as scanning
+    `job_order`). Entries are validated lazily by the store: anything that went
+    stale (finished, re-leased) is discarded when it reaches the front. A job
+    can have several entries (one per renewal); they sort next to each other in
+    the submit-ordered heap, so once one is offered the rest are skipped.
+    """
+
+    def __init__(self) -> None:
+        self._pending: deque[tuple[int, str]] = deque()
+        self._leased: list[tuple[float, int, str, str]] = []
+        self._expired: list[tuple[int, str, str]] = []
+
+    def add_pending(self, *, seq: int, job_id: str) -> None:
+        self._pending.append((seq, job_id))
+
+    def add_lease(self, *, seq: int, job_id: str, exec_id: str, ready_at: float) -> None:
+        heapq.heappush(self._leased, (ready_at, seq, job_id, exec_id))
+
+    def pop_many(
+        self,
+        *,
+        now: float,
+        limit: int,
+        is_leasable: Callable[[str, str | None], bool],
+    ) -> list[str]:
+        """Remove and return up to `limit` leasable jobs in submit order.
+
+        `is_leasable(job_id, exec_id)` confirms an entry still reflects the
+        job's latest execution (`exec_id` is None for never-leased jobs).
+        """
+        leased = self._leased
+        expired = self._expired
+        while leased and leased[0][0] <= now:
+            _, seq, job_id, exec_id = heapq.heappop(leased)
+            heapq.heappush(expired, (seq, job_id, exec_id))
+
+        pending = self._pending
+        popped: list[str] = []
+        while len(popped) < limit and (pending or expired):
+            if expired and (not pending or expired[0][0] < pending[0][0]):
+                _, job_id, exec_id = heapq.heappop(expired)
+                if (not popped or popped[-1] != job_id) and is_leasable(job_id, exec_id):
+                    popped.append(job_id)
+            else:
+                _, job_id = pending.popleft()
+                if is_leasable(job_id, None):
+                    popped.append(job_id)
+        return popped
+
+    def next_ready_at(self) -> float | None:
+        """Earliest time an entry could be offered (stale ones included); None if empty."""
+        if self._pending or self._expired:
+            return float("-inf")
+        if self._leased:
+            return self._leased[0][0]
+        return None
+
+
+class _Flow:
+    __slots__ = ("ready", "order", "stride", "pass_", "state")
+
+    def __init__(self, *, order: int, stride: float) -> None:
+        self.ready = ReadySet()
+        self.order = order
+        self.stride = stride
+        self.pass_ = 0.0
+        self.state = "idle"
+
+
+class FairReadySet:
+    """Ready index that shares leases across tenants by weight instead of FIFO.
+
+    Each `(priority, tenant)` flow keeps its own `ReadySet`, so jobs within a
+    flow keep submit order and expiry semantics. Higher priorities are served
+    first; within a priority, flows are picked by stride scheduling: the flow
+    with the lowest virtual pass leases next and then advances by
+    `1 / weight`. A flow that went idle rejoins at the current virtual time, so
+    it gets its share from now on but no credit for the time it had no work.
+
+    Flows wait in a timer heap until their earliest entry is due, so picking
+    a job costs O(log T) in the number of flows plus the flow's own O(log n).
+    """
+
+    def __init__(
+        self,
+        *,
+        flow_of: Callable[[str], tuple[int, str]],
+        weights: Mapping[str, float] | None = None,
+    ) -> None:
+        self._flow_of = flow_of
+        self._weights = dict(weights or {})
+        self._flows: dict[tuple[int, str], _Flow] = {}
+        # Per priority: heap of (pass, order, key) for flows with due work, and its virtual time.
+        self._active: dict[int, list[tuple[float, int, tuple[int, str]]]] = {}
+        self._virtual_time: dict[int, float] = {}
+        self._priorities: list[int] = []
+        self._waiting: list[tuple[float, int, tuple[int, str]]] = []
+
+    def __getstate__(self) -> dict:
+        # `flow_of` usually reads the owning store; the owner rebinds it after loading.
+        return {**self.__dict__, "_flow_of": None}
+
+    def _flow(self, job_id: str) -> tuple[tuple[int, str], _Flow]:
+        key = self._flow_of(job_id)
+        flow = self._flows.get(key)
+        if flow is None:
+            priority, tenant = key
+            flow = self._flows[key] = _Flow(order=len(self._flows), stride=1.0 / self._weights.get(tenant, 1.0))
+            if priority not in self._active:
+                self._active[priority] = []
+                self._virtual_time[priority] = 0.0
+                insort(self._priorities, priority)
+        return key, flow
+
+    def _schedule(self, key: tuple[int, str], flow: _Flow, ready_at: float) -> None:
+        # Duplicate waiting entries are fine: `_wake` re-checks the flow.
+        if flow.state != "active":
+            flow.state = "waiting"
+            heapq.heappush(self._waiting, (ready_at, flow.order, key))
+
+    def add_pending(self, *, seq: int, job_id: str) -> None:
+        key, flow = self._flow(job_id)
+        flow.ready.add_pending(seq=seq, job_id=job_id)
+        self._schedule(key, flow, float("-inf"))
+
+    def add_lease(self, *, seq: int, job_id: str, exec_id: str, ready_at: float) -> None:
+        key, flow = self._flow(job_id)
+        flow.ready.add_lease(seq=seq, job_id=job_id, exec_id=exec_id, ready_at=ready_at)
+        self._schedule(key, flow, ready_at)
+
+    def _park(self, key: tuple[int, str], flow: _Flow, now: float) -> None:
+        """Put a flow back in the active heap, the timer heap, or nowhere (idle)."""
+        ready_at = flow.ready.next_ready_at()
+        if ready_at is None:
+            flow.state = "idle"
+        elif ready_at <= now:
+            flow.state = "active"
+            heapq.heappush(self._active[key[0]], (flow.pass_, flow.order, key))
+        else:
+            flow.state = "waiting"
+            heapq.heappush(self._waiting, (ready_at, flow.order, key))
+
+    def _wake(self, now: float) -> None:
+        waiting = self._waiting
+        while waiting and waiting[0][0] <= now:
+            _, _, key = heapq.heappop(waiting)
+            flow = self._flows[key]
+            if flow.state != "waiting":
+                continue
+            flow.pass_ = max(flow.pass_, self._virtual_time[key[0]])
+            self._park(key, flow, now)
+
+    def pop_many(
+        self,
+        *,
+        now: float,
+        limit: int,
+        is_leasable: Callable[[str, str | None], bool],
+    ) -> list[str]:
+        """Remove and return up to `limit` leasable jobs, one fair pick at a time."""
+        self._wake(now)
+        popped: list[str] = []
+        while len(popped) < limit:
+            active = next((self._active[p] for p in reversed(self._priorities) if self._active[p]), None)
+            if active is None:
+                break
+            pass_, _, key = heapq.heappop(active)
+            flow = self._flows[key]
+            self._virtual_time[key[0]] = pass_
+            job_ids = flow.ready.pop_many(now=now, limit=1, is_leasable=is_leasable)
+            if job_ids:
+                popped.append(job_ids[0])
+                flow.pass_ = pass_ + flow.stride
+            self._park(key, flow, now)
+        return popped
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import replace
+from typing import Generic, TypeVar
+
+from runtime.clock import Clock
+from runtime.queue import Lease, Queue
+from runtime.store import ExecutionRecord, Store
+
+V = TypeVar("V")
+
+_SEP = ":"
+
+
+def shard_id(shard: int, local_id: str) -> str:
+    """Global id of a shard-local job or execution id: `"<shard>:<local id>"`."""
+    return f"{shard}{_SEP}{local_id}"
+
+
+def split_id(global_id: str) -> tuple[int, str]:
+    """Inverse of `shard_id`."""
+    shard, _, local_id = global_id.partition(_SEP)
+    return int(shard), local_id
+
+
+class _ShardedView(Mapping[str, V], Generic[V]):
+    """Read-only view of one per-store mapping across shards, keyed by global id."""
+
+    def __init__(self, stores: Sequence[Store], attribute: str, wrap: Callable[[int, V], V]) -> None:
+        self._stores = stores
+        self._attribute = attribute
+        self._wrap = wrap
+
+    def __getitem__(self, global_id: str) -> V:
+        shard, local_id = split_id(global_id)
+        return self._wrap(shard, getattr(self._stores[shard], self._attribute)[local_id])
+
+    def __iter__(self) -> Iterator[str]:
+        for shard, store in enumerate(self._stores):
+            for local_id in getattr(store, self._attribute):
+                yield shard_id(shard, local_id)
+
+    def __len__(self) -> int:
+        return sum(len(getattr(store, self._attribute)) for store in self._stores)
+
+
+def _global_record(shard: int, record: ExecutionRecord) -> ExecutionRecord:
+    return replace(record, exec_id=shard_id(shard, record.exec_id), job_id=shard_id(shard, record.job_id))
+
+
+class ShardRouter:
+    """Store facade that routes per-execution transitions to the owning shard.
+
+    Hand it to `Worker` (or `commit_effect_idempotent`) in place of a store:
+    every method takes global ids from `ShardedQueue` leases and calls the
+    shard's own store, so the commit boundary (INV_001) and monotonic
+    transitions (INV_003) are enforced inside one shard, exactly as unsharded.
+    """
+
+    def __init__(self, stores: Sequence[Store]) -> None:
+        self.stores = stores
+        self.jobs: Mapping[str, dict] = _ShardedView(stores, "jobs", lambda shard, job: job)
+        # Records are copies carrying global ids; mutate state through the methods below.
+        self.executions: Mapping[str, ExecutionRecord] = _ShardedView(stores, "executions", _global_record)
+
+    def _route(self, global_id: str) -> tuple[Store, str]:
+        shard, local_id = split_id(global_id)
+        return self.stores[shard], local_id
+
+    def flush(self) -> None:
+        for store in self.stores:
+            store.flush()
+
+    def mark_started(self, exec_id: str) -> None:
+        store, local_id = self._route(exec_id)
+        store.mark_started(local_id)
+
+    def apply_effect(self, *, exec_id: str, enforce_idempotent_commit: bool) -> bool:
+        store, local_id = self._route(exec_id)
+        return store.apply_effect(exec_id=local_id, enforce_idempotent_commit=enforce_idempotent_commit)
+
+    def mark_finished(self, exec_id: str) -> None:
+        store, local_id = self._route(exec_id)
+        store.mark_finished(local_id)
+
+    def mark_aborted(self, exec_id: str) -> None:
+        store, local_id = self._route(exec_id)
+        store.mark_aborted(local_id)
+
+    def mark_failed(self, exec_id: str) -> None:
+        store, local_id = self._route(exec_id)
+        store.mark_failed(local_id)
+
+    def count_effects(self, job_id: str) -> int:
+        store, local_id = self._route(job_id)
+        return store.count_effects(local_id)
+
+    def get_committed_exec_id(self, job_id: str) -> str | None:
+        shard, local_id = split_id(job_id)
+        committed = self.stores[shard].get_committed_exec_id(local_id)
+        return None if committed is None else shard_id(shard, committed)
+
+
+class ShardedQueue:
+    """One queue API over K independent Store/Queue shards.
+
+    A job is placed by hashing its payload's `partition_key` value (jobs with
+    the same key share a shard and its FIFO order), or round-robin when the
+    payload has no such key. Ids are global: `"<shard>:<local id>"`.
+
+    Each worker has a home shard (`home_shard`): it leases there first and
+    steals from the other shards, in ring order, only for what its home shard
+    could not supply. Shards share nothing, so K processes each homed on a
+    different shard (e.g. separate SQLite files) never contend on one
+    `job_order` scan or one write lock; per-job invariants need no
+    cross-shard coordination because a job lives in exactly one shard.
+    Reconcile each shard's store on its own.
+    """
+
+    def __init__(
+        self,
+        *,
+        stores: Sequence[Store],
+        clock: Clock,
+        lease_seconds: int,
+        partition_key: str | None = None,
+    ) -> None:
+        if not stores:
+            raise ValueError("a sharded queue needs at least one store")
+        self.stores = list(stores)
+        self.shards = [Queue(store=store, clock=clock, lease_seconds=lease_seconds) for store in self.stores]
+        self.clock = clock
+        self.lease_seconds = lease_seconds
+        self.partition_key = partition_key
+        self.store = ShardRouter(self.stores)
+        self.steals = 0
+        self._next_shard = 0
+        self._homes: dict[str, int] = {}
+
+    def shard_for(self, payload: dict) -> int:
+        """Shard a new job with `payload` goes to."""
+        if self.partition_key is not None and self.partition_key in payload:
+            key = str(payload[self.partition_key]).encode()
+            return zlib.crc32(key) % len(self.shards)
+        shard = self._next_shard
+        self._next_shard = (shard + 1) % len(self.shards)
+        return shard
+
+    def home_shard(self, worker_id: str) -> int:
+        """Stable shard affinity for `worker_id` (a hash of the id)."""
+        home = self._homes.get(worker_id)
+        if home is None:
+            home = self._homes[worker_id] = zlib.crc32(worker_id.encode()) % len(self.shards)
+        return home
+
+    def pin_worker(self, worker_id: str, shard: int) -> None:
+        """Override the hashed home shard, e.g. one worker process per shard."""
+        if not 0 <= shard < len(self.shards):
+            raise ValueError(f"no shard {shard}")
+        self._homes[worker_id] = shard
+
+    def submit_job(self, *, payload: dict) -> str:
+        shard = self.shard_for(payload)
+        return shard_id(shard, self.shards[shard].submit_job(payload=payload))
+
+    def submit_jobs(self, *, payloads: Iterable[dict]) -> list[str]:
+        """Bulk submit: one `submit_jobs` per shard; ids come back in payload order."""
+        batches: list[list[dict]] = [[] for _ in self.shards]
+        order: list[int] = []
+        for payload in payloads:
+            shard = self.shard_for(payload)
+            batches[shard].append(payload)
+            order.append(shard)
+        local_ids = [iter(queue.submit_jobs(payloads=batch)) for queue, batch in zip(self.shards, batches)]
+        return [shard_id(shard, next(local_ids[shard])) for shard in order]
+
+    def lease(self, *, worker_id: str) -> Lease | None:
+        leases = self.lease_many(worker_id=worker_id, max_jobs=1)
+        return leases[0] if leases else None
+
+    def lease_many(self, *, worker_id: str, max_jobs: int) -> list[Lease]:
+        """Lease up to `max_jobs`: home shard first, then steal around the ring."""
+        home = self.home_shard(worker_id)
+        count = len(self.shards)
+        leases: list[Lease] = []
+        for offset in range(count):
+            if len(leases) >= max_jobs:
+                break
+            shard = (home + offset) % count
+            taken = self.shards[shard].lease_many(worker_id=worker_id, max_jobs=max_jobs - len(leases))
+            if taken and offset:
+                self.steals += len(taken)
+            leases.extend(
+                Lease(exec_id=shard_id(shard, lease.exec_id), job_id=shard_id(shard, lease.job_id), worker_id=worker_id)
+                for lease in taken
+            )
+        return leases
+
+    def _local(self, lease: Lease) -> tuple[int, Lease]:
+        shard, exec_id = split_id(lease.exec_id)
+        return shard, Lease(exec_id=exec_id, job_id=split_id(lease.job_id)[1], worker_id=lease.worker_id)
+
+    def fail(self, lease: Lease) -> None:
+        shard, local = self._local(lease)
+        self.shards[shard].fail(local)
+
+    def renew_many(self, leases: list[Lease]) -> set[str]:
+        """Renew leases with one store write per shard involved."""
+        by_shard: dict[int, list[Lease]] = {}
+        for lease in leases:
+            shard, local = self._local(lease)
+            by_shard.setdefault(shard, []).append(local)
+        renewed: set[str] = set()
+        for shard, local_leases in by_shard.items():
+            renewed.update(shard_id(shard, exec_id) for exec_id in self.shards[shard].renew_many(local_leases))
+        return renewed
+
+    def renew(self, lease: Lease) -> bool:
+        return lease.exec_id in self.renew_many([lease])
+
+    def heartbeat(self, lease: Lease) -> None:
+        shard, local = self._local(lease)
+        self.shards[shard].heartbeat(local)
+
+    def flush_heartbeats(self) -> set[str]:
+        """Flush every shard's coalesced heartbeats (one renew write per shard)."""
+        renewed: set[str] = set()
+        for shard, queue in enumerate(self.shards):
+            renewed.update(shard_id(shard, exec_id) for exec_id in queue.flush_heartbeats())
+        return renewed
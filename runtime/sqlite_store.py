@@ -0,0 +1,542 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from runtime.clock import Clock
+from runtime.store import ExecutionRecord, JobIdRange, _job_seq
+
+if TYPE_CHECKING:
+    from policies.retry import RetryPolicy
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq INTEGER PRIMARY KEY,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    latest_exec_seq INTEGER,
+    -- When the job becomes leasable: created_at while PENDING, the latest
+    -- lease's expiry (plus retry backoff) while leased, NULL once the latest
+    -- execution is DONE or the job is dead-lettered.
+    ready_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (seq, ready_at) WHERE ready_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state);
+
+CREATE TABLE IF NOT EXISTS executions (
+    seq INTEGER PRIMARY KEY,
+    job_seq INTEGER NOT NULL REFERENCES jobs (seq),
+    attempt INTEGER NOT NULL,
+    lease_owner TEXT NOT NULL,
+    lease_expires_at REAL NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS executions_job ON executions (job_seq, seq);
+CREATE INDEX IF NOT EXISTS executions_status ON executions (status, lease_expires_at);
+
+-- One row per job: the primary key is the first-committer-wins rule (INV_001).
+CREATE TABLE IF NOT EXISTS commits (
+    job_seq INTEGER PRIMARY KEY,
+    exec_seq INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS effects (
+    seq INTEGER PRIMARY KEY,
+    job_seq INTEGER NOT NULL,
+    exec_seq INTEGER NOT NULL,
+    applied_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS effects_job ON effects (job_seq);
+"""
+
+_SELECT_EXECUTION = (
+    "SELECT seq, job_seq, attempt, lease_owner, lease_expires_at, status FROM executions"
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def _exec_seq(exec_id: str) -> int:
+    return int(exec_id.removeprefix("exec-"))
+
+
+def _execution_record(row: tuple) -> ExecutionRecord:
+    seq, job_seq, attempt, lease_owner, lease_expires_at, status = row
+    return ExecutionRecord(
+        exec_id=f"exec-{seq}",
+        job_id=f"job-{job_seq}",
+        attempt=attempt,
+        lease_owner=lease_owner,
+        lease_expires_at=lease_expires_at,
+        status=status,
+    )
+
+
+class _RowMapping(Mapping[K, V], Generic[K, V]):
+    """Read-only snapshot view so callers can keep using `store.jobs[job_id]` style reads."""
+
+    def __init__(
+        self,
+        *,
+        get: Callable[[K], V | None],
+        items: Callable[[], list[tuple[K, V]]],
+        count: Callable[[], int],
+    ) -> None:
+        self._get = get
+        self._items = items
+        self._count = count
+
+    def __getitem__(self, key: K) -> V:
+        value = self._get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[K]:
+        return (key for key, _ in self._items())
+
+    def __len__(self) -> int:
+        return self._count()
+
+    def items(self):  # type: ignore[override]
+        # Materialized so callers may write to the store while iterating.
+        return self._items()
+
+
+@dataclass(frozen=True)
+class GroupCommit:
+    """Opt-in write batching: buffer transitions and commit them in one transaction.
+
+    A batch is committed once it holds `max_records` transitions or is
+    `max_delay_seconds` old, or when `flush()` is called. Age is measured on a
+    monotonic clock, not the store's `Clock`, and checked on every write and
+    read; a lease poll that finds nothing to lease flushes at once. An open
+    batch holds SQLite's write lock, so other processes wait on it.
+    Larger values trade acknowledgment latency for throughput.
+    """
+
+    max_records: int = 256
+    max_delay_seconds: float = 0.005
+
+
+class SqliteStore:
+    """SQLite-backed durable Store with the same interface as the in-memory model.
+
+    - WAL journal, `synchronous=FULL`: every acknowledged transition is on disk.
+    - `jobs.ready_at` (partial index) replaces the in-memory ready-set.
+    - `commits.job_seq` primary key enforces first-committer-wins atomically.
+
+    `jobs`, `executions` and `execs_by_job` are read-only snapshot views; all
+    writes go through the transition methods.
+
+    With `group_commit`, transitions share one transaction until the batch is
+    flushed. Nothing in an unflushed batch is durable, so callers must `flush()`
+    before acknowledging a COMMITTED boundary (see `Worker.finish`). A crash
+    loses the whole batch atomically, which leaves the previous consistent state.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        clock: Clock,
+        group_commit: GroupCommit | None = None,
+        retry: "RetryPolicy | None" = None,
+    ) -> None:
+        self.path = path
+        self.clock = clock
+        self.group_commit = group_commit
+        self.retry = retry
+        self._batch_records = 0
+        self._batch_deadline = 0.0  # monotonic time by which the open batch must be flushed
+        self._conn = sqlite3.connect(path, isolation_level=None, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(_SCHEMA)
+        self.jobs: Mapping[str, dict] = _RowMapping(
+            get=self._get_job,
+            items=lambda: [(job["job_id"], job) for job in self._all_jobs()],
+            count=lambda: self._query("SELECT COUNT(*) FROM jobs").fetchone()[0],
+        )
+        self.executions: Mapping[str, ExecutionRecord] = _RowMapping(
+            get=self._get_execution,
+            items=self._all_executions,
+            count=lambda: self._query("SELECT COUNT(*) FROM executions").fetchone()[0],
+        )
+        self.execs_by_job: Mapping[str, list[str]] = _RowMapping(
+            get=self._get_exec_ids,
+            items=lambda: [(job_id, self._get_exec_ids(job_id) or []) for job_id in self.job_order],
+            count=lambda: self._query("SELECT COUNT(*) FROM jobs").fetchone()[0],
+        )
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def flush(self) -> None:
+        """Commit the buffered group-commit batch, if any; a no-op otherwise."""
+        if self._conn.in_transaction:
+            self._conn.execute("COMMIT")
+        self._batch_records = 0
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """One transition, atomic on its own.
+
+        Without group commit this is one IMMEDIATE transaction (write lock taken
+        up front). With group commit it is a savepoint inside the open batch.
+        """
+        conn = self._conn
+        if self.group_commit is None:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return
+
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+            self._batch_deadline = monotonic() + self.group_commit.max_delay_seconds
+        conn.execute("SAVEPOINT transition")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK TO transition")
+            conn.execute("RELEASE transition")
+            raise
+        conn.execute("RELEASE transition")
+        self._batch_records += 1
+        if self._batch_records >= self.group_commit.max_records or monotonic() >= self._batch_deadline:
+            self.flush()
+
+    def _scalar(self, sql: str, params: tuple = ()) -> int:
+        return self._conn.execute(sql, params).fetchone()[0]
+
+    def _query(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """A read outside any transition; flushes a group-commit batch past its deadline first."""
+        if self._conn.in_transaction and monotonic() >= self._batch_deadline:
+            self.flush()
+        return self._conn.execute(sql, params)
+
+    # -- jobs -----------------------------------------------------------------
+
+    def create_job(self, *, payload: dict) -> str:
+        return self.create_jobs(payloads=[payload])[0]
+
+    def create_jobs(self, *, payloads: Iterable[dict]) -> JobIdRange:
+        """Insert one PENDING job per payload under a single transaction."""
+        now = self.clock.now()
+        with self._write() as conn:
+            first_seq = self._scalar("SELECT COALESCE(MAX(seq), 0) FROM jobs") + 1
+            rows = (
+                (seq, json.dumps(payload), now)
+                for seq, payload in enumerate(payloads, start=first_seq)
+            )
+            cursor = conn.executemany(
+                "INSERT INTO jobs (seq, payload, state, ready_at) VALUES (?, ?, 'PENDING', ?)",
+                rows,
+            )
+            inserted = max(cursor.rowcount, 0)
+        return JobIdRange(first_seq, first_seq + inserted)
+
+    @property
+    def job_order(self) -> list[str]:
+        return [f"job-{seq}" for (seq,) in self._query("SELECT seq FROM jobs ORDER BY seq")]
+
+    def _get_job(self, job_id: str) -> dict | None:
+        row = self._query(
+            "SELECT payload, state FROM jobs WHERE seq = ?", (_job_seq(job_id),)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"job_id": job_id, "payload": json.loads(row[0]), "state": row[1]}
+
+    def _all_jobs(self) -> list[dict]:
+        rows = self._query("SELECT seq, payload, state FROM jobs ORDER BY seq").fetchall()
+        return [
+            {"job_id": f"job-{seq}", "payload": json.loads(payload), "state": state}
+            for seq, payload, state in rows
+        ]
+
+    # -- leasing --------------------------------------------------------------
+
+    def can_lease(self, *, job_id: str, now: float) -> bool:
+        row = self._query(
+            "SELECT attempts, ready_at FROM jobs WHERE seq = ?", (_job_seq(job_id),)
+        ).fetchone()
+        if row is None:
+            raise KeyError(job_id)
+        attempts, ready_at = row
+        if attempts == 0:
+            return True
+        if self.retry is not None and not self.retry.allows_retry(attempts):
+            return False
+        return ready_at is not None and ready_at <= now
+
+    def next_leasable_job(self, *, now: float) -> str | None:
+        job_ids = self.next_leasable_jobs(now=now, limit=1)
+        return job_ids[0] if job_ids else None
+
+    def next_leasable_jobs(self, *, now: float, limit: int) -> list[str]:
+        """Earliest submitted leasable jobs, via the partial `jobs_ready` index.
+
+        Unlike the in-memory stores, this does not pop: the jobs stay ready
+        until `create_leases` leases them, so another caller may be handed the
+        same jobs meanwhile. `acquire_leases` selects and leases in one step.
+        """
+        with self._write() as conn:
+            job_ids = self._select_ready(conn, now=now, limit=limit)
+        if not job_ids:
+            self.flush()  # idle poll: do not keep holding the write lock
+        return job_ids
+
+    def _select_ready(self, conn: sqlite3.Connection, *, now: float, limit: int) -> list[str]:
+        """Ready jobs in submit order; jobs whose retry budget is spent are dead-lettered."""
+        job_ids: list[str] = []
+        after = 0
+        while len(job_ids) < limit:
+            rows = conn.execute(
+                "SELECT seq, attempts FROM jobs WHERE ready_at IS NOT NULL AND ready_at <= ? AND seq > ?"
+                " ORDER BY seq LIMIT ?",
+                (now, after, limit - len(job_ids)),
+            ).fetchall()
+            if not rows:
+                break
+            for seq, attempts in rows:
+                if attempts and self.retry is not None and not self.retry.allows_retry(attempts):
+                    # A committed job is already safe; reconcile finalizes it (INV_004).
+                    conn.execute(
+                        "UPDATE jobs SET ready_at = NULL,"
+                        " state = CASE WHEN seq IN (SELECT job_seq FROM commits) THEN state ELSE 'FAILED' END"
+                        " WHERE seq = ?",
+                        (seq,),
+                    )
+                else:
+                    job_ids.append(f"job-{seq}")
+            after = rows[-1][0]
+        return job_ids
+
+    def create_lease(self, *, job_id: str, worker_id: str, lease_seconds: int) -> str:
+        return self.create_leases(job_ids=[job_id], worker_id=worker_id, lease_seconds=lease_seconds)[0]
+
+    def create_leases(self, *, job_ids: list[str], worker_id: str, lease_seconds: int) -> list[str]:
+        with self._write() as conn:
+            return self._insert_leases(conn, job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+
+    def acquire_leases(
+        self,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        now: float,
+        limit: int,
+    ) -> list[tuple[str, str]]:
+        """Select and lease under one IMMEDIATE transaction.
+
+        The write lock is held from the ready-set query to the lease rows, so two
+        processes sharing the database can never lease the same unexpired job.
+        """
+        with self._write() as conn:
+            job_ids = self._select_ready(conn, now=now, limit=limit)
+            if job_ids:
+                exec_ids = self._insert_leases(conn, job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+        if not job_ids:
+            self.flush()  # idle poll: do not keep holding the write lock
+            return []
+        return list(zip(job_ids, exec_ids))
+
+    def _insert_leases(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        job_ids: list[str],
+        worker_id: str,
+        lease_seconds: int,
+    ) -> list[str]:
+        lease_expires_at = self.clock.now() + float(lease_seconds)
+        exec_seq = self._scalar("SELECT COALESCE(MAX(seq), 0) FROM executions")
+        exec_ids: list[str] = []
+        for job_id in job_ids:
+            exec_seq += 1
+            job_seq = _job_seq(job_id)
+            ready_at = lease_expires_at
+            if self.retry is not None:
+                attempt = self._scalar("SELECT attempts FROM jobs WHERE seq = ?", (job_seq,)) + 1
+                ready_at += self.retry.delay_seconds(job_id=job_id, attempt=attempt)
+            conn.execute(
+                "UPDATE jobs SET state = 'RUNNING', attempts = attempts + 1,"
+                " latest_exec_seq = ?, ready_at = ? WHERE seq = ?",
+                (exec_seq, ready_at, job_seq),
+            )
+            conn.execute(
+                "INSERT INTO executions (seq, job_seq, attempt, lease_owner, lease_expires_at, status)"
+                " VALUES (?, ?, (SELECT attempts FROM jobs WHERE seq = ?), ?, ?, 'LEASED')",
+                (exec_seq, job_seq, job_seq, worker_id, lease_expires_at),
+            )
+            exec_ids.append(f"exec-{exec_seq}")
+        return exec_ids
+
+    # -- execution transitions -------------------------------------------------
+
+    def renew_leases(self, *, exec_ids: list[str], lease_seconds: int, now: float) -> list[str]:
+        """Extend live leases in one transaction (same rules as `Store.renew_leases`)."""
+        lease_expires_at = now + float(lease_seconds)
+        renewed: list[str] = []
+        with self._write() as conn:
+            for exec_id in exec_ids:
+                exec_seq = _exec_seq(exec_id)
+                updated = conn.execute(
+                    "UPDATE executions SET lease_expires_at = ?"
+                    " WHERE seq = ? AND status IN ('LEASED', 'IN_PROGRESS') AND lease_expires_at > ?"
+                    " AND seq = (SELECT latest_exec_seq FROM jobs WHERE jobs.seq = executions.job_seq)",
+                    (lease_expires_at, exec_seq, now),
+                ).rowcount
+                if updated:
+                    conn.execute(
+                        "UPDATE jobs SET ready_at = ? WHERE latest_exec_seq = ?",
+                        (self._ready_at(conn, exec_seq=exec_seq, lease_expires_at=lease_expires_at), exec_seq),
+                    )
+                    renewed.append(exec_id)
+        return renewed
+
+    def _ready_at(self, conn: sqlite3.Connection, *, exec_seq: int, lease_expires_at: float) -> float:
+        """When the job may be leased again if execution `exec_seq` ends without commit."""
+        if self.retry is None:
+            return lease_expires_at
+        job_seq, attempt = conn.execute(
+            "SELECT job_seq, attempt FROM executions WHERE seq = ?", (exec_seq,)
+        ).fetchone()
+        return lease_expires_at + self.retry.delay_seconds(job_id=f"job-{job_seq}", attempt=attempt)
+
+    def mark_started(self, exec_id: str) -> None:
+        with self._write() as conn:
+            conn.execute(
+                "UPDATE executions SET status = 'IN_PROGRESS' WHERE seq = ?", (_exec_seq(exec_id),)
+            )
+
+    def apply_effect(self, *, exec_id: str, enforce_idempotent_commit: bool) -> bool:
+        exec_seq = _exec_seq(exec_id)
+        with self._write() as conn:
+            job_seq = self._scalar("SELECT job_seq FROM executions WHERE seq = ?", (exec_seq,))
+            first = conn.execute(
+                "INSERT OR IGNORE INTO commits (job_seq, exec_seq) VALUES (?, ?)", (job_seq, exec_seq)
+            ).rowcount
+            if enforce_idempotent_commit and not first:
+                return False
+            conn.execute("UPDATE executions SET status = 'COMMITTED' WHERE seq = ?", (exec_seq,))
+            conn.execute(
+                "INSERT INTO effects (job_seq, exec_seq, applied_at) VALUES (?, ?, ?)",
+                (job_seq, exec_seq, self.clock.now()),
+            )
+        return True
+
+    def mark_finished(self, exec_id: str) -> None:
+        exec_seq = _exec_seq(exec_id)
+        with self._write() as conn:
+            conn.execute("UPDATE executions SET status = 'DONE' WHERE seq = ?", (exec_seq,))
+            conn.execute(
+                "UPDATE jobs SET state = 'SUCCEEDED',"
+                " ready_at = CASE WHEN latest_exec_seq = ? THEN NULL ELSE ready_at END"
+                " WHERE seq = (SELECT job_seq FROM executions WHERE seq = ?)",
+                (exec_seq, exec_seq),
+            )
+
+    def mark_aborted(self, exec_id: str) -> None:
+        exec_seq = _exec_seq(exec_id)
+        with self._write() as conn:
+            conn.execute("UPDATE executions SET status = 'ABORTED' WHERE seq = ?", (exec_seq,))
+            conn.execute(
+                "UPDATE jobs SET state = 'PENDING'"
+                " WHERE seq = (SELECT job_seq FROM executions WHERE seq = ?)"
+                " AND seq NOT IN (SELECT job_seq FROM commits) AND state != 'FAILED'",
+                (exec_seq,),
+            )
+
+    def mark_failed(self, exec_id: str) -> None:
+        """End the lease now and schedule the retry (same rules as `Store.mark_failed`)."""
+        exec_seq = _exec_seq(exec_id)
+        now = self.clock.now()
+        with self._write() as conn:
+            job_seq, attempt, lease_expires_at = conn.execute(
+                "SELECT job_seq, attempt, MIN(lease_expires_at, ?) FROM executions WHERE seq = ?",
+                (now, exec_seq),
+            ).fetchone()
+            conn.execute(
+                "UPDATE executions SET status = 'ABORTED', lease_expires_at = ? WHERE seq = ?",
+                (lease_expires_at, exec_seq),
+            )
+            conn.execute(
+                "UPDATE jobs SET state = 'PENDING' WHERE seq = ? AND state != 'FAILED'"
+                " AND seq NOT IN (SELECT job_seq FROM commits)",
+                (job_seq,),
+            )
+            if conn.execute("SELECT 1 FROM commits WHERE job_seq = ?", (job_seq,)).fetchone() is not None:
+                return
+            if self.retry is not None and not self.retry.allows_retry(attempt):
+                state, ready_at = "FAILED", None
+            else:
+                state = "PENDING"
+                ready_at = self._ready_at(conn, exec_seq=exec_seq, lease_expires_at=lease_expires_at)
+            conn.execute(
+                "UPDATE jobs SET state = ?, ready_at = ? WHERE seq = ? AND latest_exec_seq = ? AND state != 'FAILED'",
+                (state, ready_at, job_seq, exec_seq),
+            )
+
+    # -- reads ----------------------------------------------------------------
+
+    @property
+    def effects(self) -> list[tuple[str, str, float]]:
+        rows = self._query("SELECT job_seq, exec_seq, applied_at FROM effects ORDER BY seq")
+        return [(f"job-{job_seq}", f"exec-{exec_seq}", at) for job_seq, exec_seq, at in rows]
+
+    def count_effects(self, job_id: str) -> int:
+        return self._query("SELECT COUNT(*) FROM effects WHERE job_seq = ?", (_job_seq(job_id),)).fetchone()[0]
+
+    def get_committed_exec_id(self, job_id: str) -> str | None:
+        row = self._query(
+            "SELECT exec_seq FROM commits WHERE job_seq = ?", (_job_seq(job_id),)
+        ).fetchone()
+        return None if row is None else f"exec-{row[0]}"
+
+    def list_exec_ids_by_status(self, status: str, *, limit: int | None = None) -> list[str]:
+        rows = self._query(
+            "SELECT seq FROM executions WHERE status = ? ORDER BY seq LIMIT ?",
+            (status, -1 if limit is None else limit),
+        )
+        return [f"exec-{seq}" for (seq,) in rows]
+
+    def count_exec_ids_by_status(self, status: str) -> int:
+        return self._query("SELECT COUNT(*) FROM executions WHERE status = ?", (status,)).fetchone()[0]
+
+    def list_expired_exec_ids(self, *, now: float, limit: int | None = None) -> list[str]:
+        rows = self._query(
+            "SELECT seq FROM executions WHERE status IN ('LEASED', 'IN_PROGRESS')"
+            " AND lease_expires_at <= ? ORDER BY seq LIMIT ?",
+            (now, -1 if limit is None else limit),
+        )
+        return [f"exec-{seq}" for (seq,) in rows]
+
+    def _get_execution(self, exec_id: str) -> ExecutionRecord | None:
+        row = self._query(f"{_SELECT_EXECUTION} WHERE seq = ?", (_exec_seq(exec_id),)).fetchone()
+        return None if row is None else _execution_record(row)
+
+    def _all_executions(self) -> list[tuple[str, ExecutionRecord]]:
+        rows = self._query(f"{_SELECT_EXECUTION} ORDER BY seq").fetchall()
+        return [(record.exec_id, record) for record in map(_execution_record, rows)]
+
+    def _get_exec_ids(self, job_id: str) -> list[str] | None:
+        job_seq = _job_seq(job_id)
+        if self._query("SELECT 1 FROM jobs WHERE seq = ?", (job_seq,)).fetchone() is None:
+            return None
+        rows = self._query("SELECT seq FROM executions WHERE job_seq = ? ORDER BY seq", (job_seq,))
+        return [f"exec-{seq}" for (seq,) in rows]
@@ -1,11 +1,57 @@
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING
 
 from runtime.clock import Clock
+from runtime.effect_log import EffectLog
+from runtime.job_archive import JobArchive
+from runtime.ready_set import FairReadySet, ReadySet
 
+if TYPE_CHECKING:
+    from policies.retry import RetryPolicy
+    from runtime.change_feed import ChangeFeed
+    from runtime.compact_store import CompactStore
+    from runtime.concurrent_store import ConcurrentStore
+    from runtime.payload_arena import PayloadArena
+    from runtime.sqlite_store import GroupCommit, SqliteStore
+    from runtime.wal_store import WalStore
 
-@dataclass
+
+def _job_seq(job_id: str) -> int:
+    return int(job_id.removeprefix("job-"))
+
+
+class JobIdRange(Sequence[str]):
+    """Ids of a contiguous block of jobs, rendered only when read."""
+
+    __slots__ = ("_seqs",)
+
+    def __init__(self, start: int, stop: int) -> None:
+        self._seqs = range(start, stop)
+
+    def __len__(self) -> int:
+        return len(self._seqs)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            seqs = self._seqs[index]
+            if seqs.step != 1:
+                return [f"job-{seq}" for seq in seqs]
+            return JobIdRange(seqs.start, seqs.stop)
+        return f"job-{self._seqs[index]}"
+
+    def __iter__(self) -> Iterator[str]:
+        return (f"job-{seq}" for seq in self._seqs)
+
+    def __repr__(self) -> str:
+        return f"JobIdRange({self._seqs.start}, {self._seqs.stop})"
+
+
+@dataclass(slots=True)
 class ExecutionRecord:
     exec_id: str
     job_id: str
@@ -15,63 +61,400 @@ class ExecutionRecord:
     status: str = "LEASED"
 
 
+_LIVE_STATUSES = frozenset({"LEASED", "IN_PROGRESS"})
+_ARCHIVABLE_STATUSES = frozenset({"DONE", "ABORTED"})
+# Execution transitions docs/02_state_model.md allows (INV_003); DONE and ABORTED are final.
+ALLOWED_TRANSITIONS: dict[str, frozenset[str]] = {
+    "LEASED": frozenset({"IN_PROGRESS", "COMMITTED", "ABORTED"}),
+    "IN_PROGRESS": frozenset({"COMMITTED", "ABORTED"}),
+    "COMMITTED": frozenset({"DONE"}),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Tombstone:
+    """What is left in memory of an archived job until `expires_at`."""
+
+    committed_exec_id: str | None
+    effects: int
+    exec_ids: tuple[str, ...]
+    expires_at: float
+
+
 class Store:
-    """Minimal in-memory durable model used by FM_001 scenario tests."""
+    """Minimal in-memory durable model used by FM_001 scenario tests.
+
+    Execution status changes go through the transition methods, which keep the
+    status index and lease-expiry heap in step; do not assign `record.status`.
+    A transition `ALLOWED_TRANSITIONS` does not list is a no-op (INV_003): a
+    stale worker cannot start, commit or finish an attempt that reconcile
+    already aborted, and `apply_effect` returns False for it.
+
+    With a `retry` policy, a job whose attempt ended without commit is held back
+    for the policy's backoff, and dead-lettered (`FAILED`) once its budget is spent.
+
+    With `tenant_weights`, leasing is fair across tenants instead of FIFO (see
+    `FairReadySet`): payloads may carry a `tenant` key (default `""`) and an
+    integer `priority` (default 0, higher first). Unlisted tenants weigh 1.
+
+    `archive_terminal_jobs` moves finished jobs out of memory into a
+    `JobArchive`; a tombstone per job keeps late duplicates no-ops (INV_001)
+    for a configurable window.
 
-    def __init__(self, *, clock: Clock) -> None:
+    With a `change_feed`, every transition (job created, each execution
+    status, dead-lettering) is also appended to it (INV_003).
+
+    With a `payload_arena`, payloads are serialized into it on submit and job
+    records hold a `LazyPayload` that decodes on first access. Fair scheduling
+    reads `tenant`/`priority` at submit, which decodes every payload; leave the
+    arena out when using `tenant_weights`.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Clock,
+        effect_log: EffectLog | None = None,
+        retry: "RetryPolicy | None" = None,
+        tenant_weights: Mapping[str, float] | None = None,
+        change_feed: "ChangeFeed | None" = None,
+        payload_arena: "PayloadArena | None" = None,
+    ) -> None:
         self.clock = clock
+        self.retry = retry
+        self.change_feed = change_feed
+        self.payload_arena = payload_arena
         self._job_seq = 0
         self._exec_seq = 0
         self.jobs: dict[str, dict] = {}
         self.job_order: list[str] = []
         self.executions: dict[str, ExecutionRecord] = {}
         self.execs_by_job: dict[str, list[str]] = {}
-        self.effects: list[tuple[str, str, float]] = []
+        self.effects = effect_log if effect_log is not None else EffectLog()
+        self._effect_counts: dict[str, int] = {}
         self._committed_by_job: dict[str, str] = {}
+        self._ready: ReadySet | FairReadySet = (
+            ReadySet() if tenant_weights is None else FairReadySet(flow_of=self._flow_of, weights=tenant_weights)
+        )
+        # Ordered sets (dict keys) so lookups stay deterministic.
+        self._exec_ids_by_status: dict[str, dict[str, None]] = {}
+        self._lease_expiry: list[tuple[float, int, str]] = []
+        # SUCCEEDED/FAILED jobs in the order they got there, awaiting archival.
+        self._terminal_jobs: dict[str, None] = {}
+        # Archived jobs, oldest first, and the exec ids that still resolve to them.
+        self._tombstones: dict[str, Tombstone] = {}
+        self._tombstoned_execs: dict[str, str] = {}
+
+    @classmethod
+    def in_memory(
+        cls,
+        *,
+        clock: Clock,
+        effect_log: EffectLog | None = None,
+        retry: "RetryPolicy | None" = None,
+        tenant_weights: Mapping[str, float] | None = None,
+        change_feed: "ChangeFeed | None" = None,
+        payload_arena: "PayloadArena | None" = None,
+    ) -> "Store":
+        return cls(
+            clock=clock,
+            effect_log=effect_log,
+            retry=retry,
+            tenant_weights=tenant_weights,
+            change_feed=change_feed,
+            payload_arena=payload_arena,
+        )
 
     @classmethod
-    def in_memory(cls, *, clock: Clock) -> "Store":
-        return cls(clock=clock)
+    def compact(
+        cls,
+        *,
+        clock: Clock,
+        effect_log: EffectLog | None = None,
+        retry: "RetryPolicy | None" = None,
+    ) -> "CompactStore":
+        """In-memory backend with struct-of-arrays storage for very large histories."""
+        from runtime.compact_store import CompactStore
+
+        return CompactStore(clock=clock, effect_log=effect_log, retry=retry)
+
+    @classmethod
+    def concurrent(
+        cls,
+        *,
+        clock: Clock,
+        effect_log: EffectLog | None = None,
+        retry: "RetryPolicy | None" = None,
+        tenant_weights: Mapping[str, float] | None = None,
+        change_feed: "ChangeFeed | None" = None,
+        payload_arena: "PayloadArena | None" = None,
+        stripes: int = 64,
+    ) -> "ConcurrentStore":
+        """In-memory backend safe to share between threads (striped per-job locks)."""
+        from runtime.concurrent_store import ConcurrentStore
+
+        return ConcurrentStore(
+            clock=clock,
+            effect_log=effect_log,
+            retry=retry,
+            tenant_weights=tenant_weights,
+            change_feed=change_feed,
+            payload_arena=payload_arena,
+            stripes=stripes,
+        )
+
+    @classmethod
+    def sqlite(
+        cls,
+        path: str,
+        *,
+        clock: Clock,
+        group_commit: "GroupCommit | None" = None,
+        retry: "RetryPolicy | None" = None,
+    ) -> "SqliteStore":
+        """Durable backend with the same interface, persisted to `path` (WAL mode)."""
+        from runtime.sqlite_store import SqliteStore
+
+        return SqliteStore(path=path, clock=clock, group_commit=group_commit, retry=retry)
+
+    @classmethod
+    def wal(
+        cls,
+        directory: str,
+        *,
+        clock: Clock,
+        retry: "RetryPolicy | None" = None,
+        snapshot_every: int | None = 1_000_000,
+    ) -> "WalStore":
+        """In-memory speed, restartable: WAL + snapshots in `directory`, recovered on open."""
+        from runtime.wal_store import WalStore
+
+        return WalStore.open(directory, clock=clock, retry=retry, snapshot_every=snapshot_every)
+
+    def flush(self) -> None:
+        """Durability barrier; every in-memory transition is already visible."""
 
     def create_job(self, *, payload: dict) -> str:
         self._job_seq += 1
         job_id = f"job-{self._job_seq}"
+        if self.payload_arena is not None:
+            payload = self.payload_arena.put(payload)
         self.jobs[job_id] = {"job_id": job_id, "payload": payload, "state": "PENDING"}
         self.job_order.append(job_id)
         self.execs_by_job[job_id] = []
+        self._ready.add_pending(seq=self._job_seq, job_id=job_id)
+        if self.change_feed is not None:
+            self.change_feed.append("CREATED", job_id, None, self.clock.now())
         return job_id
 
+    def create_jobs(self, *, payloads: Iterable[dict]) -> JobIdRange:
+        """Create one PENDING job per payload, reserving a contiguous id range.
+
+        `payloads` may be a generator; it is consumed once and jobs are stored
+        as they arrive. The returned ids are rendered lazily from the range.
+        """
+        first_seq = self._job_seq + 1
+        seq = self._job_seq
+        jobs = self.jobs
+        append_order = self.job_order.append
+        execs_by_job = self.execs_by_job
+        add_pending = self._ready.add_pending
+        put = None if self.payload_arena is None else self.payload_arena.put
+        try:
+            for seq, payload in enumerate(payloads, start=first_seq):
+                job_id = f"job-{seq}"
+                if put is not None:
+                    payload = put(payload)
+                jobs[job_id] = {"job_id": job_id, "payload": payload, "state": "PENDING"}
+                append_order(job_id)
+                execs_by_job[job_id] = []
+                add_pending(seq=seq, job_id=job_id)
+        finally:
+            # Keep the sequence consistent with what was stored even if `payloads` raised.
+            self._job_seq = seq
+            if self.change_feed is not None:
+                now = self.clock.now()
+                for created in range(first_seq, seq + 1):
+                    self.change_feed.append("CREATED", f"job-{created}", None, now)
+        return JobIdRange(first_seq, seq + 1)
+
+    def _flow_of(self, job_id: str) -> tuple[int, str]:
+        payload = self.jobs[job_id]["payload"]
+        return int(payload.get("priority", 0)), str(payload.get("tenant", ""))
+
     def can_lease(self, *, job_id: str, now: float) -> bool:
         exec_ids = self.execs_by_job[job_id]
         if not exec_ids:
             return True
 
         latest = self.executions[exec_ids[-1]]
-        if latest.status == "DONE":
+        if latest.status == "DONE" or self.jobs[job_id]["state"] == "FAILED":
+            return False
+        if self.retry is not None and not self.retry.allows_retry(latest.attempt):
             return False
-        return latest.lease_expires_at <= now
+        return self._ready_at(latest) <= now
 
-    def create_lease(self, *, job_id: str, worker_id: str, lease_seconds: int) -> str:
-        self._exec_seq += 1
-        exec_id = f"exec-{self._exec_seq}"
-        attempt = len(self.execs_by_job[job_id]) + 1
-        record = ExecutionRecord(
-            exec_id=exec_id,
-            job_id=job_id,
-            attempt=attempt,
-            lease_owner=worker_id,
-            lease_expires_at=self.clock.now() + float(lease_seconds),
+    def _ready_at(self, record: ExecutionRecord) -> float:
+        """When the job may be leased again if `record` ends without commit."""
+        if self.retry is None:
+            return record.lease_expires_at
+        return record.lease_expires_at + self.retry.delay_seconds(job_id=record.job_id, attempt=record.attempt)
+
+    def _out_of_retries(self, record: ExecutionRecord, now: float) -> bool:
+        return (
+            self.retry is not None
+            and record.lease_expires_at <= now
+            and record.status != "DONE"
+            and not self.retry.allows_retry(record.attempt)
+        )
+
+    def _dead_letter(self, job_id: str) -> None:
+        # A committed job is already safe; reconcile finalizes it (INV_004).
+        if job_id not in self._committed_by_job:
+            self.jobs[job_id]["state"] = "FAILED"
+            self._terminal_jobs[job_id] = None
+            if self.change_feed is not None:
+                self.change_feed.append("FAILED", job_id, None, self.clock.now())
+
+    def next_leasable_job(self, *, now: float) -> str | None:
+        """Pop the next job `can_lease` allows (earliest submitted unless fair), in amortized O(log N)."""
+        job_ids = self.next_leasable_jobs(now=now, limit=1)
+        return job_ids[0] if job_ids else None
+
+    def next_leasable_jobs(self, *, now: float, limit: int) -> list[str]:
+        """Pop up to `limit` leasable jobs in submit order (or fair order, see `tenant_weights`).
+
+        Jobs that reach the front with their retry budget spent are dead-lettered.
+        """
+        is_leasable = self._is_leasable
+        return self._ready.pop_many(
+            now=now,
+            limit=limit,
+            is_leasable=lambda job_id, exec_id: is_leasable(job_id, exec_id, now),
         )
-        self.executions[exec_id] = record
-        self.execs_by_job[job_id].append(exec_id)
-        self.jobs[job_id]["state"] = "RUNNING"
-        return exec_id
+
+    def _is_leasable(self, job_id: str, exec_id: str | None, now: float) -> bool:
+        """Whether a ready-set entry for `exec_id` (None: never leased) still lets `job_id` be leased."""
+        exec_ids = self.execs_by_job.get(job_id)
+        if exec_ids is None:  # archived
+            return False
+        latest = exec_ids[-1] if exec_ids else None
+        if latest != exec_id:
+            return False
+        if exec_id is not None and self._out_of_retries(self.executions[exec_id], now):
+            self._dead_letter(job_id)
+            return False
+        return self.can_lease(job_id=job_id, now=now)
+
+    def acquire_leases(
+        self,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        now: float,
+        limit: int,
+    ) -> list[tuple[str, str]]:
+        """Select and lease up to `limit` jobs as one step; returns `(job_id, exec_id)` pairs."""
+        job_ids = self.next_leasable_jobs(now=now, limit=limit)
+        if not job_ids:
+            return []
+        exec_ids = self.create_leases(job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+        return list(zip(job_ids, exec_ids))
+
+    def create_lease(self, *, job_id: str, worker_id: str, lease_seconds: int) -> str:
+        return self.create_leases(job_ids=[job_id], worker_id=worker_id, lease_seconds=lease_seconds)[0]
+
+    def create_leases(self, *, job_ids: list[str], worker_id: str, lease_seconds: int) -> list[str]:
+        """Create one LEASED execution per job, allocating a contiguous exec id range."""
+        first_seq = self._exec_seq + 1
+        self._exec_seq += len(job_ids)
+        now = self.clock.now()
+        lease_expires_at = now + float(lease_seconds)
+        change_feed = self.change_feed
+        exec_ids: list[str] = []
+        for exec_seq, job_id in enumerate(job_ids, start=first_seq):
+            exec_id = f"exec-{exec_seq}"
+            job_exec_ids = self.execs_by_job[job_id]
+            record = self.executions[exec_id] = ExecutionRecord(
+                exec_id=exec_id,
+                job_id=job_id,
+                attempt=len(job_exec_ids) + 1,
+                lease_owner=worker_id,
+                lease_expires_at=lease_expires_at,
+            )
+            job_exec_ids.append(exec_id)
+            self._index_status(exec_id, old=None, new="LEASED")
+            heapq.heappush(self._lease_expiry, (lease_expires_at, exec_seq, exec_id))
+            self.jobs[job_id]["state"] = "RUNNING"
+            self._ready.add_lease(
+                seq=_job_seq(job_id),
+                job_id=job_id,
+                exec_id=exec_id,
+                ready_at=self._ready_at(record),
+            )
+            if change_feed is not None:
+                change_feed.append("LEASED", job_id, exec_id, now)
+            exec_ids.append(exec_id)
+        return exec_ids
+
+    def _index_status(self, exec_id: str, *, old: str | None, new: str) -> None:
+        if old is not None:
+            del self._exec_ids_by_status[old][exec_id]
+        self._exec_ids_by_status.setdefault(new, {})[exec_id] = None
+
+    def _set_status(self, record: ExecutionRecord, status: str) -> None:
+        self._index_status(record.exec_id, old=record.status, new=status)
+        record.status = status
+        if self.change_feed is not None:
+            self.change_feed.append(status, record.job_id, record.exec_id, self.clock.now())
+
+    def _record(self, exec_id: str) -> ExecutionRecord | None:
+        """The execution, or None if its job was archived and is still tombstoned."""
+        record = self.executions.get(exec_id)
+        if record is None and exec_id not in self._tombstoned_execs:
+            raise KeyError(exec_id)
+        return record
+
+    def _movable(self, exec_id: str, status: str) -> ExecutionRecord | None:
+        """The execution if it may move to `status` now, else None (archived or not allowed)."""
+        record = self._record(exec_id)
+        if record is None or status not in ALLOWED_TRANSITIONS.get(record.status, ()):
+            return None
+        return record
+
+    def renew_leases(self, *, exec_ids: list[str], lease_seconds: int, now: float) -> list[str]:
+        """Extend live leases to `now + lease_seconds`; returns the exec ids renewed.
+
+        Only the job's latest execution, still LEASED/IN_PROGRESS and not yet
+        expired, can be renewed: an expired lease may already belong to a retry.
+        """
+        lease_expires_at = now + float(lease_seconds)
+        renewed: list[str] = []
+        for exec_id in exec_ids:
+            record = self._record(exec_id)
+            if (
+                record is None
+                or record.status not in _LIVE_STATUSES
+                or record.lease_expires_at <= now
+                or self.execs_by_job[record.job_id][-1] != exec_id
+            ):
+                continue
+            record.lease_expires_at = lease_expires_at
+            seq = _job_seq(record.job_id)
+            self._ready.add_lease(seq=seq, job_id=record.job_id, exec_id=exec_id, ready_at=self._ready_at(record))
+            heapq.heappush(self._lease_expiry, (lease_expires_at, int(exec_id.removeprefix("exec-")), exec_id))
+            renewed.append(exec_id)
+        return renewed
 
     def mark_started(self, exec_id: str) -> None:
-        self.executions[exec_id].status = "IN_PROGRESS"
+        record = self._movable(exec_id, "IN_PROGRESS")
+        if record is not None:
+            self._set_status(record, "IN_PROGRESS")
 
     def apply_effect(self, *, exec_id: str, enforce_idempotent_commit: bool) -> bool:
-        record = self.executions[exec_id]
+        record = self._movable(exec_id, "COMMITTED")
+        if record is None:
+            return False  # archived, already committed, or aborted (a stale worker)
         job_id = record.job_id
 
         if enforce_idempotent_commit and job_id in self._committed_by_job:
@@ -80,21 +463,166 @@ class Store:
         if job_id not in self._committed_by_job:
             self._committed_by_job[job_id] = exec_id
 
-        record.status = "COMMITTED"
-        self.effects.append((job_id, exec_id, self.clock.now()))
+        self._set_status(record, "COMMITTED")
+        self._append_effect(job_id, exec_id)
         return True
 
+    def _append_effect(self, job_id: str, exec_id: str) -> None:
+        self.effects.append((job_id, exec_id, self.clock.now()))
+        self._effect_counts[job_id] = self._effect_counts.get(job_id, 0) + 1
+
     def mark_finished(self, exec_id: str) -> None:
-        record = self.executions[exec_id]
-        record.status = "DONE"
+        record = self._movable(exec_id, "DONE")
+        if record is None:
+            return
+        self._set_status(record, "DONE")
         self.jobs[record.job_id]["state"] = "SUCCEEDED"
+        self._terminal_jobs[record.job_id] = None
+
+    def mark_aborted(self, exec_id: str) -> None:
+        """Abort an execution; re-open its job only if nothing committed (INV_002)."""
+        record = self._movable(exec_id, "ABORTED")
+        if record is None:
+            return
+        self._set_status(record, "ABORTED")
+        job = self.jobs[record.job_id]
+        if record.job_id not in self._committed_by_job and job["state"] != "FAILED":
+            job["state"] = "PENDING"
+
+    def mark_failed(self, exec_id: str) -> None:
+        """The attempt failed before commit: abort it and end its lease now.
+
+        The job is leasable again once the retry backoff has passed, or is
+        dead-lettered (`FAILED`) when the retry budget is spent.
+        """
+        record = self._movable(exec_id, "ABORTED")
+        if record is None:
+            return
+        record.lease_expires_at = min(record.lease_expires_at, self.clock.now())
+        self.mark_aborted(exec_id)
+        job_id = record.job_id
+        if self.execs_by_job[job_id][-1] != exec_id or job_id in self._committed_by_job:
+            return
+        if self.retry is not None and not self.retry.allows_retry(record.attempt):
+            self._dead_letter(job_id)
+            return
+        self._ready.add_lease(seq=_job_seq(job_id), job_id=job_id, exec_id=exec_id, ready_at=self._ready_at(record))
 
     def count_effects(self, job_id: str) -> int:
-        return sum(1 for effect_job_id, _, _ in self.effects if effect_job_id == job_id)
+        """O(1): maintained by `apply_effect`, independent of the effect log's window."""
+        tombstone = self._tombstones.get(job_id)
+        if tombstone is not None:
+            return tombstone.effects
+        return self._effect_counts.get(job_id, 0)
 
     def get_committed_exec_id(self, job_id: str) -> str | None:
+        tombstone = self._tombstones.get(job_id)
+        if tombstone is not None:
+            return tombstone.committed_exec_id
         return self._committed_by_job.get(job_id)
 
-    def list_exec_ids_by_status(self, status: str) -> list[str]:
-        return [exec_id for exec_id, record in self.executions.items() if record.status == status]
+    def list_exec_ids_by_status(self, status: str, *, limit: int | None = None) -> list[str]:
+        """O(matches), from the status index (ordered by when each entered `status`)."""
+        return list(islice(self._exec_ids_by_status.get(status, ()), limit))
+
+    def count_exec_ids_by_status(self, status: str) -> int:
+        return len(self._exec_ids_by_status.get(status, ()))
+
+    def list_expired_exec_ids(self, *, now: float, limit: int | None = None) -> list[str]:
+        """LEASED/IN_PROGRESS executions whose lease expired, in exec order.
+
+        Cost is proportional to expired heap entries: entries for executions that
+        already left LEASED/IN_PROGRESS are dropped, live ones are kept until a
+        transition (e.g. `mark_aborted`) retires them.
+        """
+        heap = self._lease_expiry
+        expired: list[tuple[float, int, str]] = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            record = self.executions.get(entry[2])
+            if record is not None and record.status in _LIVE_STATUSES and record.lease_expires_at == entry[0]:
+                expired.append(entry)
+        for entry in expired:
+            heapq.heappush(heap, entry)
+        expired.sort(key=lambda entry: entry[1])
+        return [exec_id for _, _, exec_id in expired[:limit]]
+
+
+    def archive_terminal_jobs(
+        self,
+        *,
+        archive: JobArchive,
+        tombstone_seconds: float,
+        limit: int | None = None,
+    ) -> int:
+        """Move SUCCEEDED/FAILED jobs whose executions are all DONE/ABORTED to `archive`.
+
+        Archived jobs leave every hot structure (`jobs`, `job_order`,
+        `executions`, `execs_by_job`, the status index and effect counts). For
+        `tombstone_seconds` a tombstone still answers `get_committed_exec_id`
+        and `count_effects`, and transitions on the job's old executions are
+        no-ops (a late duplicate's `apply_effect` returns False). Expired
+        tombstones are dropped here too. Returns the number of jobs archived.
+        """
+        now = self.clock.now()
+        tombstones = self._tombstones
+        while tombstones:
+            job_id, tombstone = next(iter(tombstones.items()))
+            if tombstone.expires_at > now:
+                break
+            del tombstones[job_id]
+            for exec_id in tombstone.exec_ids:
+                del self._tombstoned_execs[exec_id]
+
+        records: list[dict] = []
+        for job_id in list(self._terminal_jobs):
+            if limit is not None and len(records) >= limit:
+                break
+            exec_ids = self.execs_by_job[job_id]
+            executions = [self.executions[exec_id] for exec_id in exec_ids]
+            if any(record.status not in _ARCHIVABLE_STATUSES for record in executions):
+                continue  # a duplicate attempt is still live; try again next pass
+            job = self.jobs.pop(job_id)
+            del self.execs_by_job[job_id]
+            del self._terminal_jobs[job_id]
+            committed_exec_id = self._committed_by_job.pop(job_id, None)
+            effects = self._effect_counts.pop(job_id, 0)
+            for record in executions:
+                del self.executions[record.exec_id]
+                del self._exec_ids_by_status[record.status][record.exec_id]
+                self._tombstoned_execs[record.exec_id] = job_id
+            tombstones[job_id] = Tombstone(
+                committed_exec_id=committed_exec_id,
+                effects=effects,
+                exec_ids=tuple(exec_ids),
+                expires_at=now + tombstone_seconds,
+            )
+            records.append(
+                {
+                    "job_id": job_id,
+                    "payload": job["payload"] if self.payload_arena is None else dict(job["payload"]),
+                    "state": job["state"],
+                    "committed_exec_id": committed_exec_id,
+                    "effects": effects,
+                    "archived_at": now,
+                    "executions": [
+                        {
+                            "exec_id": record.exec_id,
+                            "attempt": record.attempt,
+                            "lease_owner": record.lease_owner,
+                            "lease_expires_at": record.lease_expires_at,
+                            "status": record.status,
+                        }
+                        for record in executions
+                    ],
+                }
+            )
 
+        if records:
+            archive.append(records)
+            self.job_order = [job_id for job_id in self.job_order if job_id in self.jobs]
+            if len(self._lease_expiry) > 2 * len(self.executions):
+                # Drop expiry entries of archived executions so the heap tracks live work.
+                self._lease_expiry = [entry for entry in self._lease_expiry if entry[2] in self.executions]
+                heapq.heapify(self._lease_expiry)
+        return len(records)
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import struct
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, BinaryIO
+
+from runtime.clock import Clock
+from runtime.effect_log import EffectLog
+from runtime.job_archive import JobArchive
+from runtime.ready_set import FairReadySet
+from runtime.store import JobIdRange, Store
+
+if TYPE_CHECKING:
+    from policies.retry import RetryPolicy
+
+_FRAME = struct.Struct("<I")
+_SNAPSHOT_MAGIC = b"FFJQSNAP1"
+_SNAPSHOT_HEADER = struct.Struct(f"<{len(_SNAPSHOT_MAGIC)}sQ")
+_SNAPSHOT_FILE = "snapshot.bin"
+# Configuration and WAL plumbing; everything else in the store is state to snapshot.
+_NOT_SNAPSHOTTED = frozenset({"clock", "retry", "change_feed", "payload_arena", "directory", "sync", "snapshot_every"})
+
+
+def _segment_name(segment: int) -> str:
+    return f"wal-{segment:08d}.log"
+
+
+def _segments(directory: str) -> list[int]:
+    return sorted(
+        int(name[4:-4]) for name in os.listdir(directory) if name.startswith("wal-") and name.endswith(".log")
+    )
+
+
+def _read_frames(path: str) -> Iterator[tuple[int, tuple]]:
+    """Yield `(end_offset, record)` for every complete frame; stops at a torn tail."""
+    with open(path, "rb") as wal:
+        data = wal.read()
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        (length,) = _FRAME.unpack_from(data, offset)
+        end = offset + _FRAME.size + length
+        if end > len(data):
+            return
+        try:
+            record = pickle.loads(data[offset + _FRAME.size : end])
+        except Exception:
+            return
+        offset = end
+        yield offset, record
+
+
+class WalStore(Store):
+    """In-memory `Store` made restartable by a write-ahead log and snapshots.
+
+    Every transition is appended to the current WAL segment in `directory`.
+    `flush()` is the durability barrier: it writes and, with `sync`, fsyncs the
+    log, so `Worker.finish` acknowledges COMMITTED only once it would survive a
+    kill. Every `snapshot_every` records (or on `snapshot()`) the whole state is
+    pickled to a binary snapshot and a new segment is started; older segments
+    are deleted.
+
+    `WalStore.open` rebuilds a store: it memory-maps the latest snapshot, then
+    replays the segments after it, dropping a torn final record. Run
+    `reconcile_after_crash` on the result to settle work that was in flight.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str,
+        clock: Clock,
+        effect_log: EffectLog | None = None,
+        retry: "RetryPolicy | None" = None,
+        tenant_weights: Mapping[str, float] | None = None,
+        sync: bool = True,
+        snapshot_every: int | None = 1_000_000,
+    ) -> None:
+        super().__init__(clock=clock, effect_log=effect_log, retry=retry, tenant_weights=tenant_weights)
+        self.directory = directory
+        self.sync = sync
+        self.snapshot_every = snapshot_every
+        self._wal: BinaryIO | None = None
+        self._wal_segment = 0
+        self._wal_records = 0
+        self._muted = False
+
+    @classmethod
+    def open(
+        cls,
+        directory: str,
+        *,
+        clock: Clock,
+        effect_log: EffectLog | None = None,
+        retry: "RetryPolicy | None" = None,
+        tenant_weights: Mapping[str, float] | None = None,
+        sync: bool = True,
+        snapshot_every: int | None = 1_000_000,
+    ) -> "WalStore":
+        """Recover the store persisted in `directory` (created if missing)."""
+        os.makedirs(directory, exist_ok=True)
+        store = cls(
+            directory=directory,
+            clock=clock,
+            effect_log=effect_log,
+            retry=retry,
+            tenant_weights=tenant_weights,
+            sync=sync,
+            snapshot_every=snapshot_every,
+        )
+        store._wal_segment = store._load_snapshot()
+        store._replay_segments()
+        store._wal = open(os.path.join(directory, _segment_name(store._wal_segment)), "ab")
+        return store
+
+    # -- snapshot ---------------------------------------------------------------
+
+    def _load_snapshot(self) -> int:
+        """Restore state from the snapshot, if any; returns the first segment to replay."""
+        path = os.path.join(self.directory, _SNAPSHOT_FILE)
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as snapshot, mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            magic, segment = _SNAPSHOT_HEADER.unpack_from(view, 0)
+            if magic != _SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a store snapshot")
+            with memoryview(view) as buffer, buffer[_SNAPSHOT_HEADER.size :] as body:
+                state = pickle.loads(body)
+        self.__dict__.update(state)
+        if isinstance(self._ready, FairReadySet):
+            self._ready._flow_of = self._flow_of
+        return segment
+
+    def snapshot(self) -> None:
+        """Write the full state to a new snapshot and start a fresh WAL segment."""
+        self.flush()
+        next_segment = self._wal_segment + 1
+        state = {key: value for key, value in self.__dict__.items() if key not in _NOT_SNAPSHOTTED}
+        for key in ("_wal", "_wal_segment", "_wal_records", "_muted"):
+            del state[key]
+        path = os.path.join(self.directory, _SNAPSHOT_FILE)
+        with open(f"{path}.tmp", "wb") as snapshot:
+            snapshot.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, next_segment))
+            pickle.dump(state, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        # The rename is the commit point: before it, the old snapshot and segments still apply.
+        os.replace(f"{path}.tmp", path)
+
+        if self._wal is not None:
+            self._wal.close()
+        self._wal_segment = next_segment
+        self._wal_records = 0
+        self._wal = open(os.path.join(self.directory, _segment_name(next_segment)), "ab")
+        for segment in _segments(self.directory):
+            if segment < next_segment:
+                os.remove(os.path.join(self.directory, _segment_name(segment)))
+
+    # -- log --------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Durability barrier: every transition so far is in the log (fsynced with `sync`)."""
+        if self._wal is None:
+            return
+        self._wal.flush()
+        if self.sync:
+            os.fsync(self._wal.fileno())
+
+    def close(self) -> None:
+        self.flush()
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+
+    @contextmanager
+    def _logged(self, record: tuple) -> Iterator[None]:
+        """Apply a transition, then append `record`; nested transitions are not logged.
+
+        Logging after applying keeps failed transitions (e.g. unknown ids) out of
+        the log. Nothing is acknowledged before `flush()`, so a crash in between
+        loses the transition from memory and log alike.
+        """
+        if self._muted:
+            yield
+            return
+        self._muted = True
+        try:
+            yield
+        finally:
+            self._muted = False
+        if self._wal is not None:
+            payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+            self._wal.write(_FRAME.pack(len(payload)) + payload)
+            self._wal_records += 1
+            if self.snapshot_every is not None and self._wal_records >= self.snapshot_every:
+                self.snapshot()
+
+    def _replay_segments(self) -> None:
+        first = self._wal_segment
+        clock = self.clock
+        self._muted = True
+        try:
+            for segment in _segments(self.directory):
+                if segment < first:
+                    continue
+                path = os.path.join(self.directory, _segment_name(segment))
+                good_offset = 0
+                for good_offset, record in _read_frames(path):
+                    self._replay(record)
+                if good_offset != os.path.getsize(path):
+                    # Torn tail from a kill mid-write: it was never acknowledged.
+                    os.truncate(path, good_offset)
+                self._wal_segment = segment
+        finally:
+            self.clock = clock
+            self._muted = False
+
+    def _replay(self, record: tuple) -> None:
+        op, now, *args = record
+        self.clock = Clock(start=now)
+        if op == "jobs":
+            Store.create_jobs(self, payloads=args[0])
+        elif op == "lease":
+            job_ids, worker_id, lease_seconds = args
+            Store.create_leases(self, job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+        elif op == "renew":
+            exec_ids, lease_seconds = args
+            Store.renew_leases(self, exec_ids=exec_ids, lease_seconds=lease_seconds, now=now)
+        elif op == "start":
+            Store.mark_started(self, args[0])
+        elif op == "effect":
+            exec_id, enforce = args
+            Store.apply_effect(self, exec_id=exec_id, enforce_idempotent_commit=enforce)
+        elif op == "finish":
+            Store.mark_finished(self, args[0])
+        elif op == "abort":
+            Store.mark_aborted(self, args[0])
+        elif op == "fail":
+            Store.mark_failed(self, args[0])
+        elif op == "dead_letter":
+            Store._dead_letter(self, args[0])
+        elif op == "archive":
+            tombstone_seconds, limit = args
+            # The archived jobs were written before the crash; replay only drops them from memory.
+            discard = JobArchive(os.devnull)
+            Store.archive_terminal_jobs(self, archive=discard, tombstone_seconds=tombstone_seconds, limit=limit)
+            discard.close()
+        else:
+            raise ValueError(f"unknown WAL record {op!r}")
+
+    # -- logged transitions -------------------------------------------------------
+
+    def create_job(self, *, payload: dict) -> str:
+        return self.create_jobs(payloads=[payload])[0]
+
+    def create_jobs(self, *, payloads: Iterable[dict]) -> JobIdRange:
+        payloads = list(payloads)
+        with self._logged(("jobs", self.clock.now(), payloads)):
+            return super().create_jobs(payloads=payloads)
+
+    def create_leases(self, *, job_ids: list[str], worker_id: str, lease_seconds: int) -> list[str]:
+        with self._logged(("lease", self.clock.now(), list(job_ids), worker_id, lease_seconds)):
+            return super().create_leases(job_ids=job_ids, worker_id=worker_id, lease_seconds=lease_seconds)
+
+    def renew_leases(self, *, exec_ids: list[str], lease_seconds: int, now: float) -> list[str]:
+        with self._logged(("renew", now, list(exec_ids), lease_seconds)):
+            return super().renew_leases(exec_ids=exec_ids, lease_seconds=lease_seconds, now=now)
+
+    def mark_started(self, exec_id: str) -> None:
+        with self._logged(("start", self.clock.now(), exec_id)):
+            super().mark_started(exec_id)
+
+    def apply_effect(self, *, exec_id: str, enforce_idempotent_commit: bool) -> bool:
+        with self._logged(("effect", self.clock.now(), exec_id, enforce_idempotent_commit)):
+            return super().apply_effect(exec_id=exec_id, enforce_idempotent_commit=enforce_idempotent_commit)
+
+    def mark_finished(self, exec_id: str) -> None:
+        with self._logged(("finish", self.clock.now(), exec_id)):
+            super().mark_finished(exec_id)
+
+    def mark_aborted(self, exec_id: str) -> None:
+        with self._logged(("abort", self.clock.now(), exec_id)):
+            super().mark_aborted(exec_id)
+
+    def mark_failed(self, exec_id: str) -> None:
+        with self._logged(("fail", self.clock.now(), exec_id)):
+            super().mark_failed(exec_id)
+
+    def _dead_letter(self, job_id: str) -> None:
+        with self._logged(("dead_letter", self.clock.now(), job_id)):
+            super()._dead_letter(job_id)
+
+    def archive_terminal_jobs(
+        self,
+        *,
+        archive: JobArchive,
+        tombstone_seconds: float,
+        limit: int | None = None,
+    ) -> int:
+        """Archive as in `Store`, then flush so a restart does not archive the jobs again."""
+        with self._logged(("archive", self.clock.now(), tombstone_seconds, limit)):
+            archived = super().archive_terminal_jobs(
+                archive=archive, tombstone_seconds=tombstone_seconds, limit=limit
+            )
+        self.flush()
+        return archived
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import time
+from typing import TYPE_CHECKING
+
 from faults.injectors import Faults
 from runtime.clock import Clock
 from runtime.queue import Lease, Queue
 from runtime.store import Store
 
+if TYPE_CHECKING:
+    from runtime.instrumentation import Metrics
+
 
 class Worker:
     """Minimal worker that can reproduce or prevent FM_001 based on fault flags."""
@@ -17,27 +23,56 @@ class Worker:
         queue: Queue,
         clock: Clock,
         faults: Faults,
+        metrics: "Metrics | None" = None,
     ) -> None:
         self.worker_id = worker_id
         self.store = store
         self.queue = queue
         self.clock = clock
         self.faults = faults
+        self.metrics = metrics
 
     def start(self, lease: Lease) -> None:
         self.store.mark_started(lease.exec_id)
 
+    def heartbeat(self, lease: Lease) -> None:
+        """Signal live work on `lease`; renewed on the queue's next heartbeat flush."""
+        self.queue.heartbeat(lease)
+
     def finish(self, lease: Lease) -> None:
+        self._finish([lease])
+
+    def finish_many(self, leases: list[Lease]) -> None:
+        """Finish a batch of leases behind a single durability barrier.
+
+        Same per-lease semantics as `finish`, but every COMMITTED transition in
+        the batch shares one `flush()` before any execution is marked DONE.
+        With metrics, the batch is one `worker_finish_seconds` observation.
+        """
+        self._finish(leases)
+
+    def _finish(self, leases: list[Lease]) -> None:
+        if self.metrics is None:
+            self._commit_and_finish(leases)
+            return
+        started = time.perf_counter()
+        self._commit_and_finish(leases)
+        self.metrics.observe("worker_finish_seconds", time.perf_counter() - started)
+
+    def _commit_and_finish(self, leases: list[Lease]) -> None:
         if self.faults.crash_before_commit:
             return
 
-        self.store.apply_effect(
-            exec_id=lease.exec_id,
-            enforce_idempotent_commit=self.faults.enforce_idempotent_commit,
-        )
+        for lease in leases:
+            self.store.apply_effect(
+                exec_id=lease.exec_id,
+                enforce_idempotent_commit=self.faults.enforce_idempotent_commit,
+            )
+        # COMMITTED is acknowledged only once durable (group-commit stores buffer writes).
+        self.store.flush()
 
         if self.faults.crash_after_commit_before_done:
             return
 
-        self.store.mark_finished(lease.exec_id)
-
+        for lease in leases:
+            self.store.mark_finished(lease.exec_id)
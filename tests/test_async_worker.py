@@ -0,0 +1,55 @@
+import asyncio
+
+from runtime.async_worker import WorkerPool
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _runtime(jobs: int) -> tuple[Clock, Store, Queue]:
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    queue.submit_jobs(payloads=({"n": n} for n in range(jobs)))
+    return clock, store, queue
+
+
+def test_worker_pool_runs_handlers_concurrently_and_commits_each_job_once():
+    """INV_001 under concurrency: every job commits exactly one effect."""
+    clock, store, queue = _runtime(jobs=200)
+    seen: list[int] = []
+
+    async def handler(payload: dict) -> None:
+        await asyncio.sleep(0)
+        seen.append(payload["n"])
+
+    pool = WorkerPool(worker_id="P1", store=store, queue=queue, clock=clock, handler=handler, concurrency=20)
+    stats = asyncio.run(pool.run(until_idle=True))
+
+    assert (stats.committed, stats.duplicates, stats.failed) == (200, 0, 0)
+    assert 1 < stats.max_in_flight <= 20
+    assert sorted(seen) == list(range(200))
+    assert all(store.count_effects(job_id) == 1 for job_id in store.job_order)
+    assert {job["state"] for job in store.jobs.values()} == {"SUCCEEDED"}
+
+
+def test_worker_pool_leaves_failed_handler_to_lease_expiry_then_retries_it():
+    """INV_002: a handler crash applies no effect; the job is retried after the lease expires."""
+    clock, store, queue = _runtime(jobs=5)
+    attempts: dict[int, int] = {}
+
+    async def handler(payload: dict) -> None:
+        attempts[payload["n"]] = attempts.get(payload["n"], 0) + 1
+        if payload["n"] == 3 and attempts[3] == 1:
+            raise RuntimeError("downstream timeout")
+
+    pool = WorkerPool(worker_id="P1", store=store, queue=queue, clock=clock, handler=handler, concurrency=2)
+    first = asyncio.run(pool.run(until_idle=True))
+    assert (first.committed, first.failed) == (4, 1)
+    assert store.count_effects("job-4") == 0
+
+    clock.advance(30.0)
+    second = asyncio.run(pool.run(until_idle=True))
+    assert (second.committed, second.failed) == (1, 0)
+    assert store.count_effects("job-4") == 1
+    assert store.executions[store.execs_by_job["job-4"][-1]].attempt == 2
@@ -0,0 +1,20 @@
+from benchmarks.suite import BENCHMARKS, compare, run_suite
+
+
+def _results(**values: float) -> dict[str, dict]:
+    return {name: {"value": value, "unit": "ops/s"} for name, value in values.items()}
+
+
+def test_compare_flags_only_slowdowns_beyond_the_threshold():
+    baseline = _results(lease=100.0, ingest=100.0, reconcile=100.0, dropped=100.0)
+    current = _results(lease=79.0, ingest=81.0, reconcile=250.0, added=1.0)
+
+    assert compare(baseline=baseline, current=current, threshold_pct=20.0) == ["lease"]
+    assert compare(baseline=baseline, current=current, threshold_pct=25.0) == []
+
+
+def test_suite_runs_selected_benchmarks_with_positive_rates():
+    name = "count_effects"
+    assert name in {benchmark.name for benchmark in BENCHMARKS}
+    results = run_suite(names=[name], repeat=1)
+    assert list(results) == [name] and results[name]["value"] > 0
@@ -0,0 +1,51 @@
+import pytest
+
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _runtime() -> tuple[Store, Queue]:
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    return store, Queue(store=store, clock=clock, lease_seconds=5)
+
+
+def test_submit_jobs_matches_individual_submits_and_stays_leasable_in_order():
+    bulk_store, bulk_queue = _runtime()
+    single_store, single_queue = _runtime()
+
+    single_queue.submit_job(payload={"n": -1})
+    bulk_queue.submit_job(payload={"n": -1})
+
+    ids = bulk_queue.submit_jobs(payloads=({"n": n} for n in range(5)))
+    expected = [single_queue.submit_job(payload={"n": n}) for n in range(5)]
+
+    assert list(ids) == expected == ["job-2", "job-3", "job-4", "job-5", "job-6"]
+    assert len(ids) == 5 and ids[0] == "job-2" and ids[-1] == "job-6"
+    assert list(ids[1:3]) == ["job-3", "job-4"]
+    assert bulk_store.jobs == single_store.jobs
+    assert bulk_store.job_order == single_store.job_order
+    assert bulk_store.execs_by_job == single_store.execs_by_job
+
+    # The next single submit continues the reserved sequence.
+    assert bulk_queue.submit_job(payload={}) == "job-7"
+    assert [lease.job_id for lease in bulk_queue.lease_many(worker_id="W", max_jobs=10)] == [
+        f"job-{n}" for n in range(1, 8)
+    ]
+
+
+def test_submit_jobs_keeps_sequence_consistent_when_payload_source_fails():
+    store, queue = _runtime()
+
+    def payloads():
+        yield {"n": 0}
+        yield {"n": 1}
+        raise RuntimeError("source broke")
+
+    with pytest.raises(RuntimeError):
+        queue.submit_jobs(payloads=payloads())
+
+    assert store.job_order == ["job-1", "job-2"]
+    assert queue.submit_job(payload={}) == "job-3"
+    assert len(queue.submit_jobs(payloads=[])) == 0
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from faults.injectors import Faults
+from harness.audit import ChangeAudit
+from policies.budget import RetryBudget
+from policies.reconcile import reconcile_after_crash
+from policies.retry import RetryPolicy
+from runtime.change_feed import ChangeFeed, FeedOverrun
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+from runtime.worker import Worker
+
+
+def _runtime(feed: ChangeFeed, *, lease_seconds: int = 5, retry: RetryPolicy | None = None):
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock, change_feed=feed, retry=retry)
+    return clock, store, Queue(store=store, clock=clock, lease_seconds=lease_seconds)
+
+
+def _worker(worker_id, store, queue, clock, **faults) -> Worker:
+    return Worker(worker_id=worker_id, store=store, queue=queue, clock=clock, faults=Faults(**faults))
+
+
+def test_fm001_run_is_recorded_transition_by_transition():
+    feed = ChangeFeed()
+    clock, store, queue = _runtime(feed)
+    cursor = feed.subscribe()
+    job_id = queue.submit_job(payload={})
+    lease_a = queue.lease(worker_id="A")
+    _worker("A", store, queue, clock, crash_after_commit_before_done=True).finish(lease_a)
+    clock.advance(6.0)
+    reconcile_after_crash(store=store, clock=clock)
+
+    changes = cursor.read()
+    assert [(change.kind, change.exec_id) for change in changes] == [
+        ("CREATED", None),
+        ("LEASED", lease_a.exec_id),
+        ("COMMITTED", lease_a.exec_id),
+        ("DONE", lease_a.exec_id),
+    ]
+    assert [change.offset for change in changes] == [0, 1, 2, 3]
+    assert {change.job_id for change in changes} == {job_id}
+    assert changes[-1].at == 6.0
+    assert cursor.read() == []
+
+
+def test_cursor_resumes_from_an_offset_and_reads_in_batches():
+    feed = ChangeFeed()
+    _, _, queue = _runtime(feed)
+    queue.submit_jobs(payloads=[{} for _ in range(10)])
+    queue.lease_many(worker_id="W", max_jobs=10)
+
+    with feed.subscribe() as cursor:
+        assert [len(cursor.read(limit=8)) for _ in range(4)] == [8, 8, 4, 0]
+    resumed = feed.subscribe(offset=15)
+    kinds = [change.kind for change in resumed.tail(batch_size=2)]
+    assert kinds == ["LEASED"] * 5
+    assert resumed.offset == feed.next_offset == 20
+
+
+def test_feed_keeps_the_latest_changes_and_overruns_a_lagging_cursor():
+    feed = ChangeFeed(capacity=4)
+    _, _, queue = _runtime(feed)
+    fast, slow = feed.subscribe(), feed.subscribe()
+    queue.submit_jobs(payloads=[{} for _ in range(3)])
+    fast.read()
+    slow.read(limit=2)
+
+    queue.submit_jobs(payloads=[{} for _ in range(3)])
+    assert (feed.first_offset, len(feed)) == (2, 4)
+    assert [change.offset for change in fast.read()] == [3, 4, 5]
+
+    queue.submit_job(payload={})  # drops offset 2, which `slow` has not read
+    with pytest.raises(FeedOverrun):
+        slow.read()
+    assert [change.offset for change in fast.read()] == [6]
+
+
+def test_block_mode_holds_the_producer_until_a_slow_consumer_catches_up():
+    feed = ChangeFeed(capacity=8, on_full="block")
+    _, _, queue = _runtime(feed)
+    cursor = feed.subscribe()
+    producer = threading.Thread(target=lambda: queue.submit_jobs(payloads=[{} for _ in range(100)]))
+    producer.start()
+
+    seen = []
+    for change in cursor.tail(batch_size=3, follow=True, timeout=2.0):
+        assert len(feed) <= 8
+        seen.append(change.offset)
+        if len(seen) == 100:
+            break
+    producer.join()
+    assert seen == list(range(100))
+
+
+def test_audit_consumes_deltas_and_flags_a_duplicate_commit():
+    feed = ChangeFeed()
+    clock, store, queue = _runtime(feed, retry=RetryPolicy(budget=RetryBudget(max_attempts=2)))
+    cursor = feed.subscribe()
+    audit = ChangeAudit()
+    queue.submit_jobs(payloads=[{}, {}])
+
+    lease_a, failing = queue.lease_many(worker_id="A", max_jobs=2)
+    _worker("A", store, queue, clock).start(lease_a)
+    queue.fail(failing)
+    audit.consume(cursor.read())
+    assert audit.counts["ABORTED"] == 1 and not audit.violations
+
+    # FM_001 without the commit guard: A's lease expires, B re-leases and both commit.
+    clock.advance(6.0)
+    lease_b, retry = queue.lease_many(worker_id="B", max_jobs=2)
+    queue.fail(retry)  # second attempt: budget spent, dead-lettered
+    _worker("B", store, queue, clock).finish(lease_b)
+    _worker("A", store, queue, clock).finish(lease_a)
+    audit.consume(cursor.read())
+    assert audit.violations == {"INV_001": 1}
+    assert (audit.counts["COMMITTED"], audit.counts["FAILED"]) == (2, 1)
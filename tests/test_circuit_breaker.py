@@ -0,0 +1,92 @@
+import asyncio
+
+from policies.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from runtime.async_worker import WorkerPool
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def test_breaker_without_clock_keeps_counter_semantics():
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    assert not breaker.is_open and breaker.allow(3) == 3
+    breaker.record_failure()
+    assert breaker.is_open and breaker.allow(3) == 0
+    breaker.reset()
+    assert not breaker.is_open
+
+
+def test_windowed_breaker_opens_on_failure_ratio_within_window_only():
+    clock = Clock(start=0.0)
+    breaker = CircuitBreaker(failure_threshold=3, clock=clock, window_seconds=10.0, failure_ratio=0.5)
+
+    # Failures spread wider than the window never accumulate.
+    for _ in range(5):
+        breaker.record_failure()
+        clock.advance(6.0)
+    assert breaker.state == CLOSED
+
+    # Three failures among many successes stay under the ratio.
+    for _ in range(6):
+        breaker.record_success()
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_half_open_hands_out_trials_once_and_closes_or_reopens():
+    clock = Clock(start=0.0)
+    breaker = CircuitBreaker(failure_threshold=1, clock=clock, cooldown_seconds=30.0, half_open_trials=2)
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.allow(10) == 0
+
+    clock.advance(30.0)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow(1) == 1
+    assert breaker.allow(10) == 1
+    assert breaker.allow(10) == 0
+    breaker.record_failure()
+    assert breaker.state == OPEN  # any trial failure re-opens for a fresh cooldown
+
+    clock.advance(30.0)
+    assert breaker.allow(10) == 2
+    breaker.refund(1)  # only one trial job was available
+    assert breaker.allow(10) == 1
+    breaker.record_success()
+    assert breaker.state == HALF_OPEN
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow(10) == 10
+
+
+def test_worker_pool_stops_leasing_while_breaker_open_then_probes_and_drains():
+    """INV_005 containment: a dead dependency costs a few attempts, not one per job."""
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=10)
+    queue.submit_jobs(payloads=({"n": n} for n in range(100)))
+    dependency_up = False
+
+    async def handler(payload: dict) -> None:
+        if not dependency_up:
+            raise ConnectionError("downstream unavailable")
+
+    breaker = CircuitBreaker(failure_threshold=5, clock=clock, cooldown_seconds=30.0)
+    pool = WorkerPool(
+        worker_id="P", store=store, queue=queue, clock=clock, handler=handler, concurrency=1, breaker=breaker
+    )
+    outage = asyncio.run(pool.run(until_idle=True))
+    assert breaker.state == OPEN
+    assert outage.committed == 0 and 5 <= outage.failed <= 6
+    assert len(store.executions) == outage.failed
+
+    dependency_up = True
+    clock.advance(30.0)  # cooldown over, and the failed attempts' leases have expired
+    recovery = asyncio.run(pool.run(until_idle=True))
+    assert breaker.state == CLOSED
+    assert (recovery.committed, recovery.failed) == (100, 0)
+    assert all(store.count_effects(job_id) == 1 for job_id in store.job_order)
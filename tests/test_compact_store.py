@@ -0,0 +1,55 @@
+import random
+
+from policies.reconcile import reconcile_after_crash
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def test_compact_store_matches_in_memory_store_under_random_schedule():
+    """Columnar storage must be observably identical to the dict/dataclass layout."""
+    rng = random.Random(3)
+    clock = Clock(start=0.0)
+    memory = Store.in_memory(clock=clock)
+    compact = Store.compact(clock=clock)
+    stores = (memory, compact)
+    queues = [Queue(store=store, clock=clock, lease_seconds=2) for store in stores]
+    leases: list = []
+
+    for _ in range(1_500):
+        op = rng.random()
+        if op < 0.15:
+            payloads = [{"n": rng.random()} for _ in range(rng.randint(0, 3))]
+            assert len({tuple(queue.submit_jobs(payloads=payloads)) for queue in queues}) == 1
+        elif op < 0.4:
+            limit, worker_id = rng.randint(1, 4), rng.choice("AB")
+            batch = [queue.lease_many(worker_id=worker_id, max_jobs=limit) for queue in queues]
+            assert batch[0] == batch[1]
+            leases.extend(batch[0])
+        elif op < 0.7 and leases:
+            lease = leases.pop(rng.randrange(len(leases)))
+            for store in stores:
+                store.mark_started(lease.exec_id)
+            enforce = rng.random() < 0.7
+            assert len({s.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=enforce) for s in stores}) == 1
+            if rng.random() < 0.7:
+                for store in stores:
+                    store.mark_finished(lease.exec_id)
+        elif op < 0.75:
+            results = [reconcile_after_crash(store=store, clock=clock) for store in stores]
+            assert results[0].aborted_exec_ids == results[1].aborted_exec_ids
+            assert sorted(results[0].finalized_exec_ids) == sorted(results[1].finalized_exec_ids)
+        else:
+            clock.advance(1.0)
+
+    assert dict(compact.jobs) == memory.jobs
+    assert dict(compact.executions) == memory.executions
+    assert dict(compact.execs_by_job) == memory.execs_by_job
+    assert list(compact.job_order) == memory.job_order
+    assert list(compact.effects) == list(memory.effects)
+    for job_id in memory.job_order:
+        assert compact.count_effects(job_id) == memory.count_effects(job_id)
+        assert compact.get_committed_exec_id(job_id) == memory.get_committed_exec_id(job_id)
+    for status in ("LEASED", "IN_PROGRESS", "COMMITTED", "DONE", "ABORTED"):
+        assert sorted(compact.list_exec_ids_by_status(status)) == sorted(memory.list_exec_ids_by_status(status))
+        assert compact.count_exec_ids_by_status(status) == memory.count_exec_ids_by_status(status)
@@ -0,0 +1,119 @@
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from faults.injectors import Faults
+from policies.commit import commit_effect_idempotent
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+from runtime.worker import Worker
+
+
+@pytest.fixture(autouse=True)
+def _switch_often():
+    """Preempt threads every microsecond so check-then-act races actually interleave."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run_threads(count: int, target) -> None:
+    errors: list[BaseException] = []
+
+    def guarded(n: int) -> None:
+        try:
+            target(n)
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=guarded, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors[:3]
+
+
+def test_racing_commits_on_one_job_have_exactly_one_winner():
+    clock = Clock(start=0.0)
+    store = Store.concurrent(clock=clock, stripes=4)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+    queue.submit_jobs(payloads=[{} for _ in range(50)])
+    # Eight attempts per job, all still able to commit.
+    leases = []
+    for _ in range(8):
+        leases.append(queue.lease_many(worker_id="W", max_jobs=50))
+        clock.advance(1.0)
+
+    start = threading.Barrier(8)
+    wins = Counter()
+
+    def commit_round(n: int) -> None:
+        start.wait()
+        for lease in leases[n]:
+            if commit_effect_idempotent(store=store, exec_id=lease.exec_id).committed:
+                wins[lease.job_id] += 1
+
+    _run_threads(8, commit_round)
+
+    assert wins == Counter({lease.job_id: 1 for lease in leases[0]})
+    assert all(store.count_effects(lease.job_id) == 1 for lease in leases[0])
+    assert store.count_exec_ids_by_status("COMMITTED") == 50
+
+
+def test_stress_thousand_worker_threads_keep_inv001_and_single_live_lease():
+    """1,000 threads share one store; stalled workers lose their lease mid-job (FM_001)."""
+    jobs, threads, lease_seconds = 3_000, 1_000, 5
+    clock = Clock(start=0.0)
+    store = Store.concurrent(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=lease_seconds)
+    job_ids = list(queue.submit_jobs(payloads=({} for _ in range(jobs))))
+    drained = threading.Event()
+
+    def work(n: int) -> None:
+        rng = random.Random(n)
+        worker = Worker(
+            worker_id=f"W{n}",
+            store=store,
+            queue=queue,
+            clock=clock,
+            faults=Faults(enforce_idempotent_commit=True),
+        )
+        while not drained.is_set():
+            lease = queue.lease(worker_id=worker.worker_id)
+            if lease is None:
+                time.sleep(0.001)
+                continue
+            worker.start(lease)
+            if rng.random() < 0.05:
+                time.sleep(0.02)  # stall past the lease: another thread re-leases the job
+            worker.finish(lease)
+
+    def tick() -> None:
+        while not drained.is_set():
+            time.sleep(0.002)
+            clock.advance(1.0)
+            if all(store.jobs[job_id]["state"] == "SUCCEEDED" for job_id in job_ids):
+                drained.set()
+
+    ticker = threading.Thread(target=tick)
+    ticker.start()
+    _run_threads(threads, work)
+    ticker.join()
+
+    assert all(store.count_effects(job_id) == 1 for job_id in job_ids)  # INV_001
+    assert len(store.effects) == jobs
+    for job_id in job_ids:
+        records = [store.executions[exec_id] for exec_id in store.execs_by_job[job_id]]
+        assert [record.attempt for record in records] == list(range(1, len(records) + 1))
+        # No renewals here, so each lease started at `expires - lease_seconds`:
+        # an attempt never began before the previous one's lease ran out.
+        for previous, record in zip(records, records[1:]):
+            assert record.lease_expires_at - lease_seconds >= previous.lease_expires_at
+    assert len(store.executions) > jobs  # the stalls did produce duplicate attempts
@@ -0,0 +1,31 @@
+from runtime.clock import Clock
+from runtime.effect_log import EffectLog
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def test_effect_counts_stay_exact_when_effect_log_window_is_bounded(tmp_path):
+    """INV_001 audit: count_effects is O(1) and exact even after old entries leave memory."""
+    spill_path = str(tmp_path / "effects.tsv")
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock, effect_log=EffectLog(max_in_memory=2, spill_path=spill_path))
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+
+    job_ids = list(queue.submit_jobs(payloads=[{"n": n} for n in range(3)]))
+    first = queue.lease_many(worker_id="A", max_jobs=3)
+    clock.advance(1.0)
+    retry = queue.lease(worker_id="B")
+    for lease in [*first, retry]:
+        store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=False)
+
+    # FM_001 baseline: job-1 was committed twice; the other jobs once.
+    assert [store.count_effects(job_id) for job_id in job_ids] == [2, 1, 1]
+    assert store.count_effects("job-404") == 0
+
+    assert len(store.effects) == 2
+    assert [effect[1] for effect in store.effects] == [first[2].exec_id, retry.exec_id]
+    assert store.effects.total_appended == 4
+    assert [effect[:2] for effect in store.effects.iter_all()] == [
+        (lease.job_id, lease.exec_id) for lease in [*first, retry]
+    ]
+    store.effects.close()
@@ -0,0 +1,81 @@
+import sqlite3
+
+from faults.injectors import Faults
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.sqlite_store import GroupCommit
+from runtime.store import Store
+from runtime.worker import Worker
+
+
+def _durable_effects(path: str) -> int:
+    """Count effects as seen by a fresh connection, i.e. what survives a crash."""
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM effects").fetchone()[0]
+
+
+def test_group_commit_acknowledges_committed_only_after_flush(tmp_path):
+    """INV_002: buffered transitions are invisible until flushed; finish() flushes before DONE."""
+    path = str(tmp_path / "store.db")
+    clock = Clock(start=0.0)
+    store = Store.sqlite(path, clock=clock, group_commit=GroupCommit(max_records=1_000, max_delay_seconds=60))
+    queue = Queue(store=store, clock=clock, lease_seconds=5)
+    worker = Worker(
+        worker_id="W1",
+        store=store,
+        queue=queue,
+        clock=clock,
+        faults=Faults(enforce_idempotent_commit=True),
+    )
+
+    job_ids = list(queue.submit_jobs(payloads=[{"n": n} for n in range(3)]))
+    leases = queue.lease_many(worker_id="W1", max_jobs=3)
+    for lease in leases:
+        worker.start(lease)
+    store.apply_effect(exec_id=leases[0].exec_id, enforce_idempotent_commit=True)
+    assert _durable_effects(path) == 0  # still buffered
+
+    worker.finish_many(leases[1:])
+    assert _durable_effects(path) == 3  # one barrier covers the whole batch
+
+    worker.finish(leases[0])
+    assert store.executions[leases[0].exec_id].status == "DONE"
+    assert [store.count_effects(job_id) for job_id in job_ids] == [1, 1, 1]
+
+
+def test_group_commit_flushes_on_record_and_delay_limits_and_loses_unflushed_batch_on_crash(tmp_path, monkeypatch):
+    path = str(tmp_path / "store.db")
+    clock = Clock(start=0.0)
+    elapsed = [0.0]
+    monkeypatch.setattr("runtime.sqlite_store.monotonic", lambda: elapsed[0])
+    store = Store.sqlite(path, clock=clock, group_commit=GroupCommit(max_records=2, max_delay_seconds=1.0))
+
+    store.create_job(payload={})
+    assert not Store.sqlite(path, clock=clock).jobs
+    store.create_job(payload={})  # second record reaches max_records
+    assert len(Store.sqlite(path, clock=clock).jobs) == 2
+
+    store.create_job(payload={})
+    elapsed[0] = 1.0  # the store's Clock never moves, the batch still ages
+    assert store.count_effects("job-3") == 0  # a read past the deadline flushes
+    assert len(Store.sqlite(path, clock=clock).jobs) == 3
+
+    store.create_job(payload={})
+    store._conn.close()  # simulated crash: the open batch is never committed
+    assert len(Store.sqlite(path, clock=clock).jobs) == 3
+
+
+def test_group_commit_releases_the_write_lock_when_a_lease_poll_finds_nothing(tmp_path):
+    path = str(tmp_path / "store.db")
+    clock = Clock(start=0.0)
+    store = Store.sqlite(path, clock=clock, group_commit=GroupCommit(max_records=1_000, max_delay_seconds=3_600))
+    queue = Queue(store=store, clock=clock, lease_seconds=5)
+    queue.submit_job(payload={})
+    assert queue.lease(worker_id="W") is not None
+    assert store._conn.in_transaction  # batch open: other processes cannot write
+
+    assert queue.lease(worker_id="W") is None
+    assert not store._conn.in_transaction
+    other = Store.sqlite(path, clock=clock)
+    assert other.count_exec_ids_by_status("LEASED") == 1
+    other.create_job(payload={})  # would wait on the lock if the batch were still open
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from policies.idempotency import IdempotencyIndex
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _runtime(*, ttl_seconds: float = 60.0, max_keys: int = 1_000):
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    index = IdempotencyIndex(clock=clock, ttl_seconds=ttl_seconds, max_keys=max_keys)
+    return clock, store, Queue(store=store, clock=clock, lease_seconds=5, idempotency=index)
+
+
+def test_duplicate_submit_returns_the_existing_job_without_new_work():
+    _, store, queue = _runtime()
+    first = queue.submit_job(payload={"order": 1}, idempotency_key="order-1")
+    assert queue.submit_job(payload={"order": 1}, idempotency_key="order-1") == first
+    assert queue.submit_job(payload={"order": 2}, idempotency_key="order-2") != first
+    assert queue.submit_job(payload={"order": 1}) not in (first, None)  # no key: always new
+    assert len(store.jobs) == 3
+    assert queue.idempotency.hits == 1
+
+
+def test_keys_expire_after_the_ttl():
+    clock, store, queue = _runtime(ttl_seconds=10.0)
+    first = queue.submit_job(payload={}, idempotency_key="k")
+    clock.advance(9.0)
+    assert queue.submit_job(payload={}, idempotency_key="k") == first
+    clock.advance(1.0)  # TTL counts from the first submit, not the last hit
+    assert queue.submit_job(payload={}, idempotency_key="k") != first
+    assert len(store.jobs) == 2
+
+
+def test_index_stays_bounded_and_evicts_least_recently_used():
+    _, _, queue = _runtime(max_keys=3)
+    ids = {key: queue.submit_job(payload={}, idempotency_key=key) for key in "abc"}
+    assert queue.submit_job(payload={}, idempotency_key="a") == ids["a"]  # `a` is now hot
+    queue.submit_job(payload={}, idempotency_key="d")
+
+    assert len(queue.idempotency) == 3 and queue.idempotency.evictions == 1
+    assert queue.submit_job(payload={}, idempotency_key="a") == ids["a"]
+    assert queue.submit_job(payload={}, idempotency_key="b") != ids["b"]  # `b` was evicted
+
+
+def test_key_without_index_is_rejected():
+    clock = Clock(start=0.0)
+    queue = Queue(store=Store.in_memory(clock=clock), clock=clock, lease_seconds=5)
+    with pytest.raises(ValueError):
+        queue.submit_job(payload={}, idempotency_key="k")
+
+
+@pytest.mark.parametrize("keyed", [False, True])
+def test_replayed_traffic_runs_each_logical_request_once_with_keys(keyed):
+    """Clients re-send requests whose acknowledgement was lost; keys absorb the replays."""
+    rng = random.Random(7)
+    clock, store, queue = _runtime()
+    requests = 500
+    submits = 0
+    for request in range(requests):
+        for _ in range(1 + (rng.random() < 0.4) + (rng.random() < 0.2)):
+            queue.submit_job(payload={"request": request}, idempotency_key=f"req-{request}" if keyed else None)
+            submits += 1
+        for lease in queue.lease_many(worker_id="W", max_jobs=10):
+            store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+            store.mark_finished(lease.exec_id)
+        clock.advance(0.1)
+
+    executions = len(store.executions)
+    if keyed:
+        assert len(store.jobs) == executions == requests
+    else:
+        assert len(store.jobs) == executions == submits > requests * 1.5
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from faults.injectors import Faults
+from policies.reconcile import reconcile_after_crash
+from runtime.clock import Clock
+from runtime.instrumentation import Histogram, InstrumentedStore, Metrics
+from runtime.queue import Queue
+from runtime.store import Store
+from runtime.worker import Worker
+
+
+def _runtime(*, lease_seconds: int = 5):
+    clock = Clock(start=0.0)
+    metrics = Metrics()
+    store = InstrumentedStore(Store.in_memory(clock=clock), metrics=metrics)
+    queue = Queue(store=store, clock=clock, lease_seconds=lease_seconds, metrics=metrics)
+    return clock, metrics, store, queue
+
+
+def _worker(worker_id, store, queue, clock, metrics) -> Worker:
+    faults = Faults(enforce_idempotent_commit=True)
+    return Worker(worker_id=worker_id, store=store, queue=queue, clock=clock, faults=faults, metrics=metrics)
+
+
+def test_histogram_percentiles_stay_within_bucket_precision():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(-9, 2) for _ in range(20_000)]
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+
+    ordered = sorted(values)
+    for pct in (50, 90, 99):
+        exact = ordered[int(pct / 100 * len(ordered)) - 1]
+        assert exact <= histogram.percentile(pct) <= exact * 1.0625
+    assert histogram.percentile(100) == histogram.max == ordered[-1]
+    assert histogram.count == len(values) and histogram.sum == pytest.approx(sum(values))
+
+
+def test_fm001_run_is_visible_in_waits_status_times_and_conflicts():
+    clock, metrics, store, queue = _runtime(lease_seconds=5)
+    worker_a = _worker("A", store, queue, clock, metrics)
+    worker_b = _worker("B", store, queue, clock, metrics)
+    queue.submit_job(payload={})
+
+    clock.advance(2.0)
+    lease_a = queue.lease(worker_id="A")  # waited 2s since submit
+    worker_a.start(lease_a)
+    clock.advance(7.0)
+    lease_b = queue.lease(worker_id="B")  # lease A expired 2s ago
+    worker_b.start(lease_b)
+    clock.advance(1.0)
+    worker_b.finish(lease_b)
+    worker_a.finish(lease_a)  # stale duplicate: rejected at the commit boundary
+
+    assert metrics.counter("leases_total") == 2
+    assert metrics.counter("effects_committed_total") == 1
+    assert metrics.counter("commit_conflicts_total") == 1
+    assert metrics.histogram("lease_wait_seconds").sum == pytest.approx(4.0)
+    in_progress = metrics.histogram("execution_status_seconds", status="IN_PROGRESS")
+    assert (in_progress.count, in_progress.max) == (2, 8.0)  # B for 1s; A until its late finish
+    assert metrics.histogram("worker_finish_seconds").count == 2
+    assert metrics.histogram("queue_lease_seconds").count == 2
+    assert metrics.histogram("store_call_seconds", op="apply_effect").count == 2
+
+
+def test_reconcile_records_lag_and_counts():
+    clock, metrics, store, queue = _runtime(lease_seconds=5)
+    queue.submit_jobs(payloads=[{}, {}])
+    committed, stale = queue.lease_many(worker_id="W", max_jobs=2)
+    store.apply_effect(exec_id=committed.exec_id, enforce_idempotent_commit=True)
+    clock.advance(8.0)
+
+    reconcile_after_crash(store=store, clock=clock, metrics=metrics)
+
+    assert metrics.counter("reconcile_finalized_total") == 1
+    assert metrics.counter("reconcile_aborted_total") == 1
+    assert metrics.histogram("reconcile_lag_seconds").max == 3.0
+    assert metrics.histogram("execution_status_seconds", status="LEASED").count == 2
+    # The stale job was leasable again from its lease expiry (t=5), not from the abort.
+    clock.advance(1.0)
+    assert queue.lease(worker_id="W").job_id == stale.job_id
+    assert metrics.histogram("lease_wait_seconds").max == 4.0
+
+
+def test_snapshot_and_prometheus_export():
+    metrics = Metrics(namespace="fq")
+    metrics.inc("commit_conflicts_total", 3)
+    metrics.observe("execution_status_seconds", 0.5, status="LEASED")
+    metrics.observe("execution_status_seconds", 2.0, status="LEASED")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {"commit_conflicts_total": 3}
+    summary = snapshot["histograms"]['execution_status_seconds{status="LEASED"}']
+    assert (summary["count"], summary["sum"], summary["max"]) == (2, 2.5, 2.0)
+
+    lines = metrics.to_prometheus().splitlines()
+    assert "# TYPE fq_commit_conflicts_total counter" in lines
+    assert "fq_commit_conflicts_total 3" in lines
+    assert "# TYPE fq_execution_status_seconds histogram" in lines
+    assert 'fq_execution_status_seconds_bucket{status="LEASED",le="0.53125"} 1' in lines
+    assert 'fq_execution_status_seconds_bucket{status="LEASED",le="+Inf"} 2' in lines
+    assert 'fq_execution_status_seconds_count{status="LEASED"} 2' in lines
@@ -0,0 +1,110 @@
+import pytest
+
+from policies.budget import RetryBudget
+from policies.commit import commit_effect_idempotent
+from policies.reconcile import reconcile_after_crash
+from policies.retry import RetryPolicy
+from runtime.clock import Clock
+from runtime.job_archive import JobArchive
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _finish(store: Store, lease) -> None:
+    store.mark_started(lease.exec_id)
+    commit_effect_idempotent(store=store, exec_id=lease.exec_id)
+    store.mark_finished(lease.exec_id)
+
+
+def test_archive_moves_terminal_jobs_out_and_keeps_live_ones(tmp_path):
+    clock = Clock(start=0.0)
+    retry = RetryPolicy(budget=RetryBudget(max_attempts=1))
+    store = Store.in_memory(clock=clock, retry=retry)
+    queue = Queue(store=store, clock=clock, lease_seconds=5)
+    archive = JobArchive(str(tmp_path / "jobs.jsonl"))
+    queue.submit_jobs(payloads=({"n": n} for n in range(10)))
+
+    leases = queue.lease_many(worker_id="W", max_jobs=10)
+    for lease in leases[:7]:
+        _finish(store, lease)
+    queue.fail(leases[7])  # budget of 1: dead-lettered, terminal too
+
+    assert store.archive_terminal_jobs(archive=archive, tombstone_seconds=60) == 8
+    live = [leases[8].job_id, leases[9].job_id]
+    assert list(store.jobs) == live and store.job_order == live
+    assert list(store.execs_by_job) == live
+    assert sorted(store.executions) == sorted([leases[8].exec_id, leases[9].exec_id])
+    assert store.count_exec_ids_by_status("DONE") == 0
+    assert store.count_exec_ids_by_status("LEASED") == 2
+
+    archived = list(archive)
+    assert [record["job_id"] for record in archived] == [lease.job_id for lease in leases[:8]]
+    assert archived[0]["state"] == "SUCCEEDED" and archived[0]["effects"] == 1
+    assert archived[0]["executions"][0]["status"] == "DONE"
+    assert archived[7]["state"] == "FAILED" and archived[7]["committed_exec_id"] is None
+
+    # Leasing walks over stale ready-set entries of archived jobs; the live jobs
+    # expire with their single attempt spent and are dead-lettered.
+    clock.advance(5.0)
+    assert queue.lease_many(worker_id="W2", max_jobs=10) == []
+    assert {store.jobs[job_id]["state"] for job_id in live} == {"FAILED"}
+    # Their executions are still LEASED until reconcile aborts them.
+    assert store.archive_terminal_jobs(archive=archive, tombstone_seconds=60) == 0
+    reconcile_after_crash(store=store, clock=clock)
+    assert store.archive_terminal_jobs(archive=archive, tombstone_seconds=60) == 2
+    assert len(store.jobs) == len(store.executions) == 0
+    archive.close()
+
+
+def test_tombstone_keeps_late_duplicate_a_no_op_for_the_window(tmp_path):
+    """INV_001 across archival: a stale attempt finishing late commits nothing."""
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+    archive = JobArchive(str(tmp_path / "jobs.jsonl"))
+    job_id = queue.submit_job(payload={})
+
+    stale = queue.lease(worker_id="A")
+    store.mark_started(stale.exec_id)
+    clock.advance(1.0)
+    retry = queue.lease(worker_id="B")
+    _finish(store, retry)
+
+    # The stale attempt is still IN_PROGRESS, so the job is not archivable yet.
+    assert store.archive_terminal_jobs(archive=archive, tombstone_seconds=30) == 0
+    reconcile_after_crash(store=store, clock=clock)
+    assert store.archive_terminal_jobs(archive=archive, tombstone_seconds=30) == 1
+    assert job_id not in store.jobs
+
+    # A finishes late: every transition on its execution is a no-op.
+    assert commit_effect_idempotent(store=store, exec_id=stale.exec_id).committed is False
+    store.mark_finished(stale.exec_id)
+    assert store.count_effects(job_id) == 1
+    assert store.get_committed_exec_id(job_id) == retry.exec_id
+
+    clock.advance(30.0)
+    store.archive_terminal_jobs(archive=archive, tombstone_seconds=30)
+    assert store.get_committed_exec_id(job_id) is None
+    with pytest.raises(KeyError):
+        store.apply_effect(exec_id=stale.exec_id, enforce_idempotent_commit=True)
+    archive.close()
+
+
+def test_memory_tracks_live_work_not_history(tmp_path):
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+    archive = JobArchive(str(tmp_path / "jobs.jsonl"))
+
+    for _ in range(20):
+        queue.submit_jobs(payloads=({} for _ in range(500)))
+        for lease in queue.lease_many(worker_id="W", max_jobs=500):
+            _finish(store, lease)
+        clock.advance(1.0)
+        store.archive_terminal_jobs(archive=archive, tombstone_seconds=0.5)
+        sizes = (len(store.jobs), len(store.executions), len(store.job_order), len(store._tombstoned_execs))
+        assert max(sizes) <= 500
+
+    assert len(store.jobs) == 0
+    assert sum(1 for _ in archive) == 10_000
+    archive.close()
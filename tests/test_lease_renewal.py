@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from harness.fixtures import STORE_BACKENDS, make_store
+from harness.metrics import duplicate_attempt_ratio
+from runtime.async_worker import WorkerPool
+from runtime.clock import Clock
+from runtime.queue import Queue
+
+
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_renew_extends_only_live_latest_leases(backend, tmp_path):
+    clock = Clock(start=0.0)
+    store = make_store(backend=backend, clock=clock, path=str(tmp_path / "store.db"))
+    queue = Queue(store=store, clock=clock, lease_seconds=2)
+    queue.submit_jobs(payloads=[{}, {}, {}])
+    live, done, stale = queue.lease_many(worker_id="A", max_jobs=3)
+    store.apply_effect(exec_id=done.exec_id, enforce_idempotent_commit=True)
+    store.mark_finished(done.exec_id)
+
+    clock.advance(1.0)
+    assert queue.renew(live)
+    assert not queue.renew(done)
+
+    clock.advance(1.5)  # `stale` expired at t=2; `live` now expires at t=3
+    assert not queue.renew(stale)
+    retry = queue.lease(worker_id="B")
+    assert retry.job_id == stale.job_id
+    assert queue.lease(worker_id="B") is None
+
+    clock.advance(1.0)
+    assert queue.lease(worker_id="B").job_id == live.job_id
+
+
+def test_coalesced_heartbeats_cut_duplicate_attempts_with_one_write_per_tick():
+    """FM_001 pressure: slow handlers keep their leases; 100 heartbeats cost one store update."""
+
+    def run(*, heartbeats: bool) -> tuple[float, int]:
+        clock = Clock(start=0.0)
+        store = make_store(backend="memory", clock=clock)
+        queue = Queue(store=store, clock=clock, lease_seconds=2)
+        queue.submit_jobs(payloads=({"n": n} for n in range(100)))
+        renew_calls = 0
+        renew_leases = store.renew_leases
+
+        def counting_renew_leases(**kwargs):
+            nonlocal renew_calls
+            renew_calls += 1
+            return renew_leases(**kwargs)
+
+        store.renew_leases = counting_renew_leases
+        slow = queue.lease_many(worker_id="A", max_jobs=100)
+        for _ in range(5):  # A works for 5s on every job
+            clock.advance(1.0)
+            if heartbeats:
+                for lease in slow:
+                    queue.heartbeat(lease)
+                queue.flush_heartbeats()
+            queue.lease_many(worker_id="B", max_jobs=100)  # competitor retries expired work
+        return duplicate_attempt_ratio(store=store), renew_calls
+
+    assert run(heartbeats=False) == (2.0, 0)  # B re-leases at t=2 and again at t=4
+    assert run(heartbeats=True) == (0.0, 5)
+
+
+def test_worker_pool_heartbeats_keep_slow_handlers_from_being_re_leased():
+    clock = Clock(start=0.0)
+    store = make_store(backend="memory", clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=2)
+    queue.submit_jobs(payloads=({"n": n} for n in range(3)))
+
+    async def slow_handler(payload: dict) -> None:
+        for _ in range(3):
+            clock.advance(1.0)
+            await asyncio.sleep(0.02)
+
+    pool = WorkerPool(
+        worker_id="P",
+        store=store,
+        queue=queue,
+        clock=clock,
+        handler=slow_handler,
+        concurrency=1,
+        idle_sleep_seconds=0.001,
+        heartbeat_interval_seconds=0.002,
+    )
+    stats = asyncio.run(pool.run(until_idle=True))
+
+    assert (stats.committed, stats.duplicates) == (3, 0)
+    assert stats.renewed > 0
+    assert duplicate_attempt_ratio(store=store) == 0.0
+
+
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_renewed_lease_is_offered_once_after_it_expires(backend, tmp_path):
+    clock = Clock(start=0.0)
+    store = make_store(backend=backend, clock=clock, path=str(tmp_path / "store.db"))
+    queue = Queue(store=store, clock=clock, lease_seconds=2)
+    job_id = queue.submit_job(payload={})
+    lease = queue.lease(worker_id="A")
+    clock.advance(1.0)
+    assert queue.renew(lease)
+
+    clock.advance(5.0)  # both the original and the renewed expiry have passed
+    assert [retry.job_id for retry in queue.lease_many(worker_id="B", max_jobs=5)] == [job_id]
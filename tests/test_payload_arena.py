@@ -0,0 +1,69 @@
+import os
+import pickle
+
+from faults.injectors import Faults
+from runtime.clock import Clock
+from runtime.job_archive import JobArchive
+from runtime.payload_arena import LazyPayload, PayloadArena
+from runtime.queue import Queue
+from runtime.store import Store
+from runtime.worker import Worker
+
+
+def test_payloads_round_trip_through_zero_copy_views_across_segments():
+    arena = PayloadArena(segment_bytes=256)
+    small = [arena.put({"n": n, "blob": "x" * 40}) for n in range(10)]
+    large = arena.put({"blob": b"y" * 1_000})  # bigger than a segment: gets its own
+
+    assert [payload["n"] for payload in small] == list(range(10))
+    assert large["blob"] == b"y" * 1_000
+    with large.view() as view:
+        assert view.readonly and view.nbytes == large.nbytes
+        assert pickle.loads(view) == {"blob": b"y" * 1_000}
+    assert arena.nbytes == sum(payload.nbytes for payload in small) + large.nbytes
+
+
+def test_store_keeps_queued_payloads_encoded_until_a_worker_reads_them():
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock, payload_arena=PayloadArena())
+    queue = Queue(store=store, clock=clock, lease_seconds=30)
+    job_ids = list(queue.submit_jobs(payloads=({"n": n, "body": "z" * 4_096} for n in range(100))))
+    job_ids.append(queue.submit_job(payload={"n": 100}))
+
+    payloads = [store.jobs[job_id]["payload"] for job_id in job_ids]
+    assert all(isinstance(payload, LazyPayload) and not payload.decoded for payload in payloads)
+
+    lease = queue.lease(worker_id="W")
+    assert store.jobs[lease.job_id]["payload"]["n"] == 0  # what a handler does
+    assert [payload.decoded for payload in payloads[:2]] == [True, False]
+    assert payloads[-1] == {"n": 100}
+
+
+def test_fm001_and_archival_work_unchanged_on_file_backed_payloads(tmp_path):
+    clock = Clock(start=0.0)
+    arena = PayloadArena(directory=str(tmp_path / "arena"), segment_bytes=4_096)
+    store = Store.in_memory(clock=clock, payload_arena=arena)
+    queue = Queue(store=store, clock=clock, lease_seconds=5)
+    faults = Faults(enforce_idempotent_commit=True)
+    worker_a = Worker(worker_id="A", store=store, queue=queue, clock=clock, faults=faults)
+    worker_b = Worker(worker_id="B", store=store, queue=queue, clock=clock, faults=faults)
+    job_id = queue.submit_job(payload={"charge": 42, "memo": "m" * 10_000})
+
+    lease_a = queue.lease(worker_id="A")
+    worker_a.start(lease_a)
+    clock.advance(6.0)
+    lease_b = queue.lease(worker_id="B")
+    worker_b.start(lease_b)
+    worker_b.finish(lease_b)
+    worker_a.finish(lease_a)
+    assert store.count_effects(job_id) == 1  # INV_001
+
+    assert os.listdir(tmp_path / "arena") == ["payloads-000000.seg"]
+    archive = JobArchive(str(tmp_path / "archive.jsonl"))
+    assert store.archive_terminal_jobs(archive=archive, tombstone_seconds=60.0) == 1
+    (record,) = list(archive)
+    assert record["payload"] == {"charge": 42, "memo": "m" * 10_000}
+    # Handed to another process (or logged), a lazy payload travels as the plain dict.
+    assert pickle.loads(pickle.dumps(arena.put({"k": 1}))) == {"k": 1}
+    archive.close()
+    arena.close()
@@ -0,0 +1,31 @@
+from collections import Counter
+
+from runtime.clock import Clock
+from runtime.process_pool import run_process_pool
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _spin(payload: dict) -> None:
+    """Small CPU-bound handler (module-level so worker processes can unpickle it)."""
+    sum(range(payload["work"]))
+
+
+def test_process_pool_shares_durable_store_without_double_leases_or_duplicate_effects(tmp_path):
+    """INV_001 across processes: one execution and one effect per job."""
+    path = str(tmp_path / "store.db")
+    store = Store.sqlite(path, clock=Clock(start=0.0))
+    Queue(store=store, clock=store.clock, lease_seconds=60).submit_jobs(
+        payloads=({"work": 2_000} for _ in range(300))
+    )
+    store.close()
+
+    stats = run_process_pool(path=path, handler=_spin, processes=4, lease_seconds=60, batch_size=4)
+
+    assert sum(s.committed for s in stats) == 300
+    assert sum(s.duplicates + s.failed for s in stats) == 0
+
+    store = Store.sqlite(path, clock=Clock(start=0.0))
+    assert Counter(len(exec_ids) for exec_ids in store.execs_by_job.values()) == {1: 300}
+    assert all(store.count_effects(job_id) == 1 for job_id in store.job_order)
+    assert {job["state"] for job in store.jobs.values()} == {"SUCCEEDED"}
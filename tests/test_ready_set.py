@@ -0,0 +1,93 @@
+import random
+
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _scan_first_leasable(store: Store, now: float) -> str | None:
+    """Reference semantics: the original full scan over `job_order`."""
+    for job_id in store.job_order:
+        if store.can_lease(job_id=job_id, now=now):
+            return job_id
+    return None
+
+
+def test_indexed_lease_matches_full_scan_under_random_schedule():
+    """Ready-set index must pick exactly what the job_order scan picked (FIFO + expiry)."""
+    rng = random.Random(1234)
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=3)
+    leases = []
+
+    for _ in range(2_000):
+        op = rng.random()
+        if op < 0.25:
+            queue.submit_job(payload={"n": rng.random()})
+        elif op < 0.55:
+            expected = _scan_first_leasable(store, clock.now())
+            lease = queue.lease(worker_id="W")
+            assert (lease.job_id if lease else None) == expected
+            if lease is not None:
+                leases.append(lease)
+        elif op < 0.75 and leases:
+            lease = leases.pop(rng.randrange(len(leases)))
+            store.mark_started(lease.exec_id)
+            store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+            if rng.random() < 0.8:
+                store.mark_finished(lease.exec_id)
+        else:
+            clock.advance(rng.choice([0.5, 1.0, 2.0]))
+
+
+def test_lease_skips_finished_history_and_reoffers_expired_job_in_submit_order():
+    clock = Clock(start=0.0)
+    store = Store.in_memory(clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+
+    first = queue.submit_job(payload={})
+    second = queue.submit_job(payload={})
+
+    lease_first = queue.lease(worker_id="A")
+    lease_second = queue.lease(worker_id="A")
+    assert (lease_first.job_id, lease_second.job_id) == (first, second)
+
+    store.apply_effect(exec_id=lease_second.exec_id, enforce_idempotent_commit=True)
+    store.mark_finished(lease_second.exec_id)
+    third = queue.submit_job(payload={})
+
+    # The expired first job precedes the never-leased third job (submit order).
+    clock.advance(1.0)
+    assert queue.lease(worker_id="B").job_id == first
+    assert queue.lease(worker_id="B").job_id == third
+    assert queue.lease(worker_id="B") is None
+
+
+def test_lease_many_matches_sequential_leases():
+    """lease_many must hand out the same jobs, in the same order, as repeated lease()."""
+
+    def build() -> tuple[Clock, Store, Queue]:
+        clock = Clock(start=0.0)
+        store = Store.in_memory(clock=clock)
+        queue = Queue(store=store, clock=clock, lease_seconds=2)
+        for n in range(20):
+            queue.submit_job(payload={"n": n})
+        # Expire a few early leases and finish others so both index sources are used.
+        for lease in queue.lease_many(worker_id="seed", max_jobs=8):
+            if lease.job_id in {"job-2", "job-5"}:
+                store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+                store.mark_finished(lease.exec_id)
+        clock.advance(2.0)
+        return clock, store, queue
+
+    _, batch_store, batch_queue = build()
+    _, seq_store, seq_queue = build()
+
+    batch = batch_queue.lease_many(worker_id="W", max_jobs=15)
+    sequential = [seq_queue.lease(worker_id="W") for _ in range(15)]
+
+    assert batch == sequential
+    assert [lease.job_id for lease in batch] == [f"job-{n}" for n in range(1, 21) if n not in {2, 5}][:15]
+    assert batch_store.execs_by_job == seq_store.execs_by_job
+    assert len(batch_queue.lease_many(worker_id="W", max_jobs=100)) == 3
@@ -0,0 +1,121 @@
+import pytest
+
+from harness.fixtures import STORE_BACKENDS, make_store
+from policies.budget import RetryBudget
+from policies.reconcile import reconcile_after_crash
+from policies.retry import RetryPolicy
+from runtime.clock import Clock
+from runtime.queue import Queue
+
+
+def _runtime(backend: str, path, *, retry: RetryPolicy | None, lease_seconds: int = 5):
+    clock = Clock(start=0.0)
+    store = make_store(backend=backend, clock=clock, path=str(path), retry=retry)
+    return clock, store, Queue(store=store, clock=clock, lease_seconds=lease_seconds)
+
+
+def test_backoff_is_deterministic_capped_and_jittered_within_bounds():
+    policy = RetryPolicy(budget=RetryBudget(max_attempts=20), base_delay_seconds=1.0, max_delay_seconds=30.0)
+    again = RetryPolicy(budget=RetryBudget(max_attempts=20), base_delay_seconds=1.0, max_delay_seconds=30.0)
+
+    delays = [policy.delay_seconds(job_id="job-7", attempt=n) for n in range(1, 11)]
+    assert delays == [again.delay_seconds(job_id="job-7", attempt=n) for n in range(1, 11)]
+    for attempt, delay in enumerate(delays, start=1):
+        ceiling = min(30.0, 2.0 ** (attempt - 1))
+        assert ceiling * 0.5 <= delay <= ceiling
+    # Jitter spreads jobs that failed together, and the seed changes the spread.
+    assert len({policy.delay_seconds(job_id=f"job-{n}", attempt=3) for n in range(50)}) == 50
+    reseeded = RetryPolicy(budget=RetryBudget(max_attempts=20), seed=1)
+    assert reseeded.delay_seconds(job_id="job-7", attempt=3) != RetryPolicy(
+        budget=RetryBudget(max_attempts=20)
+    ).delay_seconds(job_id="job-7", attempt=3)
+    assert policy.delay_seconds(job_id="job-7", attempt=20) == 0.0  # no retry left to wait for
+
+
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_failed_job_waits_out_backoff_then_is_dead_lettered(backend, tmp_path):
+    policy = RetryPolicy(budget=RetryBudget(max_attempts=3), base_delay_seconds=2.0)
+    clock, store, queue = _runtime(backend, tmp_path / "store.db", retry=policy)
+    job_id = queue.submit_job(payload={})
+
+    for attempt in (1, 2):
+        lease = queue.lease(worker_id="W")
+        assert lease.job_id == job_id
+        queue.fail(lease)
+        delay = policy.delay_seconds(job_id=job_id, attempt=attempt)
+        assert store.jobs[job_id]["state"] == "PENDING"
+        clock.advance(delay - 0.01)
+        assert queue.lease(worker_id="W") is None
+        clock.advance(0.01)
+
+    last = queue.lease(worker_id="W")
+    assert store.executions[last.exec_id].attempt == 3
+    queue.fail(last)
+
+    assert store.jobs[job_id]["state"] == "FAILED"
+    clock.advance(3_600)
+    assert queue.lease(worker_id="W") is None
+    assert len(store.execs_by_job[job_id]) == 3
+    assert store.count_effects(job_id) == 0
+
+
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_expired_lease_is_retried_after_backoff_and_dead_lettered_on_exhaustion(backend, tmp_path):
+    policy = RetryPolicy(budget=RetryBudget(max_attempts=2), base_delay_seconds=4.0)
+    clock, store, queue = _runtime(backend, tmp_path / "store.db", retry=policy, lease_seconds=5)
+    slow, fast = queue.submit_jobs(payloads=[{}, {}])
+
+    first = queue.lease_many(worker_id="A", max_jobs=2)
+    store.apply_effect(exec_id=first[1].exec_id, enforce_idempotent_commit=True)
+    store.mark_finished(first[1].exec_id)
+
+    clock.advance(5.0)  # `slow` lease expired, but its retry is not due yet
+    assert queue.lease(worker_id="B") is None
+    assert store.can_lease(job_id=slow, now=clock.now()) is False
+    clock.advance(policy.delay_seconds(job_id=slow, attempt=1))
+    retry = queue.lease(worker_id="B")
+    assert retry.job_id == slow
+
+    clock.advance(5.0)  # second attempt expires too: budget of 2 is spent
+    assert queue.lease(worker_id="C") is None
+    assert store.jobs[slow]["state"] == "FAILED"
+    assert store.jobs[fast]["state"] == "SUCCEEDED"
+
+    # Reconcile aborts the dangling executions without re-opening the job.
+    assert reconcile_after_crash(store=store, clock=clock).aborted_exec_ids == [first[0].exec_id, retry.exec_id]
+    assert store.jobs[slow]["state"] == "FAILED"
+    assert queue.lease(worker_id="C") is None
+
+
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_retry_budget_contains_retry_storm_of_always_failing_job(backend, tmp_path):
+    """FM_003: without a policy a failing job is re-leased on every poll."""
+
+    def attempts_after_polls(retry: RetryPolicy | None) -> int:
+        name = "guarded.db" if retry is not None else "baseline.db"
+        clock, store, queue = _runtime(backend, tmp_path / name, retry=retry)
+        job_id = queue.submit_job(payload={})
+        for _ in range(200):
+            lease = queue.lease(worker_id="W")
+            if lease is not None:
+                queue.fail(lease)
+            clock.advance(0.1)
+        return len(store.execs_by_job[job_id])
+
+    assert attempts_after_polls(None) == 200
+    assert attempts_after_polls(RetryPolicy(budget=RetryBudget(max_attempts=5), base_delay_seconds=0.5)) == 5
+
+
+@pytest.mark.parametrize("backend", STORE_BACKENDS)
+def test_renewal_moves_the_retry_schedule_with_the_lease(backend, tmp_path):
+    policy = RetryPolicy(budget=RetryBudget(max_attempts=3), base_delay_seconds=1.0, jitter=0.0)
+    clock, store, queue = _runtime(backend, tmp_path / "store.db", retry=policy, lease_seconds=2)
+    job_id = queue.submit_job(payload={})
+    lease = queue.lease(worker_id="A")
+
+    clock.advance(1.0)
+    assert queue.renew(lease)  # now expires at t=3, retry due at t=4
+    clock.advance(2.5)
+    assert queue.lease(worker_id="B") is None
+    clock.advance(0.5)
+    assert queue.lease(worker_id="B").job_id == job_id
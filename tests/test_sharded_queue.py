@@ -0,0 +1,121 @@
+from collections import Counter
+
+import pytest
+
+from faults.injectors import Faults
+from policies.commit import commit_effect_idempotent
+from runtime.clock import Clock
+from runtime.process_pool import run_sharded_process_pool
+from runtime.sharded_queue import ShardedQueue, split_id
+from runtime.store import Store
+from runtime.worker import Worker
+
+
+def _sharded(shards: int, *, lease_seconds: int = 30, partition_key: str | None = None):
+    clock = Clock(start=0.0)
+    stores = [Store.in_memory(clock=clock) for _ in range(shards)]
+    return clock, ShardedQueue(stores=stores, clock=clock, lease_seconds=lease_seconds, partition_key=partition_key)
+
+
+def _spin(payload: dict) -> None:
+    """Module-level so worker processes can unpickle it."""
+    sum(range(payload["work"]))
+
+
+def test_partition_key_keeps_a_tenant_on_one_shard_in_fifo_order():
+    _, queue = _sharded(4, partition_key="tenant")
+    job_ids = queue.submit_jobs(payloads=[{"tenant": f"t{n % 8}", "n": n} for n in range(64)])
+
+    by_tenant: dict[str, set[int]] = {}
+    for job_id in job_ids:
+        payload = queue.store.jobs[job_id]["payload"]
+        by_tenant.setdefault(payload["tenant"], set()).add(split_id(job_id)[0])
+    assert all(len(shards) == 1 for shards in by_tenant.values())
+    assert len(set(job_ids)) == 64
+
+    shard = split_id(job_ids[0])[0]
+    queue.pin_worker("W", shard)
+    leased = [lease.job_id for lease in queue.lease_many(worker_id="W", max_jobs=64)]
+    assert leased[: len(leased) - queue.steals] == [job_id for job_id in job_ids if split_id(job_id)[0] == shard]
+
+
+def test_payloads_without_a_key_are_spread_round_robin():
+    _, queue = _sharded(3, partition_key="tenant")
+    job_ids = queue.submit_jobs(payloads=[{} for _ in range(9)])
+    assert Counter(split_id(job_id)[0] for job_id in job_ids) == {0: 3, 1: 3, 2: 3}
+
+
+def test_worker_leases_from_its_home_shard_before_stealing():
+    _, queue = _sharded(2)
+    queue.submit_jobs(payloads=[{} for _ in range(6)])
+    queue.pin_worker("A", 0)
+
+    home = queue.lease_many(worker_id="A", max_jobs=3)
+    assert {split_id(lease.job_id)[0] for lease in home} == {0}
+    assert queue.steals == 0
+
+    stolen = queue.lease_many(worker_id="A", max_jobs=3)
+    assert {split_id(lease.job_id)[0] for lease in stolen} == {1}
+    assert queue.steals == 3
+    assert queue.lease(worker_id="A") is None
+    with pytest.raises(ValueError):
+        queue.pin_worker("A", 2)
+
+
+def test_worker_and_commit_route_global_ids_to_the_owning_shard():
+    clock, queue = _sharded(3, lease_seconds=5)
+    job_ids = queue.submit_jobs(payloads=[{} for _ in range(3)])
+    faults = Faults(enforce_idempotent_commit=True)
+    worker_a = Worker(worker_id="A", store=queue.store, queue=queue, clock=clock, faults=faults)
+    worker_b = Worker(worker_id="B", store=queue.store, queue=queue, clock=clock, faults=faults)
+
+    # FM_001 in every shard: A's lease expires, B re-leases and commits first.
+    stale = queue.lease_many(worker_id="A", max_jobs=3)
+    for lease in stale:
+        worker_a.start(lease)
+    clock.advance(6.0)
+    fresh = queue.lease_many(worker_id="B", max_jobs=3)
+    for lease in fresh:
+        worker_b.start(lease)
+        worker_b.finish(lease)
+    for lease in stale:
+        result = commit_effect_idempotent(store=queue.store, exec_id=lease.exec_id)
+        assert not result.committed
+        assert result.committed_exec_id in {f.exec_id for f in fresh}
+
+    assert [queue.store.count_effects(job_id) for job_id in job_ids] == [1, 1, 1]
+    assert queue.store.executions[fresh[0].exec_id].status == "DONE"
+    assert len(queue.store.executions) == 6
+
+
+def test_heartbeats_renew_leases_per_shard():
+    clock, queue = _sharded(2, lease_seconds=5)
+    queue.submit_jobs(payloads=[{}, {}])
+    leases = queue.lease_many(worker_id="W", max_jobs=2)
+    clock.advance(4.0)
+    for lease in leases:
+        queue.heartbeat(lease)
+    assert queue.flush_heartbeats() == {lease.exec_id for lease in leases}
+    clock.advance(4.0)
+    assert queue.lease(worker_id="X") is None
+
+
+def test_sharded_process_pool_drains_every_shard_exactly_once(tmp_path):
+    paths = [str(tmp_path / f"shard-{n}.db") for n in range(3)]
+    stores = [Store.sqlite(path, clock=Clock(start=0.0)) for path in paths]
+    ShardedQueue(stores=stores, clock=stores[0].clock, lease_seconds=60).submit_jobs(
+        payloads=({"work": 2_000} for _ in range(240))
+    )
+    for store in stores:
+        store.close()
+
+    # Two processes over three shards: the third shard is only ever stolen.
+    stats = run_sharded_process_pool(paths=paths, handler=_spin, processes=2, lease_seconds=60, batch_size=4)
+
+    assert sum(s.committed for s in stats) == 240
+    assert sum(s.duplicates + s.failed for s in stats) == 0
+    for path in paths:
+        store = Store.sqlite(path, clock=Clock(start=0.0))
+        assert Counter(len(exec_ids) for exec_ids in store.execs_by_job.values()) == {1: 80}
+        assert all(store.count_effects(job_id) == 1 for job_id in store.job_order)
+        store.close()
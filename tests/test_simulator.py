@@ -0,0 +1,58 @@
+from dataclasses import replace
+
+import pytest
+
+from harness.simulator import SimulationConfig, simulate
+
+FAULTY = SimulationConfig(
+    jobs=3_000,
+    workers=50,
+    seed=11,
+    crash_before_commit_rate=0.05,
+    crash_after_commit_rate=0.05,
+)
+
+
+@pytest.mark.parametrize("backend", ["memory", "compact"])
+def test_guarded_run_under_crashes_preserves_every_invariant(backend):
+    report = simulate(replace(FAULTY, backend=backend))
+
+    assert report.ok, report.violations
+    assert report.completed == report.jobs == 3_000
+    assert report.executions > report.jobs  # crashed attempts were retried
+    assert report.duplicate_ratio == pytest.approx(report.executions / report.jobs - 1)
+
+
+def test_same_seed_replays_the_same_run_and_a_new_seed_does_not():
+    first, again, other = (simulate(replace(FAULTY, seed=seed)) for seed in (11, 11, 12))
+    assert replace(first, wall_seconds=0.0) == replace(again, wall_seconds=0.0)
+    assert (first.executions, first.virtual_seconds) != (other.executions, other.virtual_seconds)
+
+
+def test_slow_attempts_duplicate_effects_only_without_the_commit_boundary():
+    """FM_001 at scale: stalled attempts overlap their retries (INV_001)."""
+    slow = replace(FAULTY, crash_before_commit_rate=0.0, crash_after_commit_rate=0.0, slow_rate=0.05)
+
+    broken = simulate(replace(slow, enforce_idempotent_commit=False))
+    assert broken.violations["INV_001"] > 0
+    assert 0 < broken.violations["INV_004"] <= broken.violations["INV_001"]  # some jobs ran 3 times
+
+    guarded = simulate(slow)
+    assert guarded.violations["INV_001"] == guarded.violations["INV_004"] == 0
+    assert guarded.duplicate_ratio == broken.duplicate_ratio > 0
+
+
+def test_reconcile_that_falls_behind_is_reported_as_late_detection():
+    """INV_005: a reconciler capped below the crash rate lets expired leases wait."""
+    crashes = replace(FAULTY, crash_before_commit_rate=0.5, crash_after_commit_rate=0.0)
+    assert simulate(crashes).violations["INV_005"] == 0
+    assert simulate(replace(crashes, reconcile_batch=1)).violations["INV_005"] > 0
+
+
+def test_lease_latency_tracks_backlog_per_worker():
+    few = simulate(SimulationConfig(jobs=2_000, workers=10))
+    many = simulate(SimulationConfig(jobs=2_000, workers=100))
+
+    assert few.lease_latency_max > many.lease_latency_max
+    assert few.throughput < many.throughput
+    assert few.lease_latency_p50 <= few.lease_latency_p99 <= few.lease_latency_max
@@ -0,0 +1,68 @@
+import random
+
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def test_sqlite_store_matches_in_memory_store_under_random_schedule(tmp_path):
+    """Same operations against both backends must produce identical leases, states and effects."""
+    rng = random.Random(7)
+    clock = Clock(start=0.0)
+    memory = Store.in_memory(clock=clock)
+    durable = Store.sqlite(str(tmp_path / "store.db"), clock=clock)
+    queues = [Queue(store=store, clock=clock, lease_seconds=2) for store in (memory, durable)]
+    leases: list = []
+
+    for _ in range(400):
+        op = rng.random()
+        if op < 0.2:
+            payloads = [{"n": rng.random()}, {"n": rng.random()}]
+            ids = [queue.submit_jobs(payloads=payloads) for queue in queues]
+            assert list(ids[0]) == list(ids[1])
+        elif op < 0.5:
+            batch = [queue.lease_many(worker_id="W", max_jobs=3) for queue in queues]
+            assert batch[0] == batch[1]
+            leases.extend(batch[0])
+        elif op < 0.75 and leases:
+            lease = leases.pop(rng.randrange(len(leases)))
+            enforce = rng.random() < 0.7
+            outcomes = [
+                store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=enforce)
+                for store in (memory, durable)
+            ]
+            assert outcomes[0] == outcomes[1]
+            if rng.random() < 0.8:
+                memory.mark_finished(lease.exec_id)
+                durable.mark_finished(lease.exec_id)
+        else:
+            clock.advance(1.0)
+
+    assert dict(durable.jobs) == memory.jobs
+    assert dict(durable.executions) == memory.executions
+    assert durable.effects == list(memory.effects)
+    for job_id in memory.job_order:
+        assert durable.count_effects(job_id) == memory.count_effects(job_id)
+        assert durable.get_committed_exec_id(job_id) == memory.get_committed_exec_id(job_id)
+        assert durable.can_lease(job_id=job_id, now=clock.now()) == memory.can_lease(
+            job_id=job_id, now=clock.now()
+        )
+
+
+def test_sqlite_store_state_survives_reopen(tmp_path):
+    path = str(tmp_path / "store.db")
+    clock = Clock(start=0.0)
+    store = Store.sqlite(path, clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=5)
+
+    job_id = queue.submit_job(payload={"kind": "durable"})
+    lease = queue.lease(worker_id="W1")
+    store.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True)
+    store.close()
+
+    reopened = Store.sqlite(path, clock=clock)
+    assert reopened.jobs[job_id] == {"job_id": job_id, "payload": {"kind": "durable"}, "state": "RUNNING"}
+    assert reopened.executions[lease.exec_id].status == "COMMITTED"
+    assert reopened.get_committed_exec_id(job_id) == lease.exec_id
+    assert reopened.apply_effect(exec_id=lease.exec_id, enforce_idempotent_commit=True) is False
+    assert reopened.create_job(payload={}) == "job-2"
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from policies.commit import commit_effect_idempotent
+from policies.reconcile import reconcile_after_crash
+from runtime.clock import Clock
+from runtime.queue import Queue
+from runtime.store import Store
+
+
+def _state(store: Store) -> tuple:
+    return (
+        store.jobs,
+        store.job_order,
+        {exec_id: (e.status, e.lease_expires_at) for exec_id, e in store.executions.items()},
+        {job_id: store.count_effects(job_id) for job_id in store.jobs},
+    )
+
+
+def _segments(directory) -> list[str]:
+    return sorted(name for name in os.listdir(directory) if name.startswith("wal-"))
+
+
+def test_reopen_replays_snapshot_and_tail_to_the_same_state(tmp_path):
+    clock = Clock(start=0.0)
+    store = Store.wal(str(tmp_path), clock=clock, snapshot_every=7)
+    queue = Queue(store=store, clock=clock, lease_seconds=5)
+    queue.submit_jobs(payloads=({"n": n} for n in range(10)))
+    for lease in queue.lease_many(worker_id="W", max_jobs=6):
+        store.mark_started(lease.exec_id)
+        commit_effect_idempotent(store=store, exec_id=lease.exec_id)
+        store.mark_finished(lease.exec_id)
+    store.flush()
+
+    # Several snapshots were taken; only the segment after the last one remains.
+    assert os.path.exists(tmp_path / "snapshot.bin")
+    assert len(_segments(tmp_path)) == 1
+
+    recovered = Store.wal(str(tmp_path), clock=clock)
+    assert _state(recovered) == _state(store)
+
+    # The recovered store keeps leasing where the old one stopped.
+    clock.advance(5.0)
+    reopened_queue = Queue(store=recovered, clock=clock, lease_seconds=5)
+    assert [lease.job_id for lease in reopened_queue.lease_many(worker_id="W", max_jobs=10)] == [
+        f"job-{n}" for n in range(7, 11)
+    ]
+    assert recovered.create_job(payload={}) == "job-11"
+
+
+def test_unflushed_and_torn_records_are_dropped_on_restart(tmp_path):
+    clock = Clock(start=0.0)
+    store = Store.wal(str(tmp_path), clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+    job_id = queue.submit_job(payload={})
+    lease = queue.lease(worker_id="A")
+    store.flush()
+    (segment,) = _segments(tmp_path)
+    durable = os.path.getsize(tmp_path / segment)
+
+    store.mark_started(lease.exec_id)
+    store.flush()
+    # Simulate a kill half-way through writing the last record.
+    os.truncate(tmp_path / segment, os.path.getsize(tmp_path / segment) - 3)
+
+    clock.advance(1.0)
+    recovered = Store.wal(str(tmp_path), clock=clock)
+    assert os.path.getsize(tmp_path / segment) == durable
+    assert recovered.executions[lease.exec_id].status == "LEASED"
+
+    assert reconcile_after_crash(store=recovered, clock=clock).aborted_exec_ids == [lease.exec_id]
+    retry = Queue(store=recovered, clock=clock, lease_seconds=1).lease(worker_id="B")
+    assert retry is not None and retry.job_id == job_id
+
+    # Records appended after the truncated tail replay cleanly.
+    recovered.close()
+    again = Store.wal(str(tmp_path), clock=clock)
+    assert again.executions[retry.exec_id].status == "LEASED"
+    assert again.executions[lease.exec_id].status == "ABORTED"
+
+
+def test_failed_transitions_are_not_logged(tmp_path):
+    clock = Clock(start=0.0)
+    store = Store.wal(str(tmp_path), clock=clock)
+    queue = Queue(store=store, clock=clock, lease_seconds=1)
+    queue.submit_job(payload={})
+    with pytest.raises(KeyError):
+        store.mark_started("exec-missing")
+    store.close()
+
+    recovered = Store.wal(str(tmp_path), clock=clock)
+    assert list(recovered.jobs) == ["job-1"]